@@ -20,6 +20,37 @@ def register_commands(app):
         """
         database.reset(app)
 
+    @app.cli.command(name="migrate-db")
+    def migrate_db():
+        """
+        Migrate the database.
+
+        This command upgrades the schema of an existing database in place,
+        applying the migrations it is missing.
+        """
+        from src.core.migrations import upgrade
+        if not upgrade(app):
+            print("The database is up to date.")
+
+    @app.cli.command(name="rebuild-reports")
+    def rebuild_reports():
+        """
+        Rebuild the report rollups.
+
+        This command recomputes the rollup tables of the reports from the
+        jockeys, amazons and charges, and tells how many rows were out of date.
+        The running servers show the rebuilt reports once the results they
+        cached expire, after REPORT_CACHE_TTL seconds at most.
+        """
+        from src.core.module.report.rollups import rebuild
+        with app.app_context():
+            stale = rebuild(database.db.session)
+            database.db.session.commit()
+            ttl = app.config["REPORT_CACHE_TTL"]
+        print(f"Report rollups rebuilt, {stale} rows were out of date.")
+        if stale and ttl:
+            print(f"Running servers will show the rebuilt reports within {ttl} seconds.")
+
     @app.cli.command(name="seed-db")
     def seed_db():
         """
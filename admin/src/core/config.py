@@ -15,13 +15,49 @@ class Config(object):
         TESTING: bool
         DEBUG: bool
         SESSION_TYPE: str
-        SEED_ON_STARTUP: bool
+        STARTUP_MODE: str
+        ADMIN_EMAIL: str
+        ADMIN_PASSWORD: str
+        PERMISSIONS_SNAPSHOT_TTL: int
+        STORAGE_BACKEND: str
+        STORAGE_LOCAL_ROOT: str
+        STORAGE_UPLOAD_WORKERS: int
+        STORAGE_MULTIPART_THRESHOLD: int
+        STORAGE_PART_SIZE: int
+        PROFILE_IMAGE_MAX_AGE: int
+        COUNT_CACHE_TTL: int
+        COUNT_ESTIMATE_THRESHOLD: int
+        REPORT_CACHE_TTL: int
     """
     SECRET_KEY = os.environ.get("FLASK_SECRET_KEY") or secrets.token_hex(20)
     TESTING = False
     DEBUG = False
     SESSION_TYPE = "filesystem"
-    SEED_ON_STARTUP = False
+    # How create_app prepares the database: "reset", "upgrade" or None to leave it as it is
+    STARTUP_MODE = os.environ.get("STARTUP_MODE")
+    # System administrator created by the "upgrade" startup mode on a database without users
+    ADMIN_EMAIL = os.environ.get("ADMIN_EMAIL")
+    ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD")
+    # Seconds a permission snapshot in the session is trusted without querying the database. Revoked
+    # permissions and disabled users keep working in the sessions already open for up to this long
+    PERMISSIONS_SNAPSHOT_TTL = 60
+    # "minio" for object storage or "local" to keep the files in STORAGE_LOCAL_ROOT
+    STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "minio")
+    # Defaults to the "storage" directory of the instance folder
+    STORAGE_LOCAL_ROOT = os.environ.get("STORAGE_LOCAL_ROOT")
+    # Maximum number of files uploaded concurrently by StorageServices.upload_batch
+    STORAGE_UPLOAD_WORKERS = int(os.environ.get("STORAGE_UPLOAD_WORKERS", 4))
+    # Files of at least this many bytes are uploaded in parts of STORAGE_PART_SIZE bytes (minimum 5 MiB)
+    STORAGE_MULTIPART_THRESHOLD = int(os.environ.get("STORAGE_MULTIPART_THRESHOLD", 32 * 1024 * 1024))
+    STORAGE_PART_SIZE = int(os.environ.get("STORAGE_PART_SIZE", 8 * 1024 * 1024))
+    # Seconds browsers may reuse a profile photo before revalidating it with its ETag
+    PROFILE_IMAGE_MAX_AGE = 3600
+    # Seconds the total of a paginated list is reused when it is counted with COUNT_CACHED
+    COUNT_CACHE_TTL = 30
+    # Lists estimated with COUNT_ESTIMATED below this many rows are counted exactly
+    COUNT_ESTIMATE_THRESHOLD = 10000
+    # Seconds the results of the reports are reused, 0 to always compute them
+    REPORT_CACHE_TTL = int(os.environ.get("REPORT_CACHE_TTL", 300))
     CKEDITOR_PKG_TYPE = "basic"
     CORS_ORIGINS = ["http://localhost*"]
 
@@ -39,7 +75,7 @@ class ProductionConfig(Config):
         MINIO_SECURE: bool
         SQLALCHEMY_DATABASE_URI: str
         SQLALCHEMY_ENGINE_OPTIONS: Dict
-        SEED_ON_STARTUP: bool
+        STARTUP_MODE: str
     """
 
     MINIO_SERVER = environ.get("MINIO_SERVER")
@@ -52,7 +88,7 @@ class ProductionConfig(Config):
         "pool_recycle": 60,
         "pool_pre_ping": True,
     }
-    SEED_ON_STARTUP = True
+    STARTUP_MODE = os.environ.get("STARTUP_MODE", "upgrade")
     CORS_ORIGINS = (Config.CORS_ORIGINS
                     + ["https://admin-grupo19.proyecto2024.linti.unlp.edu.ar*"]
                     + ["https://grupo19.proyecto2024.linti.unlp.edu.ar*"])
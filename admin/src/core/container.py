@@ -1,16 +1,28 @@
 # pylint: disable=I1101
 from dependency_injector import containers, providers
+from flask import current_app
 from .module.auth import AuthRepository, AuthServices
 from .module.user import UserRepository
 from .module.employee import EmployeeRepository
 from .module.payment import PaymentRepository
 
 from .module.equestrian import EquestrianRepository
-from .module.common import StorageServices
+from .module.common import StorageServices, LocalStorageServices
 from .module.jockey_amazon import JockeyAmazonRepository
 from .module.charges import ChargeRepository
 from .module.publication import PublicationRepository
 from .module.contact import ContactRepository
+from .module.report import ReportRepository
+
+
+def storage_backend() -> str:
+    """
+    Name of the storage backend selected by the STORAGE_BACKEND setting.
+
+    Returns:
+        str: "minio" or "local".
+    """
+    return current_app.config.get("STORAGE_BACKEND", "minio")
 
 
 class Container(containers.DeclarativeContainer):
@@ -23,7 +35,11 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
 
     # Services
-    storage_services = providers.Factory(StorageServices)
+    storage_services = providers.Selector(
+        storage_backend,
+        minio=providers.Factory(StorageServices),
+        local=providers.Factory(LocalStorageServices),
+    )
 
     # TODO: Initialize the db in the container so it can be injected into the repository
     user_repository = providers.Factory(UserRepository)
@@ -35,8 +51,7 @@ class Container(containers.DeclarativeContainer):
     charges_repository = providers.Factory(ChargeRepository)
     publication_repository = providers.Factory(PublicationRepository)
     contact_repository = providers.Factory(ContactRepository)
-    # Services
-    storage_services = providers.Factory(StorageServices)
+    report_repository = providers.Factory(ReportRepository)
 
     auth_services = providers.Factory(
         AuthServices, auth_repository=auth_repository, user_repository=user_repository
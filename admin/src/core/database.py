@@ -52,19 +52,13 @@ def configure_hooks(app):
     return app
 
 
-def reset(app):
+def import_models():
     """
-        Resets the database by dropping and recreating all tables.
-
-        This function drops all existing tables in the database and recreates them.
-        It should be called within the app context to ensure proper table creation.
-        Models that want to be included in the schema should be imported here
+    Imports every model so its table is part of the metadata.
 
-        Args:
-            app (Flask): The Flask application instance.
-        """
+    Models that want to be included in the schema should be imported here.
+    """
     # Necessary to create the tables with create_all
-    # It should have the app context
     # pylint: disable=C0415,W0611
     from .module.equestrian.models import Horse
     from .module.user.models import User, ProfilePhoto
@@ -73,9 +67,30 @@ def reset(app):
     from .module.payment.models import Payment
     from .module.jockey_amazon.models import JockeyAmazon, FamilyMember, WorkAssignment, SchoolInstitution
     from .module.contact.models import Message
+    from .module.charges.models import Charge
+    from .module.publication.models import Publication
+    from .module.report.models import ReportCounter, MonthlyIncome
 
+
+def reset(app):
+    """
+        Resets the database by dropping and recreating all tables.
+
+        This function drops all existing tables in the database and recreates them,
+        then replays the migrations to record the version of the new schema.
+        It should be called within the app context to ensure proper table creation.
+
+        Args:
+            app (Flask): The Flask application instance.
+        """
+    # pylint: disable=C0415
+    from .migrations import upgrade
+
+    import_models()
+    # It should have the app context
     with app.app_context():
         db.drop_all()
         print("Recreating the database... ")
         db.create_all()
-        print("Done!")
+    upgrade(app)
+    print("Done!")
@@ -0,0 +1,247 @@
+"""
+Versioned migrations of the database schema.
+
+Each migration upgrades the schema of the previous version in place and is
+recorded in the schema_version table in the same transaction, so `upgrade`
+only runs the migrations a database is missing. Migrations are written to
+be idempotent (IF NOT EXISTS), which lets `database.reset` replay all of
+them over a schema just built by create_all to record its version.
+
+Adding a migration:
+    Write a function that takes the connection and decorate it with
+    `@migration(<next version>, "<description>")`. Never change a migration
+    that was already released, add a new one instead.
+"""
+
+from datetime import datetime
+from typing import Callable, List
+from sqlalchemy import Column, DateTime, Integer, String, func, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn, CreateIndex
+from src.core.database import db, import_models
+
+schema_version = db.Table(
+    "schema_version",
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=datetime.now),
+)
+
+
+class Migration:
+    """
+    A versioned change of the database schema.
+
+    Attributes:
+        version (int): The version of the schema after the migration.
+        description (str): What the migration changes.
+        upgrade (Callable[[Connection], None]): Applies the migration on a connection.
+    """
+
+    def __init__(self, version: int, description: str, upgrade: Callable[[Connection], None]):
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str):
+    """
+    Registers a function as the migration to a schema version.
+
+    Args:
+        version (int): The version of the schema after the migration.
+        description (str): What the migration changes.
+
+    Returns:
+        The decorator.
+    """
+    def register(upgrade: Callable[[Connection], None]):
+        MIGRATIONS.append(Migration(version, description, upgrade))
+        MIGRATIONS.sort(key=lambda registered: registered.version)
+        return upgrade
+
+    return register
+
+
+def head() -> int:
+    """
+    Get the latest version of the schema.
+
+    Returns:
+        int: The version of the last migration.
+    """
+    return MIGRATIONS[-1].version
+
+
+def current_version(connection: Connection) -> int:
+    """
+    Get the version of the schema of a database.
+
+    Args:
+        connection (Connection): The connection to the database.
+
+    Returns:
+        int: The version of the last applied migration, 0 if none was applied.
+    """
+    if not inspect(connection).has_table(schema_version.name):
+        return 0
+    version = connection.execute(select(func.max(schema_version.c.version))).scalar()
+    return version or 0
+
+
+def upgrade(app) -> List[Migration]:
+    """
+    Upgrades the database of the application to the latest version.
+
+    Every pending migration runs in its own transaction, together with the
+    row that records it, so a failure leaves the database at the last
+    version that was fully applied.
+
+    Args:
+        app (Flask): The Flask application instance.
+
+    Returns:
+        List[Migration]: The migrations applied.
+    """
+    import_models()
+    applied = []
+    with app.app_context():
+        with db.engine.begin() as connection:
+            schema_version.create(connection, checkfirst=True)
+            version = current_version(connection)
+
+        for pending in (registered for registered in MIGRATIONS if registered.version > version):
+            with db.engine.begin() as connection:
+                pending.upgrade(connection)
+                connection.execute(
+                    schema_version.insert().values(
+                        version=pending.version, description=pending.description, applied_at=datetime.now()
+                    )
+                )
+            print(f"Applied migration {pending.version}: {pending.description}")
+            applied.append(pending)
+    return applied
+
+
+@migration(1, "Initial schema")
+def create_tables(connection: Connection):
+    """Creates the tables of the models that do not exist yet."""
+    db.metadata.create_all(connection)
+
+
+@migration(2, "Columns and indexes declared by the models after their tables were created")
+def add_model_columns_and_indexes(connection: Connection):
+    """
+    Adds the search vectors, filter and trigram indexes declared by the
+    models to tables created by an older version of the schema.
+
+    Only columns that can be added to a table with rows are added: nullable
+    ones, generated ones and the ones with a server default, such as the
+    permission version stamps of users and roles.
+    """
+    inspector = inspect(connection)
+    for table in db.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            addable = column.nullable or column.computed is not None or column.server_default is not None
+            if column.name in existing or not addable:
+                continue
+            definition = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {definition}"))
+
+        for index in table.indexes:
+            connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+@migration(3, "Composite and partial indexes of the repository queries")
+def add_performance_indexes(connection: Connection):
+    """
+    Creates the indexes of the filters and orderings used by the repositories.
+
+    Lists only show rows that are not archived or deleted, so most indexes
+    are partial over those rows: they are smaller than the table and serve
+    the default ordering of each list without a sort. Foreign keys are
+    indexed as PostgreSQL does not do it by itself.
+    """
+    statements = [
+        # Lists of jockeys and amazons, newest first, and the debtors filter
+        "CREATE INDEX IF NOT EXISTS ix_jockeys_amazons_active_inserted_at "
+        "ON jockeys_amazons (inserted_at) WHERE is_deleted = false",
+        "CREATE INDEX IF NOT EXISTS ix_jockeys_amazons_is_deleted_has_debts "
+        "ON jockeys_amazons (is_deleted, has_debts)",
+        # Employees by position, for the lists and the assignment pickers
+        "CREATE INDEX IF NOT EXISTS ix_employees_is_deleted_position ON employees (is_deleted, position)",
+        "CREATE INDEX IF NOT EXISTS ix_employees_active_position "
+        "ON employees (position) WHERE is_deleted = false AND is_active = true",
+        "CREATE INDEX IF NOT EXISTS ix_employees_user_id ON employees (user_id)",
+        # Horses by type
+        "CREATE INDEX IF NOT EXISTS ix_horses_is_archived_ja_type ON horses (is_archived, ja_type)",
+        "CREATE INDEX IF NOT EXISTS ix_horse_trainers_id_horse ON horse_trainers (id_horse)",
+        "CREATE INDEX IF NOT EXISTS ix_horse_trainers_id_employee ON horse_trainers (id_employee)",
+        # Charges by date and the charges of a jockey or an employee
+        "CREATE INDEX IF NOT EXISTS ix_charges_active_date_of_charge "
+        "ON charges (date_of_charge) WHERE is_archived = false",
+        "CREATE INDEX IF NOT EXISTS ix_charges_jya_id ON charges (jya_id)",
+        "CREATE INDEX IF NOT EXISTS ix_charges_employee_id ON charges (employee_id)",
+        # Payments by date and the payments of an employee
+        "CREATE INDEX IF NOT EXISTS ix_payments_active_payment_date "
+        "ON payments (payment_date) WHERE is_archived = false",
+        "CREATE INDEX IF NOT EXISTS ix_payments_beneficiary_id ON payments (beneficiary_id)",
+        # Published articles of the API, newest first
+        "CREATE INDEX IF NOT EXISTS ix_publications_active_status_publish_date "
+        "ON publications (status, publish_date) WHERE is_deleted = false",
+        "CREATE INDEX IF NOT EXISTS ix_publications_author_id ON publications (author_id)",
+        # Contact messages, newest first, by status
+        "CREATE INDEX IF NOT EXISTS ix_messages_active_inserted_at "
+        "ON messages (inserted_at) WHERE is_deleted = false",
+        "CREATE INDEX IF NOT EXISTS ix_messages_active_status_inserted_at "
+        "ON messages (status, inserted_at) WHERE is_deleted = false",
+        # Users by role
+        "CREATE INDEX IF NOT EXISTS ix_users_role_id ON users (role_id)",
+        # Documents of each owner, all stored in the files table
+        "CREATE INDEX IF NOT EXISTS ix_files_owner_type ON files (owner_type)",
+        "CREATE INDEX IF NOT EXISTS ix_files_employee_id ON files (employee_id) WHERE employee_id IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS ix_files_horse_id ON files (horse_id) WHERE horse_id IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS ix_files_jockey_amazon_id "
+        "ON files (jockey_amazon_id) WHERE jockey_amazon_id IS NOT NULL",
+        # Related records of a jockey or amazon
+        "CREATE INDEX IF NOT EXISTS ix_family_members_jockey_amazon_id ON family_members (jockey_amazon_id)",
+        "CREATE INDEX IF NOT EXISTS ix_school_institutions_jockey_amazon_id "
+        "ON school_institutions (jockey_amazon_id)",
+        "CREATE INDEX IF NOT EXISTS ix_work_assignments_jockey_amazon_id ON work_assignments (jockey_amazon_id)",
+        "CREATE INDEX IF NOT EXISTS ix_work_assignments_horse_id ON work_assignments (horse_id)",
+    ]
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+@migration(4, "Rollup tables of the reports")
+def add_report_rollups(connection: Connection):
+    """Creates the rollup tables of the reports and fills them from the existing rows."""
+    # pylint: disable=C0415
+    from src.core.module.report.models import MonthlyIncome, ReportCounter
+    from src.core.module.report.rollups import rebuild
+
+    ReportCounter.__table__.create(connection, checkfirst=True)
+    MonthlyIncome.__table__.create(connection, checkfirst=True)
+    rebuild(connection, ReportCounter, MonthlyIncome)
+
+
+@migration(5, "Income series of the reports")
+def add_income_series(connection: Connection):
+    """Creates the income series of the reports and fills it from the existing charges."""
+    # pylint: disable=C0415
+    from src.core.module.report.models import IncomeSeries
+    from src.core.module.report.rollups import rebuild
+
+    IncomeSeries.__table__.create(connection, checkfirst=True)
+    rebuild(connection, IncomeSeries)
+
+
+@migration(6, "Original names of the uploaded documents")
+def add_file_names(connection: Connection):
+    """Adds the name of the uploaded file to the files, empty for the existing ones."""
+    connection.execute(text("ALTER TABLE files ADD COLUMN IF NOT EXISTS filename VARCHAR(255)"))
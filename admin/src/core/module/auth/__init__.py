@@ -14,12 +14,15 @@ Exposed Components:
     - UserRegisterForm: The form for user registration.
     - RoleEnum: The enumeration for user roles.
     - PermissionEnum: The enumeration for user permissions.
+    - RolePermissionCache: The in-process cache of permissions per role.
+    - role_permission_cache: The shared RolePermissionCache instance.
 """
 
 from .repositories import AbstractAuthRepository, AuthRepository
 from .services import AbstractAuthServices, AuthServices
 from .forms import UserLoginForm, UserRegisterForm
 from .data import RoleEnum, PermissionEnum
+from .cache import RolePermissionCache, role_permission_cache
 
 __all__ = [
     "AbstractAuthRepository",
@@ -29,5 +32,7 @@ __all__ = [
     "UserLoginForm",
     "UserRegisterForm",
     "RoleEnum",
-    "PermissionEnum"
+    "PermissionEnum",
+    "RolePermissionCache",
+    "role_permission_cache",
 ]
\ No newline at end of file
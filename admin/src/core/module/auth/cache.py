@@ -0,0 +1,139 @@
+from threading import Lock
+from typing import Dict, FrozenSet, Tuple
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session, object_session
+from .models import Role, Permission, RolePermission
+
+# Key of the session info flag set when a role, permission or role-permission association is written
+PERMISSIONS_CHANGED = "role_permissions_changed"
+
+
+class RolePermissionCache:
+    """
+    In-process cache of the permission names granted to each role.
+
+    Roles and permissions change very rarely compared to how often they are
+    read (every protected request), so the sets are kept in memory. Each set
+    is stored with the permission version stamp of its role and only served
+    for that stamp, which every change of the permissions of the role
+    increases, so a change committed by any process is seen on the next
+    read. The whole cache is also dropped after a transaction that wrote a
+    role, permission or role-permission association commits, for the
+    changes that do not increase a stamp, such as renaming a permission.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty RolePermissionCache.
+        """
+        self.__lock = Lock()
+        self.__permissions: Dict[int, Tuple[int | None, FrozenSet[str]]] = {}
+
+    def get(self, role_id: int, version: int | None) -> FrozenSet[str] | None:
+        """
+        Retrieve the cached permission names of a role.
+
+        Args:
+            role_id (int): The ID of the role.
+            version (int | None): The current permission version stamp of the role.
+
+        Returns:
+            FrozenSet[str] | None: The permission names, or None if the role is not cached
+                for that stamp.
+        """
+        entry = self.__permissions.get(role_id)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def set(self, role_id: int, version: int | None, permissions) -> FrozenSet[str]:
+        """
+        Store the permission names of a role, replacing the ones of other stamps.
+
+        Args:
+            role_id (int): The ID of the role.
+            version (int | None): The permission version stamp read with the permissions.
+            permissions (Iterable[str]): The permission names granted to the role.
+
+        Returns:
+            FrozenSet[str]: The stored permission names.
+        """
+        permissions = frozenset(permissions)
+        with self.__lock:
+            self.__permissions[role_id] = (version, permissions)
+        return permissions
+
+    def is_empty(self) -> bool:
+        """
+        Check if no role is cached.
+
+        Returns:
+            bool: True if the cache holds no role, False otherwise.
+        """
+        return not self.__permissions
+
+    def invalidate(self, *args, **kwargs) -> None:
+        """
+        Drop every cached role.
+
+        Accepts and ignores any argument so it can be used directly as a
+        SQLAlchemy event listener.
+        """
+        with self.__lock:
+            self.__permissions = {}
+
+
+role_permission_cache = RolePermissionCache()
+
+
+def mark_permissions_changed(mapper, connection, target) -> None:
+    """
+    Flag the session of a written role, permission or role-permission association.
+
+    Registered as a SQLAlchemy event listener on their inserts, updates and deletes.
+    """
+    session = object_session(target)
+    if session is not None:
+        session.info[PERMISSIONS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_changed_permissions(session: Session) -> None:
+    """
+    Drop the role permission cache once a transaction that changed permissions is committed.
+
+    Dropping it at flush time would let a concurrent request cache the
+    permissions that are still committed until this transaction ends.
+    """
+    if session.info.pop(PERMISSIONS_CHANGED, False):
+        role_permission_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def forget_changed_permissions(session: Session) -> None:
+    """
+    Clear the flag of a transaction whose changes of the permissions were rolled back.
+    """
+    session.info.pop(PERMISSIONS_CHANGED, None)
+
+
+for model in (Role, Permission, RolePermission):
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, identifier, mark_permissions_changed)
+
+
+def bump_role_version(mapper, connection, target: RolePermission) -> None:
+    """
+    Increase the permission version stamp of the role whose permissions changed.
+
+    Registered as a SQLAlchemy event listener on RolePermission inserts and deletes.
+    """
+    connection.execute(
+        update(Role.__table__)
+        .where(Role.__table__.c.id == target.role_id)
+        .values(permissions_version=Role.__table__.c.permissions_version + 1)
+    )
+
+
+for identifier in ("after_insert", "after_delete"):
+    event.listen(RolePermission, identifier, bump_role_version)
@@ -8,12 +8,14 @@ class Role(db.Model):
     Attributes:
         id (int): The unique identifier for the role.
         name (str): The name of the role.
+        permissions_version (int): Stamp increased every time the permissions of the role change.
     """
 
     __tablename__ = 'roles'
 
     id = db.Column(db.BigInteger, primary_key=True)
     name = db.Column(db.Text, nullable=False)
+    permissions_version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
 
 class Permission(db.Model):
@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from typing import List, Dict
 from src.core.database import db as database
+from src.core.module.user.models import User
 from .models import Role, RolePermission, Permission
 
 
@@ -48,6 +49,49 @@ class AbstractAuthRepository:
         """
         pass
 
+    @abstractmethod
+    def get_permission_names_of_role(self, role_id: int) -> List[str]:
+        """
+        Retrieve the names of the permissions associated with a role.
+
+        Args:
+            role_id (int): The ID of the role whose permissions are to be retrieved.
+
+        Returns:
+            List[str]: The names of the permissions associated with the specified role.
+        """
+        pass
+
+    @abstractmethod
+    def get_permission_versions(self, user_id: int) -> Dict | None:
+        """
+        Retrieve the permission version stamps of a user and its role.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Dict | None: The keys "role_id", "user_version" and "role_version",
+                or None if the user does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def get_user_access(self, user_id: int, include_permissions: bool = True) -> Dict | None:
+        """
+        Retrieve the access data of a user in a single query.
+
+        Args:
+            user_id (int): The ID of the user.
+            include_permissions (bool): Whether to join the permissions of the user's role.
+
+        Returns:
+            Dict | None: The keys "system_admin", "enabled", "role_id", "user_version",
+                "role_version" and, if requested, "permissions" (a list of permission names),
+                or None if the user does not exist.
+        """
+        pass
+
 
 class AuthRepository(AbstractAuthRepository):
     """
@@ -104,4 +148,108 @@ class AuthRepository(AbstractAuthRepository):
         """
         permission_ids = RolePermission.query.filter(RolePermission.role_id == role_id).all()
         return (Permission.query.
-                filter(Permission.id.in_([p.permission_id for p in permission_ids])).all())
\ No newline at end of file
+                filter(Permission.id.in_([p.permission_id for p in permission_ids])).all())
+
+    def get_permission_names_of_role(self, role_id: int) -> List[str]:
+        """
+        Retrieve the names of the permissions associated with a role.
+
+        Args:
+            role_id (int): The ID of the role whose permissions are to be retrieved.
+
+        Returns:
+            List[str]: The names of the permissions associated with the specified role.
+        """
+        rows = (
+            self.db.session.query(Permission.name)
+            .join(RolePermission, RolePermission.permission_id == Permission.id)
+            .filter(RolePermission.role_id == role_id)
+            .all()
+        )
+        return [row.name for row in rows]
+
+    def get_permission_versions(self, user_id: int) -> Dict | None:
+        """
+        Retrieve the permission version stamps of a user and its role.
+
+        Both rows are read by primary key in a single query.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Dict | None: The keys "role_id", "user_version" and "role_version",
+                or None if the user does not exist.
+        """
+        if not user_id:
+            return None
+
+        row = (
+            self.db.session.query(
+                User.role_id,
+                User.permissions_version.label("user_version"),
+                Role.permissions_version.label("role_version"),
+            )
+            .outerjoin(Role, Role.id == User.role_id)
+            .filter(User.id == user_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return {"role_id": row.role_id, "user_version": row.user_version, "role_version": row.role_version}
+
+    def get_user_access(self, user_id: int, include_permissions: bool = True) -> Dict | None:
+        """
+        Retrieve the access data of a user in a single query.
+
+        When the permissions are requested, the user's role permissions are
+        outer joined so the query returns one row per permission (or a single
+        row with a null name if the role has none).
+
+        Args:
+            user_id (int): The ID of the user.
+            include_permissions (bool): Whether to join the permissions of the user's role.
+
+        Returns:
+            Dict | None: The keys "system_admin", "enabled", "role_id", "user_version",
+                "role_version" and, if requested, "permissions" (a list of permission names),
+                or None if the user does not exist.
+        """
+        if not user_id:
+            return None
+
+        columns = [
+            User.system_admin,
+            User.enabled,
+            User.role_id,
+            User.permissions_version.label("user_version"),
+            Role.permissions_version.label("role_version"),
+        ]
+        if include_permissions:
+            columns.append(Permission.name)
+
+        query = (
+            self.db.session.query(*columns)
+            .outerjoin(Role, Role.id == User.role_id)
+            .filter(User.id == user_id)
+        )
+        if include_permissions:
+            query = (
+                query.outerjoin(RolePermission, RolePermission.role_id == User.role_id)
+                .outerjoin(Permission, Permission.id == RolePermission.permission_id)
+            )
+
+        rows = query.all()
+        if not rows:
+            return None
+
+        access = {
+            "system_admin": bool(rows[0].system_admin),
+            "enabled": bool(rows[0].enabled),
+            "role_id": rows[0].role_id,
+            "user_version": rows[0].user_version,
+            "role_version": rows[0].role_version,
+        }
+        if include_permissions:
+            access["permissions"] = [row.name for row in rows if row.name is not None]
+        return access
@@ -1,9 +1,11 @@
 from abc import abstractmethod
+from time import time
 from typing import Dict, List
 from core.bcrypt import bcrypt
 from src.core.module.user import AbstractUserRepository, UserMapper
 from .repositories import AbstractAuthRepository
 from .models import Role
+from .cache import RolePermissionCache, role_permission_cache
 
 
 class AbstractAuthServices:
@@ -78,6 +80,63 @@ class AbstractAuthServices:
         """
         pass
 
+    @abstractmethod
+    def get_user_access(self, user_id: int) -> Dict | None:
+        """
+        Resolve the admin flag, enabled flag and permissions of a user.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Dict | None: The keys "system_admin", "enabled", "role_id", "user_version",
+                "role_version" and "permissions", or None if the user does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def build_permissions_snapshot(self, user_id: int, access: Dict) -> Dict:
+        """
+        Build the permission snapshot of a user to be stored in the session.
+
+        Args:
+            user_id (int): The ID of the user.
+            access (Dict): The access data returned by get_user_access.
+
+        Returns:
+            Dict: The snapshot, including the version stamps it was taken with.
+        """
+        pass
+
+    @abstractmethod
+    def current_snapshot(self, user_id: int, snapshot: Dict | None, max_age: int) -> Dict | None:
+        """
+        Get the permission snapshot a request can trust without loading the permissions.
+
+        Args:
+            user_id (int): The ID of the user the snapshot should belong to.
+            snapshot (Dict | None): The snapshot stored in the session.
+            max_age (int): The maximum age of the snapshot in seconds.
+
+        Returns:
+            Dict | None: The snapshot to use, or None if the permissions must be reloaded.
+        """
+        pass
+
+    @abstractmethod
+    def snapshot_allows(self, snapshot: Dict, permissions_required: List[str]) -> bool:
+        """
+        Check if a permission snapshot grants any of the required permissions.
+
+        Args:
+            snapshot (Dict): The permission snapshot.
+            permissions_required (List[str]): A list of required permissions.
+
+        Returns:
+            bool: True if the snapshot grants the required permissions, False otherwise.
+        """
+        pass
+
     @abstractmethod
     def has_permissions(self, user_id: int, permissions_required: List[str]) -> bool:
         """
@@ -105,6 +164,7 @@ class AuthServices(AbstractAuthServices):
         self,
         auth_repository: AbstractAuthRepository,
         user_repository: AbstractUserRepository,
+        permission_cache: RolePermissionCache = role_permission_cache,
     ):
         """
         Initialize the AuthServices.
@@ -112,9 +172,11 @@ class AuthServices(AbstractAuthServices):
         Args:
             auth_repository (AbstractAuthRepository): The repository for authentication data.
             user_repository (AbstractUserRepository): The repository for user data.
+            permission_cache (RolePermissionCache): The cache of permissions per role.
         """
         self.auth_repository = auth_repository
         self.user_repository = user_repository
+        self.permission_cache = permission_cache
 
     def validate_email(self, email: str) -> bool:
         """
@@ -169,6 +231,44 @@ class AuthServices(AbstractAuthServices):
         """
         return self.auth_repository.get_roles()
 
+    def get_user_access(self, user_id: int) -> Dict | None:
+        """
+        Resolve the admin flag, enabled flag and permissions of a user.
+
+        The permissions of the user's role are taken from the role permission
+        cache. While the cache is empty the permissions are joined in the same
+        query as the user flags, so a request costs a single query either way.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Dict | None: The keys "system_admin", "enabled", "role_id", "user_version",
+                "role_version" and "permissions", or None if the user does not exist.
+        """
+        cache_is_cold = self.permission_cache.is_empty()
+        access = self.auth_repository.get_user_access(user_id, include_permissions=cache_is_cold)
+        if access is None:
+            return None
+
+        role_id = access["role_id"]
+        role_version = access["role_version"]
+        if cache_is_cold:
+            permissions = frozenset(access["permissions"])
+            if role_id is not None:
+                self.permission_cache.set(role_id, role_version, permissions)
+        elif role_id is None:
+            permissions = frozenset()
+        else:
+            permissions = self.permission_cache.get(role_id, role_version)
+            if permissions is None:
+                permissions = self.permission_cache.set(
+                    role_id, role_version, self.auth_repository.get_permission_names_of_role(role_id)
+                )
+
+        access["permissions"] = permissions
+        return access
+
     def get_permissions_of(self, user_id: int) -> List[str]:
         """
         Retrieve the permissions associated with a user.
@@ -179,11 +279,10 @@ class AuthServices(AbstractAuthServices):
         Returns:
             List[str]: A list of permissions associated with the specified user.
         """
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
+        access = self.get_user_access(user_id)
+        if not access:
             return ["NO_PERMISSIONS"]
-        permissions = self.auth_repository.get_permissions_of_role(user.role_id)
-        return [permission.name for permission in permissions]
+        return sorted(access["permissions"])
 
     def has_permissions(self, user_id: int, permissions_required: List[str]) -> bool:
         """
@@ -196,9 +295,85 @@ class AuthServices(AbstractAuthServices):
         Returns:
             bool: True if the user has the required permissions, False otherwise.
         """
-        if self.user_repository.is_sys_admin(user_id):
+        access = self.get_user_access(user_id)
+        if not access:
+            return False
+        if access["system_admin"]:
+            return True
+        if not access["enabled"]:
+            return False
+        return any(permission in access["permissions"] for permission in permissions_required)
+
+    def build_permissions_snapshot(self, user_id: int, access: Dict) -> Dict:
+        """
+        Build the permission snapshot of a user to be stored in the session.
+
+        Args:
+            user_id (int): The ID of the user.
+            access (Dict): The access data returned by get_user_access.
+
+        Returns:
+            Dict: The snapshot, including the version stamps it was taken with.
+        """
+        return {
+            "user_id": user_id,
+            "system_admin": access["system_admin"],
+            "enabled": access["enabled"],
+            "permissions": sorted(access["permissions"]),
+            "role_id": access["role_id"],
+            "user_version": access["user_version"],
+            "role_version": access["role_version"],
+            "taken_at": time(),
+        }
+
+    def current_snapshot(self, user_id: int, snapshot: Dict | None, max_age: int) -> Dict | None:
+        """
+        Get the permission snapshot a request can trust without loading the permissions.
+
+        A snapshot younger than max_age is trusted as it is, without any query,
+        so changes to the access of the user or to the permissions of its role
+        reach the sessions that are already open within max_age seconds. An
+        older snapshot is compared with the version stamps of its user and role,
+        read with a single query by primary key. If they did not change, a copy
+        of the snapshot taken now is returned, so the next max_age seconds need
+        no query either.
+
+        Args:
+            user_id (int): The ID of the user the snapshot should belong to.
+            snapshot (Dict | None): The snapshot stored in the session.
+            max_age (int): The maximum age of the snapshot in seconds.
+
+        Returns:
+            Dict | None: The same snapshot while it is fresh, a renewed copy if
+                its stamps are still current, or None if the permissions must be reloaded.
+        """
+        if not snapshot or snapshot.get("user_id") != user_id:
+            return None
+        if time() - snapshot.get("taken_at", 0) <= max_age:
+            return snapshot
+
+        versions = self.auth_repository.get_permission_versions(user_id)
+        if versions is None or (
+            versions["role_id"] != snapshot["role_id"]
+            or versions["user_version"] != snapshot["user_version"]
+            or versions["role_version"] != snapshot["role_version"]
+        ):
+            return None
+        return {**snapshot, "taken_at": time()}
+
+    def snapshot_allows(self, snapshot: Dict, permissions_required: List[str]) -> bool:
+        """
+        Check if a permission snapshot grants any of the required permissions.
+
+        Args:
+            snapshot (Dict): The permission snapshot.
+            permissions_required (List[str]): A list of required permissions.
+
+        Returns:
+            bool: True if the snapshot grants the required permissions, False otherwise.
+        """
+        if snapshot["system_admin"]:
             return True
-        if not self.user_repository.is_user_enabled(user_id):
+        if not snapshot["enabled"]:
             return False
-        user_permissions = self.get_permissions_of(user_id)
-        return any(permission in user_permissions for permission in permissions_required)
+        return any(permission in snapshot["permissions"] for permission in permissions_required)
@@ -2,6 +2,7 @@ from src.core.database import db
 from datetime import datetime
 from enum import Enum as pyEnum
 from src.core.module.jockey_amazon.models import JockeyAmazon
+from src.core.module.common.filters import Filter, FilterSpec, GTE, LTE
 # TODO: uncomment when JYA model is imported somewhere else
 # https://docs.pylonsproject.org/projects/pyramid_cookbook/en/latest/database/sqlalchemy.html#importing-all-sqlalchemy-models
 
@@ -46,6 +47,13 @@ class Charge(db.Model):
     """
 
     __tablename__ = "charges"
+    __filters__ = FilterSpec({
+        "is_archived": Filter(),
+        "payment_method": Filter(),
+        "start_date": Filter("date_of_charge", GTE, index=True),
+        "finish_date": Filter("date_of_charge", LTE, index=True),
+    })
+    __table_args__ = __filters__.indexes("charges")
 
     id = db.Column(db.Integer, primary_key=True)
     date_of_charge = db.Column(db.Date, nullable=False)
@@ -1,12 +1,16 @@
 from abc import abstractmethod
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from datetime import date
 from sqlalchemy import func
 from src.core.module.jockey_amazon.models import JockeyAmazon  
-from src.core.module.employee.models import Employee
 from src.core.database import db as database
 from src.core.module.charges.models import Charge
-from src.core.module.common.repositories import apply_filters, apply_search_criteria
+from src.core.module.employee.models import Employee
+from src.core.module.common.repositories import apply_filters, contains_criterion
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
+from src.core.module.common.projections import Projection
+from src.core.module.report.cache import report_cache
+from src.core.module.report.rollups import add_charges, tracking_charges
 from .mappers import ChargeMapper as Mapper
 
 
@@ -38,6 +42,10 @@ class AbstractChargeRepository:
             per_page: int,
             search_query: Dict = None,
             order_by: list = None,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
+            projected: bool = False,
     ):
         """
         Retrieve a paginated list of charges.
@@ -47,6 +55,10 @@ class AbstractChargeRepository:
             per_page (int): The number of charges per page.
             search_query (Dict, optional): The search query to filter charges.
             order_by (list, optional): The order by criteria.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
+            projected (bool, optional): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             A paginated list of charges.
@@ -155,6 +167,32 @@ class AbstractChargeRepository:
         """
         pass
 
+    @abstractmethod
+    def stream_history(
+        self,
+        search_text = None,
+        start_date = None,
+        end_date = None,
+        amount = None,
+        payment_method = None,
+        batch_size: int = 500
+    ) -> Iterator:
+        """
+        Stream every payment matching the filters of last_payments_data, most recent first.
+
+        Args:
+            search_text (Optional[str]): The text to search for in jockey names.
+            start_date (Optional[date]): The start date for filtering payments.
+            end_date (Optional[date]): The end date for filtering payments.
+            amount (Optional[float]): The amount to filter payments.
+            payment_method (Optional[str]): The payment method to filter payments.
+            batch_size (int): The number of rows fetched from the database at a time.
+
+        Returns:
+            Iterator: Rows with the last_name, first_name, date_of_charge, amount and payment_method attributes.
+        """
+        pass
+
 
 
 class ChargeRepository(AbstractChargeRepository):
@@ -165,6 +203,27 @@ class ChargeRepository(AbstractChargeRepository):
     and recovering charges.
     """
 
+    # Searchable fields of the employee that received the charge
+    RELATED_SEARCH_FIELDS = {
+        "name": ("employee", "name"),
+        "lastname": ("employee", "lastname"),
+    }
+
+    # Columns shown by the lists of charges, with the names of the employee and the jockey or amazon
+    LIST_PROJECTION = Projection(
+        {
+            "id": Charge.id,
+            "date_of_charge": Charge.date_of_charge,
+            "amount": Charge.amount,
+            "payment_method": Charge.payment_method,
+            "employee_name": Employee.name,
+            "employee_lastname": Employee.lastname,
+            "jya_first_name": JockeyAmazon.first_name,
+            "jya_last_name": JockeyAmazon.last_name,
+        },
+        joins=(Charge.employee, Charge.jya),
+    )
+
     def __init__(self):
         """
         Initialize the ChargeRepository.
@@ -183,7 +242,9 @@ class ChargeRepository(AbstractChargeRepository):
         """
         self.db.session.add(charge)
         self.db.session.flush()
+        add_charges(self.db.session, [charge.id])
         self.save()
+        report_cache.invalidate()
         return Mapper.from_entity(charge)
 
     def get_page(
@@ -192,6 +253,10 @@ class ChargeRepository(AbstractChargeRepository):
             per_page: int,
             search_query: Dict = None,
             order_by: List = None,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
+            projected: bool = False,
     ):
         """
         Retrieve a paginated list of charges.
@@ -201,6 +266,10 @@ class ChargeRepository(AbstractChargeRepository):
             per_page (int): The number of charges per page.
             search_query (Dict, optional): The search query to filter charges.
             order_by (List, optional): The order by criteria.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
+            projected (bool, optional): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             A paginated list of charges.
@@ -209,29 +278,15 @@ class ChargeRepository(AbstractChargeRepository):
 
         query = Charge.query
 
-        # since name and lastname aren't in the Charge model, we need to apply the filters separately
-        if search_query and "text" in search_query and "field" in search_query:
-            employee_query = apply_search_criteria(Employee, Employee.query, search_query).all()
-            employee_ids = [employee.id for employee in employee_query]
-            query = query.filter(Charge.employee_id.in_(employee_ids))
-            search_query.pop("text")
-            search_query.pop("field")
-
-        # apply_filters doesn't handle dates so we filter it here
-        if "filters" in search_query and search_query["filters"]:
-            if "start_date" in search_query["filters"] and "finish_date" in search_query["filters"]:
-                query = (query
-                         .filter(Charge.date_of_charge
-                                 .between(search_query["filters"]["start_date"],
-                                          search_query["filters"]["finish_date"])))
-                search_query["filters"].pop("start_date")
-                search_query["filters"].pop("finish_date")
-
-        query = apply_filters(Charge, query, search_query, order_by)
-
-        return query.paginate(
-            page=page, per_page=per_page, error_out=False, max_per_page=max_per_page
-        )
+        query = apply_filters(Charge, query, search_query, order_by, related_fields=self.RELATED_SEARCH_FIELDS)
+
+        if projected:
+            query = self.LIST_PROJECTION.apply(query)
+
+        if keyset:
+            return keyset_paginate(Charge, query, order_by, min(per_page, max_per_page), cursor)
+
+        return paginate(Charge, query, page, per_page, max_per_page, count)
 
     def __get_by_id(self, charge_id: int):
         """
@@ -272,8 +327,10 @@ class ChargeRepository(AbstractChargeRepository):
         charge = Charge.query.filter_by(id=charge_id)
         if not charge:
             return False
-        charge.update(data)
+        with tracking_charges(charge_id):
+            charge.update(data)
         self.save()
+        report_cache.invalidate()
         return True
 
     def delete_charge(self, charge_id: int) -> bool:
@@ -289,8 +346,10 @@ class ChargeRepository(AbstractChargeRepository):
         charge = self.__get_by_id(charge_id)
         if not charge:
             return False
-        self.db.session.delete(charge)
+        with tracking_charges(charge_id):
+            self.db.session.delete(charge)
         self.save()
+        report_cache.invalidate()
         return True
 
     def archive_charge(self, charge_id) -> bool:
@@ -308,6 +367,7 @@ class ChargeRepository(AbstractChargeRepository):
             return False
         charge.is_archived = True
         self.save()
+        report_cache.invalidate()
         return True
 
     def recover_charge(self, charge_id) -> bool:
@@ -325,6 +385,7 @@ class ChargeRepository(AbstractChargeRepository):
             return False
         charge.is_archived = False
         self.save()
+        report_cache.invalidate()
         return True
 
     def save(self):
@@ -372,12 +433,71 @@ class ChargeRepository(AbstractChargeRepository):
         Returns:
             List[Charge]: A list of the most recent payments.
         """
-        query = Charge.query
+        query = self.__history_query(Charge.query, search_text, start_date, end_date, amount, payment_method)
+
+        return query.order_by(Charge.date_of_charge.desc()).limit(limit).all(), query.count()
+
+    def stream_history(
+        self,
+        search_text = None,
+        start_date = None,
+        end_date = None,
+        amount = None,
+        payment_method = None,
+        batch_size: int = 500
+    ) -> Iterator:
+        """
+        Stream every payment matching the filters of last_payments_data, most recent first.
+
+        Only the exported columns are selected, and they are read through a
+        server-side cursor batch_size rows at a time, so the memory used does
+        not grow with the number of payments.
 
+        Args:
+            search_text: The text to search for in jockey names.
+            start_date: The start date for filtering payments.
+            end_date: The end date for filtering payments.
+            amount: The amount to filter payments.
+            payment_method: The payment method to filter payments.
+            batch_size (int): The number of rows fetched from the database at a time.
+
+        Returns:
+            Iterator: Rows with the last_name, first_name, date_of_charge, amount and payment_method attributes.
+        """
+        query = self.db.session.query(
+            JockeyAmazon.last_name,
+            JockeyAmazon.first_name,
+            Charge.date_of_charge,
+            Charge.amount,
+            Charge.payment_method,
+        ).join(Charge.jya)
+        query = self.__history_query(query, search_text, start_date, end_date, amount, payment_method, joined=True)
+
+        yield from query.order_by(Charge.date_of_charge.desc(), Charge.id.desc()).yield_per(batch_size)
+
+    @staticmethod
+    def __history_query(query, search_text, start_date, end_date, amount, payment_method, joined: bool = False):
+        """
+        Apply the filters of the charges history report to a query.
+
+        Args:
+            query: The query of charges.
+            search_text: The text to search for in jockey names.
+            start_date: The start date for filtering payments.
+            end_date: The end date for filtering payments.
+            amount: The amount to filter payments.
+            payment_method: The payment method to filter payments.
+            joined (bool): Whether the query already joins the jockeys and amazons.
+
+        Returns:
+            The filtered query.
+        """
         if search_text:
-            query = query.join(JockeyAmazon).filter(
-                (JockeyAmazon.first_name.ilike(f"%{search_text}%")) |
-                (JockeyAmazon.last_name.ilike(f"%{search_text}%"))
+            if not joined:
+                query = query.join(JockeyAmazon)
+            query = query.filter(
+                contains_criterion(JockeyAmazon.first_name, search_text) |
+                contains_criterion(JockeyAmazon.last_name, search_text)
             )
 
         if start_date and end_date:
@@ -389,5 +509,5 @@ class ChargeRepository(AbstractChargeRepository):
         if payment_method:
             query = query.filter(Charge.payment_method == payment_method)
 
-        return query.order_by(Charge.date_of_charge.desc()).limit(limit).all(), query.count()
+        return query
 
@@ -1,12 +1,31 @@
 from .models import AddressMixin, EmergencyContactMixin, PhoneMixin, File, ArgentinaProvincies
 from .forms import AddressForm, EmergencyContactForm, PhoneForm, max_file_size
-from .services import AbstractStorageServices, StorageServices
+from .services import AbstractStorageServices, StorageServices, LocalStorageServices
+from .cache import ImageCache, profile_image_cache, TTLCache, count_cache
 from .validators import IsNumber, FilesNumber, IsValidName
 from .mappers import FileMapper
+from .repositories import (
+    unreferenced_paths,
+    contains_criterion,
+    apply_related_search_criteria,
+    apply_loading_profile,
+    PROFILE_DETAIL,
+    PROFILE_EDIT,
+    PROFILE_LIST,
+)
+from .filters import Filter, FilterSpec, EQ, IN, GT, GTE, LT, LTE, RANGE
+from .projections import Projection
+from .pagination import KeysetPage, keyset_paginate, paginate, COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED
+from .search import FULL_TEXT_FIELD, search_vector_column, search_vector_index, trigram_indexes
 
 __all__ = [
     "AbstractStorageServices",
     "StorageServices",
+    "LocalStorageServices",
+    "ImageCache",
+    "profile_image_cache",
+    "TTLCache",
+    "count_cache",
 
     "AddressMixin",
     "EmergencyContactMixin",
@@ -20,6 +39,33 @@ __all__ = [
     "FilesNumber",
     "max_file_size",
     "FileMapper",
+    "unreferenced_paths",
+    "contains_criterion",
+    "Filter",
+    "FilterSpec",
+    "EQ",
+    "IN",
+    "GT",
+    "GTE",
+    "LT",
+    "LTE",
+    "RANGE",
+    "apply_related_search_criteria",
+    "apply_loading_profile",
+    "PROFILE_DETAIL",
+    "PROFILE_EDIT",
+    "PROFILE_LIST",
+    "Projection",
+    "KeysetPage",
+    "keyset_paginate",
+    "paginate",
+    "COUNT_EXACT",
+    "COUNT_CACHED",
+    "COUNT_ESTIMATED",
+    "FULL_TEXT_FIELD",
+    "search_vector_column",
+    "search_vector_index",
+    "trigram_indexes",
     "IsValidName",
     "ArgentinaProvincies",
 ]
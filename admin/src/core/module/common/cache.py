@@ -0,0 +1,173 @@
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class ImageCache:
+    """
+    Bounded in-process LRU cache of small images, such as profile thumbnails.
+
+    Profile photos are shown on every page of a logged-in user, so the hot
+    ones are kept in memory. The least recently used images are dropped once
+    the cache holds more than `max_bytes` of image data.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize an empty ImageCache.
+
+        Args:
+            max_bytes (int): Maximum total size in bytes of the cached images.
+        """
+        self.max_bytes = max_bytes
+        self.__lock = Lock()
+        self.__size = 0
+        self.__images: OrderedDict[str, Dict] = OrderedDict()
+
+    def get(self, path: str) -> Dict | None:
+        """
+        Retrieve a cached image and mark it as recently used.
+
+        Args:
+            path (str): The storage path of the image.
+
+        Returns:
+            Dict | None: The keys "data", "etag" and "content_type", or None if it is not cached.
+        """
+        with self.__lock:
+            image = self.__images.get(path)
+            if image is not None:
+                self.__images.move_to_end(path)
+            return image
+
+    def set(self, path: str, image: Dict) -> None:
+        """
+        Store an image, evicting the least recently used ones if needed.
+
+        Args:
+            path (str): The storage path of the image.
+            image (Dict): The keys "data", "etag" and "content_type".
+        """
+        size = len(image["data"])
+        if size > self.max_bytes:
+            return
+        with self.__lock:
+            previous = self.__images.pop(path, None)
+            if previous is not None:
+                self.__size -= len(previous["data"])
+            self.__images[path] = image
+            self.__size += size
+            while self.__size > self.max_bytes:
+                _, evicted = self.__images.popitem(last=False)
+                self.__size -= len(evicted["data"])
+
+    def invalidate(self, *paths: str) -> None:
+        """
+        Drop the given images, or every image if none is given.
+
+        Args:
+            *paths (str): The storage paths of the images.
+        """
+        with self.__lock:
+            if not paths:
+                self.__images.clear()
+                self.__size = 0
+            for path in paths:
+                image = self.__images.pop(path, None)
+                if image is not None:
+                    self.__size -= len(image["data"])
+
+
+class TTLCache:
+    """
+    Bounded in-process cache whose entries expire some seconds after being stored.
+
+    Expired entries are dropped as they are found, and the oldest entries
+    are evicted once the cache holds more than `max_entries`. Every
+    invalidation increases `generation`: a value computed from the database
+    is stored with the generation read before computing it, and is dropped
+    if an invalidation happened meanwhile, so a reader that races a writer
+    cannot cache what the writer replaced.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize an empty TTLCache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept in memory.
+        """
+        self.max_entries = max_entries
+        self.__lock = Lock()
+        self.__generation = 0
+        self.__entries: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+
+    @property
+    def generation(self) -> int:
+        """The number of invalidations so far."""
+        return self.__generation
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Retrieve a cached value.
+
+        Args:
+            key (Hashable): The key of the value.
+
+        Returns:
+            Any | None: The value, or None if it is not cached or expired.
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time():
+            with self.__lock:
+                if self.__entries.get(key) is entry:
+                    del self.__entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float, generation: int | None = None) -> None:
+        """
+        Store a value, evicting the expired and the oldest entries.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value.
+            ttl (float): Seconds the value is valid.
+            generation (int | None): The generation read before computing the value.
+                The value is not stored if the cache was invalidated since then.
+        """
+        now = time()
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            self.__entries[key] = (value, now + ttl)
+            self.__entries.move_to_end(key)
+            while self.__entries:
+                _, expires_at = next(iter(self.__entries.values()))
+                if expires_at > now and len(self.__entries) <= self.max_entries:
+                    break
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, match: Callable[[Hashable], bool] | None = None) -> None:
+        """
+        Drop the entries whose key matches, or every entry if no match is given.
+
+        Args:
+            match (Callable[[Hashable], bool] | None): Tells if the entry of a key must be dropped.
+        """
+        with self.__lock:
+            self.__generation += 1
+            if match is None:
+                self.__entries.clear()
+                return
+            for key in [key for key in self.__entries if match(key)]:
+                del self.__entries[key]
+
+
+profile_image_cache = ImageCache()
+# Row counts of the paginated lists by (table, normalized filters), dropped when a row of the table is written
+count_cache = TTLCache()
@@ -0,0 +1,167 @@
+from datetime import date, datetime
+from typing import Callable, Dict
+from sqlalchemy import Boolean, Date, DateTime
+from src.core.database import db
+
+# Operators of a Filter
+EQ = "eq"
+IN = "in"
+GT = "gt"
+GTE = "gte"
+LT = "lt"
+LTE = "lte"
+RANGE = "range"
+
+
+class Filter:
+    """
+    A filter that list views are allowed to apply on a column of a model.
+
+    Attributes:
+        column (str | None): The column filtered, defaults to the name of the filter.
+        operator (str): One of EQ, IN, GT, GTE, LT, LTE or RANGE. EQ with a list value works as IN,
+            RANGE takes a (start, end) tuple and includes both ends.
+        index (bool): Whether the column deserves an index because lists filter by it.
+    """
+
+    def __init__(self, column: str | None = None, operator: str = EQ, index: bool = False):
+        self.column = column
+        self.operator = operator
+        self.index = index
+
+
+class FilterSpec:
+    """
+    The whitelist of filters of a model.
+
+    Declared in the class body of the model as `__filters__`, it replaces
+    the generic filtering of apply_filter_criteria for that model: filters
+    that are not declared are ignored, empty values (None or "") are
+    skipped, and every declared filter becomes a single predicate. The
+    filters are compiled into SQLAlchemy expression builders the first time
+    they are used and cached afterwards.
+    """
+
+    def __init__(self, filters: Dict[str, Filter]):
+        """
+        Initialize the FilterSpec.
+
+        Args:
+            filters (Dict[str, Filter]): The filters mapped by the key used in search_query["filters"].
+        """
+        self.filters = filters
+        self.__compiled: Dict[type, Dict[str, Callable]] = {}
+
+    def indexes(self, table_name: str) -> tuple:
+        """
+        Build the B-tree indexes of the columns of the filters with an index hint.
+
+        Args:
+            table_name (str): The name of the table of the model.
+
+        Returns:
+            tuple: The indexes to add to the `__table_args__` of the model.
+        """
+        columns = dict.fromkeys(
+            filter_.column or key for key, filter_ in self.filters.items() if filter_.index
+        )
+        return tuple(db.Index(f"ix_{table_name}_{column}", column) for column in columns)
+
+    def apply(self, model, query, values: Dict):
+        """
+        Applies the declared filters to a query.
+
+        Args:
+            model: The model class.
+            query: The query to modify.
+            values: The filter values, keyed like the declared filters.
+
+        Returns:
+            The filtered query.
+        """
+        compiled = self.compile(model)
+        criteria = [
+            compiled[key](value)
+            for key, value in values.items()
+            if key in compiled and value is not None and value != ""
+        ]
+        return query.filter(*criteria) if criteria else query
+
+    def compile(self, model) -> Dict[str, Callable]:
+        """
+        Compile the filters into builders of SQLAlchemy expressions for a model.
+
+        Args:
+            model: The model class.
+
+        Returns:
+            Dict[str, Callable]: The expression builder of each filter, taking the filter value.
+
+        Raises:
+            ValueError: If a filter names a column or operator that does not exist.
+        """
+        compiled = self.__compiled.get(model)
+        if compiled is None:
+            compiled = {key: _compile(model, key, filter_) for key, filter_ in self.filters.items()}
+            self.__compiled[model] = compiled
+        return compiled
+
+
+def _compile(model, key: str, filter_: Filter) -> Callable:
+    """
+    Compile a filter into a builder of SQLAlchemy expressions.
+
+    Args:
+        model: The model class.
+        key: The name of the filter.
+        filter_: The filter.
+
+    Returns:
+        Callable: The builder, taking the filter value.
+    """
+    name = filter_.column or key
+    if name not in model.__table__.columns:
+        raise ValueError(f"{model.__name__} has no column {name} to filter by")
+
+    column = getattr(model, name)
+    coerce = _coercer(model.__table__.columns[name].type)
+    operator = filter_.operator
+
+    if operator == EQ:
+        return lambda value: (
+            column.in_([coerce(item) for item in value])
+            if isinstance(value, (list, tuple))
+            else column == coerce(value)
+        )
+    if operator == IN:
+        return lambda value: column.in_([coerce(item) for item in value])
+    if operator == GT:
+        return lambda value: column > coerce(value)
+    if operator == GTE:
+        return lambda value: column >= coerce(value)
+    if operator == LT:
+        return lambda value: column < coerce(value)
+    if operator == LTE:
+        return lambda value: column <= coerce(value)
+    if operator == RANGE:
+        return lambda value: column.between(coerce(value[0]), coerce(value[1]))
+    raise ValueError(f"Unknown filter operator {operator}")
+
+
+def _coercer(column_type) -> Callable:
+    """
+    Build the function that converts the values sent by the forms to the type of a column.
+
+    Args:
+        column_type: The SQLAlchemy type of the column.
+
+    Returns:
+        Callable: The conversion function.
+    """
+    if isinstance(column_type, Boolean):
+        return lambda value: value.lower() in ("true", "1") if isinstance(value, str) else bool(value)
+    if isinstance(column_type, DateTime):
+        return lambda value: datetime.fromisoformat(value) if isinstance(value, str) else value
+    if isinstance(column_type, Date):
+        return lambda value: date.fromisoformat(value) if isinstance(value, str) else value
+    return lambda value: value
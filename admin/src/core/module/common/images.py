@@ -0,0 +1,44 @@
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+THUMBNAIL_SIZE = 128
+THUMBNAIL_CONTENT_TYPE = "image/png"
+
+
+def thumbnail_path(filename: str, size: int = THUMBNAIL_SIZE) -> str:
+    """
+    Build the storage path of a thumbnail variant of an image.
+
+    Args:
+        filename (str): The storage path of the original image.
+        size (int): The side in pixels of the thumbnail.
+
+    Returns:
+        str: The storage path of the thumbnail.
+    """
+    return f"{filename}.thumb{size}.png"
+
+
+def make_thumbnail(data: bytes, size: int = THUMBNAIL_SIZE) -> bytes | None:
+    """
+    Create a square PNG thumbnail of an image, cropping it around its center.
+
+    Args:
+        data (bytes): The original image.
+        size (int): The side in pixels of the thumbnail.
+
+    Returns:
+        bytes | None: The thumbnail, or None if the image cannot be read.
+    """
+    try:
+        with Image.open(BytesIO(data)) as image:
+            thumbnail = ImageOps.fit(ImageOps.exif_transpose(image), (size, size))
+            if thumbnail.mode not in ("RGB", "RGBA"):
+                thumbnail = thumbnail.convert("RGBA")
+            output = BytesIO()
+            thumbnail.save(output, format="PNG", optimize=True)
+            return output.getvalue()
+    except (OSError, ValueError) as e:
+        print("No se pudo generar la miniatura de la imagen. Error: ", e)
+        return None
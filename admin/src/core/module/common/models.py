@@ -17,6 +17,10 @@ class File(db.Model):
         tag (str): An optional tag for categorizing or labeling the file.
         filetype (str): The type of the file (e.g., pdf, jpg, etc.).
         filesize (int): The size of the file in bytes.
+        checksum (str): The SHA-256 digest of the uploaded content. Files with the
+                        same content share their storage path, which is only
+                        deleted together with the last file referencing it.
+        filename (str): The name of the uploaded file, used as the name of its downloads.
         inserted_at (datetime): The timestamp when the file was uploaded.
         deleted (bool): Indicates if the file is marked as deleted.
         deleted_at (datetime, optional): The timestamp when the file was deleted.
@@ -34,6 +38,8 @@ class File(db.Model):
 
     filetype = db.Column(db.String(length=25))
     filesize = db.Column(db.Integer)
+    checksum = db.Column(db.String(length=64), index=True)
+    filename = db.Column(db.String(length=255))
 
     inserted_at = db.Column(db.DateTime, default=datetime.now)
     deleted = db.Column(db.Boolean, default=False)
@@ -56,6 +62,8 @@ class File(db.Model):
             "path": self.path,
             "filetype": self.filetype,
             "filesize": self.filesize,
+            "checksum": self.checksum,
+            "filename": self.filename,
             "title": self.title,
             "tag": self.tag,
             "uploaded_at": self.inserted_at,
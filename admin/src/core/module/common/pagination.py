@@ -0,0 +1,367 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from itertools import chain
+from typing import Any, List, Tuple
+from flask import current_app
+from sqlalchemy import and_, event, false, inspect, or_
+from sqlalchemy.exc import CompileError
+from sqlalchemy.orm import Session
+from src.core.database import db as database
+from .cache import count_cache
+
+# Strategies to compute the total of a paginated list
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+
+
+class KeysetPage:
+    """
+    A page of results fetched with keyset (cursor) pagination.
+
+    Instead of skipping the rows of the previous pages with OFFSET, the
+    next page starts right after the sort key of the last row, so every
+    page costs the same as the first one and no COUNT(*) is run. The cursor
+    is opaque for the caller, who only hands back `next_cursor` to fetch the
+    following page.
+
+    Attributes:
+        items (List): The entities of the page.
+        per_page (int): The maximum number of entities of the page.
+        cursor (str | None): The cursor the page was fetched with, None for the first page.
+        next_cursor (str | None): The cursor of the next page, None if this is the last one.
+    """
+
+    def __init__(self, items: List, per_page: int, cursor: str | None, next_cursor: str | None):
+        self.items = items
+        self.per_page = per_page
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a page after this one."""
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def paginate(model, query, page: int, per_page: int, max_per_page: int = None, count: str = COUNT_EXACT):
+    """
+    Paginates a query by page number, computing its total with the given strategy.
+
+    COUNT_EXACT runs a COUNT(*) for every page, as Flask-SQLAlchemy does.
+    COUNT_CACHED reuses the count of the same filtered list for
+    COUNT_CACHE_TTL seconds, or until a row of the table is written.
+    COUNT_ESTIMATED takes the row estimate of the query planner, and falls
+    back to an exact count when the estimate is below
+    COUNT_ESTIMATE_THRESHOLD, where counting is cheap and estimates are poor.
+
+    The `total_is_exact` attribute of the returned pagination tells whether
+    the total is an estimate, so templates can show "about N results".
+
+    Args:
+        model: The model class.
+        query: The filtered and ordered query.
+        page: The page number.
+        per_page: The number of entities per page.
+        max_per_page: The maximum number of entities per page.
+        count: The count strategy.
+
+    Returns:
+        Pagination: The requested page.
+    """
+    if count == COUNT_EXACT:
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False, max_per_page=max_per_page)
+        pagination.total_is_exact = True
+        return pagination
+
+    pagination = query.paginate(
+        page=page, per_page=per_page, error_out=False, max_per_page=max_per_page, count=False
+    )
+    count_query = query.order_by(None)
+    total, exact = None, True
+
+    if count == COUNT_ESTIMATED:
+        total = estimate_count(count_query)
+        if total is not None and total < current_app.config["COUNT_ESTIMATE_THRESHOLD"]:
+            total = None
+        exact = total is None
+
+    if total is None and count == COUNT_CACHED:
+        key = _count_key(count_query)
+        total = count_cache.get((model.__table__.name, key)) if key else None
+        if total is None:
+            generation = count_cache.generation
+            total = count_query.count()
+            if key:
+                ttl = current_app.config["COUNT_CACHE_TTL"]
+                count_cache.set((model.__table__.name, key), total, ttl, generation)
+
+    if total is None:
+        total = count_query.count()
+
+    # The page itself bounds the total: it has at least the rows seen so far, and a short page is the last one
+    seen = (pagination.page - 1) * pagination.per_page + len(pagination.items)
+    if len(pagination.items) < pagination.per_page and (pagination.items or pagination.page == 1):
+        total, exact = seen, True
+    pagination.total = max(total, seen)
+    pagination.total_is_exact = exact
+    return pagination
+
+
+def estimate_count(query) -> int | None:
+    """
+    Estimates the number of rows of a query from the plan of the query planner.
+
+    Args:
+        query: The query, without ordering.
+
+    Returns:
+        int | None: The estimated number of rows, or None if it cannot be estimated.
+    """
+    dialect = database.engine.dialect
+    if dialect.name != "postgresql":
+        return None
+
+    try:
+        sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    except (CompileError, NotImplementedError):
+        return None
+
+    plan = database.session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", {}).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _count_key(query) -> str | None:
+    """
+    Builds the cache key of the count of a query from its normalized SQL.
+
+    Args:
+        query: The query, without ordering.
+
+    Returns:
+        str | None: The key, or None if the query cannot be rendered with its parameters.
+    """
+    try:
+        sql = str(query.statement.compile(dialect=database.engine.dialect, compile_kwargs={"literal_binds": True}))
+    except (CompileError, NotImplementedError):
+        return None
+    return hashlib.sha1(sql.encode()).hexdigest()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_counts(session, _flush_context):
+    """Drops the cached counts of the tables written by a flush."""
+    tables = {
+        table.name
+        for instance in chain(session.new, session.dirty, session.deleted)
+        for table in inspect(instance).mapper.tables
+    }
+    if tables:
+        count_cache.invalidate(lambda entry: entry[0] in tables)
+
+
+def keyset_paginate(model, query, order_by: List[Tuple[str, str]], per_page: int, cursor: str | None = None):
+    """
+    Paginates a query by the values of its sort key instead of by offset.
+
+    The sort key is made of the columns of `order_by` followed by the primary
+    key, which makes it unique. The ordering already applied to the query is
+    replaced by the one of the sort key, so relevance ranking is not kept in
+    this mode. An invalid or stale cursor restarts from the first page.
+
+    Args:
+        model: The model class.
+        query: The filtered query.
+        order_by: A list of (field, direction) tuples.
+        per_page: The number of entities per page.
+        cursor: The cursor returned with the previous page, None for the first page.
+
+    Returns:
+        KeysetPage: The requested page.
+    """
+    keys = _sort_key(model, order_by)
+    names = [column.key for column, _ in keys]
+
+    query = query.order_by(None).order_by(
+        *(
+            column.desc().nulls_first() if direction == "desc" else column.asc().nulls_last()
+            for column, direction in keys
+        )
+    )
+
+    values = decode_cursor(cursor, keys)
+    if values is not None:
+        query = query.filter(_after(keys, values))
+
+    items = query.limit(per_page + 1).all()
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = encode_cursor(names, [getattr(items[-1], name) for name in names])
+
+    return KeysetPage(items, per_page, cursor, next_cursor)
+
+
+def encode_cursor(names: List[str], values: List[Any]) -> str:
+    """
+    Encodes the sort key of a row as an opaque cursor.
+
+    Args:
+        names: The names of the sort key columns.
+        values: The values of the row for those columns.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    payload = json.dumps({"k": names, "v": [_dump(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str | None, keys: List) -> List[Any] | None:
+    """
+    Decodes a cursor built by encode_cursor for the given sort key.
+
+    Args:
+        cursor: The cursor.
+        keys: The (column, direction) tuples of the sort key.
+
+    Returns:
+        List[Any] | None: The values of the sort key, or None if there is no
+            cursor or it does not belong to this sort key.
+    """
+    if not cursor:
+        return None
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["k"] != [column.key for column, _ in keys]:
+            return None
+        return [_load(column, value) for (column, _), value in zip(keys, payload["v"], strict=True)]
+    except (binascii.Error, KeyError, TypeError, ValueError):
+        return None
+
+
+def _sort_key(model, order_by):
+    """
+    Builds the sort key of a keyset paginated query.
+
+    Args:
+        model: The model class.
+        order_by: A list of (field, direction) tuples.
+
+    Returns:
+        A list of (column, direction) tuples ending with the primary key.
+    """
+    columns = inspect(model).columns
+    keys = []
+    for field, direction in order_by or []:
+        if field in columns and direction in ("asc", "desc") and field not in [c.key for c, _ in keys]:
+            keys.append((getattr(model, field), direction))
+
+    for primary_key in inspect(model).primary_key:
+        if primary_key.key not in [c.key for c, _ in keys]:
+            keys.append((getattr(model, primary_key.key), keys[0][1] if keys else "asc"))
+
+    return keys
+
+
+def _after(keys, values):
+    """
+    Builds the predicate of the rows that sort after the given sort key values.
+
+    Args:
+        keys: The (column, direction) tuples of the sort key.
+        values: The sort key values of the last row of the previous page.
+
+    Returns:
+        The predicate.
+    """
+    conditions = []
+    for index, ((column, direction), value) in enumerate(zip(keys, values)):
+        previous_equal = [
+            previous.is_(None) if previous_value is None else previous == previous_value
+            for (previous, _), previous_value in zip(keys[:index], values[:index])
+        ]
+        conditions.append(and_(*previous_equal, _beyond(column, direction, value)))
+    return or_(*conditions)
+
+
+def _beyond(column, direction, value):
+    """
+    Builds the predicate of the values that sort after a value of one column.
+
+    NULL values sort last in ascending order and first in descending order,
+    as PostgreSQL does by default.
+
+    Args:
+        column: The column.
+        direction: "asc" or "desc".
+        value: The value of the last row of the previous page.
+
+    Returns:
+        The predicate.
+    """
+    nullable = column.expression.nullable
+    if direction == "desc":
+        if value is None:
+            return column.is_not(None)
+        return column < value
+    if value is None:
+        return false()
+    return or_(column > value, column.is_(None)) if nullable else column > value
+
+
+def _dump(value):
+    """Converts a sort key value to a JSON serializable one."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _load(column, value):
+    """Converts a sort key value read from a cursor back to the type of its column."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, Enum):
+        return python_type[value]
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    if issubclass(python_type, Decimal):
+        return Decimal(value)
+    return value
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_bulk_counts(orm_execute_state):
+    """Drops the cached counts of the table written by a bulk update or delete, which no flush sees."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        tables = {table.name for table in mapper.tables}
+    else:
+        tables = {orm_execute_state.statement.table.name}
+    count_cache.invalidate(lambda entry: entry[0] in tables)
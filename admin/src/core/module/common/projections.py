@@ -0,0 +1,40 @@
+from typing import Any, Dict, Tuple
+
+
+class Projection:
+    """
+    The columns a list view shows, selected as named rows instead of entities.
+
+    Loading full entities for a list hydrates every column of the model and,
+    when the template reaches a related entity (an employee name, a work
+    proposal), fires one extra query per row. A projection selects only the
+    listed columns, joining the related tables in the same query, and the
+    page holds lightweight rows whose attributes are the names of the
+    projection, so templates read them as they read entities.
+
+    Keyset pagination reads the sort key from the rows, so the columns the
+    list can be ordered by, and the primary key, must be projected under
+    their own name.
+
+    Attributes:
+        columns (Dict[str, Any]): The selected columns mapped by the name of the row attribute.
+        joins (Tuple): The relationships to outer join to reach the columns of related models.
+    """
+
+    def __init__(self, columns: Dict[str, Any], joins: Tuple = ()):
+        self.columns = columns
+        self.joins = joins
+
+    def apply(self, query):
+        """
+        Replaces the entities selected by a query with the projected columns.
+
+        Args:
+            query: The filtered and ordered query.
+
+        Returns:
+            The query returning named rows.
+        """
+        for relationship in self.joins:
+            query = query.outerjoin(relationship)
+        return query.with_entities(*(column.label(name) for name, column in self.columns.items()))
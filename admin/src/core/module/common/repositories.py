@@ -1,7 +1,17 @@
-from sqlalchemy import or_ 
+from typing import Dict, List, Tuple
+from sqlalchemy import func, inspect, or_, select
+from sqlalchemy.orm import joinedload, selectinload
+from src.core.database import db as database
+from .models import File
+from .search import apply_full_text_search, supports_full_text
 
+# Names of the loading profiles of the repositories, see apply_loading_profile
+PROFILE_DETAIL = "detail"
+PROFILE_EDIT = "edit"
+PROFILE_LIST = "list"
 
-def apply_filters(model, query, search_query, order_by):
+
+def apply_filters(model, query, search_query, order_by, full_text=False, related_fields=None):
     """
     Applies filters, search criteria, and ordering to a query.
 
@@ -10,14 +20,23 @@ def apply_filters(model, query, search_query, order_by):
         query: The initial query.
         search_query: The search parameters.
         order_by: The fields to order by.
+        full_text: Whether to match the search text against the search vector
+            of the model, ranking the best matches first, instead of using ILIKE.
+        related_fields: The searchable fields of related models, see
+            apply_related_search_criteria.
 
     Returns:
         The modified query.
     """
     if search_query:
         query = apply_filter_criteria(model, query, search_query)
-        query = apply_search_criteria(model, query, search_query)
-        query = apply_multiple_search_criteria(model, query, search_query)
+        if full_text and supports_full_text(model):
+            query = apply_full_text_search(model, query, search_query.get("text"))
+        elif related_fields and search_query.get("field") in related_fields:
+            query = apply_related_search_criteria(model, query, search_query, related_fields)
+        else:
+            query = apply_search_criteria(model, query, search_query)
+            query = apply_multiple_search_criteria(model, query, search_query)
 
     return order_query(model, query, order_by)
 
@@ -46,6 +65,56 @@ def order_query(model, query, order_by):
     return query
 
 
+def apply_loading_profile(model, query, profiles: Dict[str, Tuple[str, ...]], profile: str | None):
+    """
+    Applies the loader options of a named loading profile to a query.
+
+    A profile lists the relationships a page reads from the entities as
+    dotted paths ("work_assignment.horse"). They are loaded eagerly, with
+    joinedload for to-one relationships and selectinload for collections,
+    so the page runs the same number of queries whatever the number of
+    related rows.
+
+    Args:
+        model: The model class.
+        query: The query to modify.
+        profiles: The relationship paths of each profile of the repository.
+        profile: The name of the profile, None to keep the default lazy loading.
+
+    Returns:
+        The query with the loader options.
+
+    Raises:
+        ValueError: If the repository has no profile with that name.
+    """
+    if profile is None:
+        return query
+    if profile not in profiles:
+        raise ValueError(f"Unknown loading profile {profile}")
+    return query.options(*(_loader_option(model, path) for path in profiles[profile]))
+
+
+def _loader_option(model, path: str):
+    """
+    Builds the eager loader option of a relationship path.
+
+    Args:
+        model: The model class the path starts from.
+        path: The dotted names of the relationships.
+
+    Returns:
+        The loader option.
+    """
+    option, entity = None, model
+    for name in path.split("."):
+        relationship = inspect(entity).relationships[name]
+        loader = selectinload if relationship.uselist else joinedload
+        attribute = getattr(entity, name)
+        option = loader(attribute) if option is None else getattr(option, loader.__name__)(attribute)
+        entity = relationship.mapper.class_
+    return option
+
+
 def apply_search_criteria(model, query, search_query):
     """
     Applies basic search criteria to the query.
@@ -58,10 +127,41 @@ def apply_search_criteria(model, query, search_query):
     Returns:
         The filtered query.
     """
-    if "text" in search_query and "field" in search_query:
+    if search_query.get("text") and "field" in search_query:
         if hasattr(model, search_query["field"]):
             field = getattr(model, search_query["field"])
-            query = query.filter(field.ilike(f"%{search_query['text']}%"))
+            query = query.filter(contains_criterion(field, search_query["text"]))
+
+    return query
+
+
+def apply_related_search_criteria(model, query, search_query, related_fields):
+    """
+    Applies search criteria on a field of a related model.
+
+    The search runs as an EXISTS subquery correlated with the searched
+    model, so it takes a single statement no matter how many related rows
+    match.
+
+    Args:
+        model: The model class.
+        query: The query to modify.
+        search_query: The search parameters.
+        related_fields: Maps each search field name to a (relationship, field)
+            tuple, e.g. {"alias": ("author", "alias")}.
+
+    Returns:
+        The filtered query.
+    """
+    if search_query.get("text") and search_query.get("field") in related_fields:
+        relationship_name, field_name = related_fields[search_query["field"]]
+        relationship = getattr(model, relationship_name)
+        related_model = relationship.property.mapper.class_
+        criterion = contains_criterion(getattr(related_model, field_name), search_query["text"])
+        if relationship.property.uselist:
+            query = query.filter(relationship.any(criterion))
+        else:
+            query = query.filter(relationship.has(criterion))
 
     return query
 
@@ -78,7 +178,7 @@ def apply_multiple_search_criteria(model, query, search_query):
     Returns:
         The filtered query.
     """
-    if "text" in search_query and "fields" in search_query:
+    if search_query.get("text") and "fields" in search_query:
         search_text = search_query["text"]
         search_fields = search_query["fields"]
 
@@ -86,7 +186,7 @@ def apply_multiple_search_criteria(model, query, search_query):
         for field_name in search_fields:
             if hasattr(model, field_name):
                 field = getattr(model, field_name)
-                conditions.append(field.ilike(f"%{search_text}%"))
+                conditions.append(contains_criterion(field, search_text))
 
         if conditions:
             query = query.filter(or_(*conditions))
@@ -94,10 +194,33 @@ def apply_multiple_search_criteria(model, query, search_query):
     return query
 
 
+def contains_criterion(field, text):
+    """
+    Builds a case-insensitive substring predicate on a column.
+
+    The column is compared as is, without wrapping it in a function, so the
+    trigram index of the column can serve the predicate. The LIKE wildcards
+    of the text are escaped, so "%" and "_" match themselves.
+
+    Args:
+        field: The column to search in.
+        text: The text to search for.
+
+    Returns:
+        The predicate.
+    """
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return field.ilike(f"%{escaped}%", escape="\\")
+
+
 def apply_filter_criteria(model, query, search_query):
     """
     Applies field filters to the query.
 
+    Models that declare a FilterSpec as `__filters__` only accept the
+    filters it whitelists. Other models are filtered by equality on every
+    filter that names one of their attributes.
+
     Args:
         model: The model class.
         query: The query to modify.
@@ -107,13 +230,71 @@ def apply_filter_criteria(model, query, search_query):
         The filtered query.
     """
     if "filters" in search_query and search_query["filters"]:
+        spec = getattr(model, "__filters__", None)
+        if spec is not None:
+            return spec.apply(model, query, search_query["filters"])
+
         for field, value in search_query["filters"].items():
             if not hasattr(model, field):
                 continue
             model_field = getattr(model, field)
-            query = query.filter(model_field == value)
             if isinstance(value, (list, tuple)):
                 query = query.filter(model_field.in_(value))
             else:
                 query = query.filter(model_field == value)
     return query
+
+
+# First key of the advisory locks of the storage paths, the second one is the hash of the path
+PATH_LOCK_CLASS = 1019
+
+
+def lock_paths(paths: List[str], exclusive: bool = False) -> None:
+    """
+    Locks storage paths until the current transaction ends.
+
+    Uploads that reuse a stored content take shared locks on its path and
+    deletions take exclusive ones, so an object cannot be removed between
+    an upload finding it and the commit of the file that references it.
+    Only PostgreSQL supports the locks; elsewhere nothing is locked.
+
+    Args:
+        paths: The storage paths.
+        exclusive: Whether to lock the paths for a deletion.
+    """
+    if database.engine.dialect.name != "postgresql":
+        return
+    lock = func.pg_advisory_xact_lock if exclusive else func.pg_advisory_xact_lock_shared
+    for path in sorted(set(paths)):
+        database.session.execute(select(lock(PATH_LOCK_CLASS, func.hashtext(path))))
+
+
+def unreferenced_paths(paths: List[str], excluded_ids: List[int]) -> List[str]:
+    """
+    Filters the storage paths that no other file references.
+
+    Uploaded documents are stored once per content, so several files can share
+    the same storage path. The stored object must only be deleted together with
+    the last file that references it. The paths are locked until the current
+    transaction ends, see lock_paths, so the objects must be deleted before
+    committing the deletion of the files.
+
+    Args:
+        paths: The storage paths of the files being deleted.
+        excluded_ids: The IDs of the files being deleted.
+
+    Returns:
+        The paths that are not referenced by any file outside of excluded_ids.
+    """
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return []
+
+    lock_paths(paths, exclusive=True)
+    shared = {
+        path
+        for (path,) in database.session.query(File.path)
+        .filter(File.path.in_(paths), File.is_link.is_(False), File.id.notin_(excluded_ids))
+        .distinct()
+    }
+    return [path for path in paths if path not in shared]
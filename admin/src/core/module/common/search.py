@@ -0,0 +1,150 @@
+import re
+from typing import Dict
+from sqlalchemy import Computed, DDL, event, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from src.core.database import db
+
+# Spanish text search configuration that also strips accents, so "Gómez" matches "gomez"
+SEARCH_CONFIG = "es_unaccent"
+
+# Value of the search_by field of the search forms that searches every indexed column at once
+FULL_TEXT_FIELD = "all"
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+event.listen(
+    db.metadata,
+    "before_create",
+    DDL(
+        f"""
+        CREATE EXTENSION IF NOT EXISTS unaccent;
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}') THEN
+                CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = spanish);
+                ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+                    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+            END IF;
+        END
+        $$;
+        """
+    ).execute_if(dialect="postgresql"),
+)
+
+
+def search_vector_column(weights: Dict[str, str]):
+    """
+    Build a generated tsvector column over the given text columns.
+
+    The column is computed and stored by the database on every insert or
+    update, so searches never have to parse the text again. Matches on
+    columns with a higher weight ("A" is the highest, "D" the lowest) rank
+    higher. The column is deferred so it is not loaded with the entity.
+
+    Args:
+        weights (Dict[str, str]): The names of the indexed columns mapped to their weight.
+
+    Returns:
+        The column to assign to the `search_vector` attribute of the model.
+    """
+    expression = " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}::text, '')), '{weight}')"
+        for column, weight in weights.items()
+    )
+    return db.deferred(db.Column(SEARCH_VECTOR_COLUMN, TSVECTOR, Computed(expression, persisted=True)))
+
+
+def search_vector_index(table_name: str):
+    """
+    Build the GIN index of the search vector of a table.
+
+    Args:
+        table_name (str): The name of the table.
+
+    Returns:
+        Index: The index to add to the `__table_args__` of the model.
+    """
+    return db.Index(f"ix_{table_name}_{SEARCH_VECTOR_COLUMN}", SEARCH_VECTOR_COLUMN, postgresql_using="gin")
+
+
+def trigram_indexes(table_name: str, *columns: str):
+    """
+    Build the trigram GIN indexes of the searchable columns of a table.
+
+    Substring searches (ILIKE '%text%') cannot use B-tree indexes, but a
+    pg_trgm index serves them as long as the text has three or more
+    characters.
+
+    Args:
+        table_name (str): The name of the table.
+        *columns (str): The names of the columns searched by substring.
+
+    Returns:
+        tuple: The indexes to add to the `__table_args__` of the model.
+    """
+    return tuple(
+        db.Index(
+            f"ix_{table_name}_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        for column in columns
+    )
+
+
+def supports_full_text(model) -> bool:
+    """
+    Check if a model has a search vector.
+
+    Args:
+        model: The model class.
+
+    Returns:
+        bool: True if the model can be searched with apply_full_text_search.
+    """
+    return hasattr(model, SEARCH_VECTOR_COLUMN)
+
+
+def build_ts_query(text: str):
+    """
+    Build a prefix tsquery matching every word of a search text.
+
+    The text is split into words, so user input never reaches the tsquery
+    parser as operators. Each word matches as a prefix, which keeps partial
+    inputs such as "gonz" working as they did with ILIKE.
+
+    Args:
+        text (str): The search text.
+
+    Returns:
+        The tsquery expression, or None if the text has no words.
+    """
+    words = re.findall(r"\w+", text or "")
+    if not words:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{word}:*" for word in words))
+
+
+def apply_full_text_search(model, query, text):
+    """
+    Applies a full-text search over the search vector of a model.
+
+    The results are ordered by relevance, so any ordering applied afterwards
+    only breaks ties between equally ranked rows.
+
+    Args:
+        model: The model class, it must have a search vector.
+        query: The query to modify.
+        text: The search text.
+
+    Returns:
+        The filtered and ranked query.
+    """
+    ts_query = build_ts_query(text)
+    if ts_query is None:
+        return query
+
+    vector = getattr(model, SEARCH_VECTOR_COLUMN)
+    return query.filter(vector.op("@@")(ts_query)).order_by(func.ts_rank(vector, ts_query).desc())
@@ -1,35 +1,83 @@
+import json
 import os
-from typing import List, Dict
-from datetime import datetime, timedelta
+import tempfile
+from hashlib import md5, sha256
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator
+from datetime import datetime, timedelta, timezone
 from abc import abstractmethod
 
-from urllib3.exceptions import MaxRetryError
+from urllib3.exceptions import HTTPError, MaxRetryError
 from urllib3 import HTTPResponse
 from ulid import ULID
 from minio import Minio
+from minio.deleteobjects import DeleteObject
+from minio.error import S3Error, ServerError
+from minio.helpers import MIN_PART_SIZE
 from werkzeug.datastructures import FileStorage
+from werkzeug.wsgi import wrap_file
 
-from flask import current_app
+from flask import current_app, has_request_context, request, url_for
+
+from .cache import ImageCache, profile_image_cache
+from .repositories import lock_paths
+from .images import THUMBNAIL_CONTENT_TYPE, make_thumbnail, thumbnail_path
 
 FileType = Dict[str, str | int]
 FilesType = List[FileType]
 
 
+def original_filename(file: FileStorage) -> str | None:
+    """Gets the name a file had on the computer it was uploaded from, without its directories."""
+    if not file.filename:
+        return None
+    return os.path.basename(file.filename.replace("\\", "/"))[-255:] or None
+
+
+class _HashingReader(object):
+    """A binary stream wrapper computing the SHA-256 of the data read through it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.digest = sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.digest.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()
+
 class AbstractStorageServices(object):
     """
     Abstract class defining storage service methods that must be implemented.
 
+    Attributes:
+        DEFAULT_PROFILE_IMAGE (str): The image used for users without a profile photo.
+
     Methods:
         upload_file: Uploads a single file.
+        upload_document: Uploads a document, storing each content only once.
         upload_batch: Uploads multiple files.
         get_file: Retrieves a file from storage.
+        stat_file: Retrieves the metadata of a file in storage.
+        stream_file: Retrieves a file, or a byte range of it, in chunks.
         delete_file: Deletes a file from storage.
+        delete_batch: Deletes multiple files from storage.
+        bulk_delete: Deletes multiple files from storage, reporting the errors per file.
         presigned_download_url: Generates a presigned URL for downloading.
         presigned_upload_url: Generates a presigned URL for uploading.
         modify_file: Modifies an existing file in storage.
         get_profile_image: Retrieves a profile image from storage.
+        upload_profile_image: Uploads a profile image together with its thumbnail.
+        delete_profile_image: Deletes a profile image together with its thumbnail.
+        get_profile_thumbnail: Retrieves the thumbnail of a profile image.
     """
 
+    DEFAULT_PROFILE_IMAGE = "users/default_profile_image.png"
+
     @abstractmethod
     def upload_file(self, file: FileStorage, path: str = "", title: str = "") -> Dict | None:
         """Uploads a single file to the storage system.
@@ -45,12 +93,31 @@ class AbstractStorageServices(object):
         raise NotImplementedError
 
     @abstractmethod
-    def upload_batch(self, files: List[FileStorage], path: str = ""):
+    def upload_document(self, file: FileStorage, title: str = "") -> Dict | None:
+        """Uploads a document, storing each distinct content only once.
+
+        Args:
+            file (FileStorage): The document to upload.
+            title (str, optional): The title of the document. Defaults to "".
+
+        Returns:
+            Dict | None: Metadata of the uploaded document, including its "checksum",
+                or None if upload fails.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upload_batch(self, files: List[FileStorage], path: str = "", max_workers: int | None = None):
         """Uploads multiple files to the storage system.
 
         Args:
             files (List[FileStorage]): List of files to upload.
             path (str, optional): The path to store the files in. Defaults to "".
+            max_workers (int | None, optional): Maximum number of concurrent uploads.
+
+        Returns:
+            List[Dict | None]: Metadata of the uploaded files in input order,
+                with None for each file that could not be uploaded.
         """
         raise NotImplementedError
 
@@ -67,6 +134,33 @@ class AbstractStorageServices(object):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def stat_file(self, filename: str) -> Dict | None:
+        """Retrieves the metadata of a file in storage.
+
+        Args:
+            filename (str): The full name of the file.
+
+        Returns:
+            Dict | None: The keys "size", "etag", "content_type" and "last_modified",
+                or None if the file does not exist or the storage is unreachable.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_file(self, filename: str, offset: int = 0, length: int | None = None) -> Iterator[bytes]:
+        """Retrieves a file, or a byte range of it, as an iterator of fixed-size chunks.
+
+        Args:
+            filename (str): The full name of the file.
+            offset (int, optional): The first byte to read. Defaults to 0.
+            length (int | None, optional): The number of bytes to read. Defaults to the rest of the file.
+
+        Returns:
+            Iterator[bytes]: The chunks of the file.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete_file(self, filename: str) -> bool:
         """Deletes a file from storage.
@@ -91,6 +185,19 @@ class AbstractStorageServices(object):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_delete(self, filenames: List[str]) -> Dict[str, str]:
+        """Deletes a batch of files from storage, reporting the errors per file.
+
+        Args:
+            filenames (List[str]): The names of the files to delete.
+
+        Returns:
+            Dict[str, str]: The error message of each file that could not be deleted.
+                An empty dict means every file was deleted.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def presigned_download_url(self, filename: str) -> str | None:
         """Generates a presigned URL for downloading a file.
@@ -141,6 +248,43 @@ class AbstractStorageServices(object):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def upload_profile_image(self, file: FileStorage, path: str = "") -> Dict | None:
+        """Uploads a profile image together with its thumbnail.
+
+        Args:
+            file (FileStorage): The image to upload.
+            path (str, optional): The path to store the image in. Defaults to "".
+
+        Returns:
+            Dict | None: Metadata of the uploaded image, or None if upload fails.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_profile_image(self, filename: str) -> bool:
+        """Deletes a profile image together with its thumbnail.
+
+        Args:
+            filename (str): The name of the image.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_profile_thumbnail(self, filename: str | None) -> Dict | None:
+        """Retrieves the thumbnail of a profile image.
+
+        Args:
+            filename (str | None): The name of the image, or None for the default profile image.
+
+        Returns:
+            Dict | None: The keys "data", "etag" and "content_type", or None if the image does not exist.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_profile_image_url(self, filename: str) -> str:
         """Retrieves a profile image from storage.
@@ -159,30 +303,61 @@ class StorageServices(AbstractStorageServices):
     Implementation of storage services using a MinIO backend.
 
     Attributes:
+        DELETE_BATCH_SIZE (int): Maximum number of objects removed by a single multi-delete request.
+        STREAM_CHUNK_SIZE (int): Size in bytes of the chunks yielded by stream_file.
+        CONTENT_PATH (str): The directory path of the documents stored by content hash.
         bucket_name (str): The name of the storage bucket.
         expiration_get (int): Time (in hours) before presigned URLs expire.
+        image_cache (ImageCache): The cache of profile thumbnails.
+        upload_workers (int): Default number of concurrent uploads in upload_batch.
+        multipart_threshold (int): Size in bytes from which files are uploaded in parts.
+        part_size (int): Size in bytes of each part of a multipart upload.
         storage (Minio): The Minio client instance.
 
     Methods:
         upload_file: Uploads a file to the storage bucket.
+        upload_document: Uploads a document under its content hash, skipping known contents.
         upload_batch: Uploads a batch of files to the storage bucket.
         get_file: Retrieves a file from storage.
+        stat_file: Retrieves the metadata of a file in storage.
+        stream_file: Retrieves a file, or a byte range of it, in chunks.
         presigned_download_url: Generates a presigned URL for downloading a file.
         presigned_upload_url: Generates a presigned URL for uploading a file.
         delete_file: Deletes a file from storage.
+        delete_batch: Deletes a batch of files from storage.
+        bulk_delete: Deletes a batch of files from storage, reporting the errors per file.
         modify_file: Modifies an existing file in storage.
+        upload_profile_image: Uploads a profile image together with its thumbnail.
+        delete_profile_image: Deletes a profile image together with its thumbnail.
+        get_profile_thumbnail: Retrieves the thumbnail of a profile image.
     """
 
-    def __init__(self):
-        """Initializes the StorageServices class with default bucket settings."""
+    DELETE_BATCH_SIZE = 1000
+    STREAM_CHUNK_SIZE = 64 * 1024
+    CONTENT_PATH = "content/"
+
+    def __init__(self, image_cache: ImageCache = profile_image_cache):
+        """Initializes the StorageServices class with default bucket settings.
+
+        Args:
+            image_cache (ImageCache, optional): The cache of profile thumbnails.
+                Defaults to the shared cache.
+        """
         # TODO: Remove the hardcoded bucket_name
         self.bucket_name = "grupo19"
         self.expiration_get = 1
+        self.image_cache = image_cache
+        self.upload_workers = current_app.config.get("STORAGE_UPLOAD_WORKERS", 4)
+        self.multipart_threshold = current_app.config.get("STORAGE_MULTIPART_THRESHOLD", 32 * 1024 * 1024)
+        self.part_size = max(current_app.config.get("STORAGE_PART_SIZE", 8 * 1024 * 1024), MIN_PART_SIZE)
         self.storage: Minio = current_app.storage.client
 
     def upload_file(self, file: FileStorage, path: str = "", title: str = ""):
         """Uploads a single file to the storage bucket.
 
+        Files of at least multipart_threshold bytes are uploaded in parts, see
+        __put. The metadata also includes the SHA-256 "checksum" of the content.
+
         Args:
             file (FileStorage): The file to upload.
             path (str, optional): The directory path for storing the file. Defaults to "".
@@ -199,42 +374,152 @@ class StorageServices(AbstractStorageServices):
         uploaded_file = {}
         if size > 0:
             try:
-                self.storage.put_object(
-                    bucket_name=self.bucket_name,
-                    object_name=filename,
-                    data=file.stream,
-                    length=size,
-                    content_type=file.content_type,
-                )
+                checksum = self.__put(filename, file, size)
                 uploaded_file = {
                     "path": filename,
                     "filetype": file.mimetype,
                     "filesize": size,
                     "title": title,
                     "is_link": False,
+                    "checksum": checksum,
                 }
             except MaxRetryError as e:
                 uploaded_file = None
                 print("No se pudo establecer conexion con minio. Error: ", e)
+            except (HTTPError, S3Error, ServerError) as e:
+                uploaded_file = None
+                print("No se pudo subir el archivo a minio. Error: ", e)
 
         return uploaded_file
 
-    def upload_batch(self, files: List[FileStorage], path: str = "") -> FilesType:
-        """Uploads a batch of files to the storage bucket.
+    def upload_document(self, file: FileStorage, title: str = "") -> Dict | None:
+        """Uploads a document under its content hash, skipping contents already stored.
+
+        The document is hashed from the local upload buffer first. If an object
+        with the same SHA-256 already exists under CONTENT_PATH the upload is
+        skipped, so a document shared by many entities is stored and sent
+        once. The files referencing the same content share its path, see
+        unreferenced_paths for how deletions account for that. The path stays
+        locked against deletions until the current transaction ends, so the
+        file referencing it must be added in that transaction.
+
+        Args:
+            file (FileStorage): The document to upload.
+            title (str, optional): The title of the document. Defaults to "".
+
+        Returns:
+            dict: Metadata of the uploaded document or None if an error occurs.
+        """
+        file.seek(0, os.SEEK_END)
+        size = file.tell()
+        file.seek(0)
+        if not size:
+            return {}
+
+        digest = sha256()
+        for chunk in iter(lambda: file.stream.read(self.STREAM_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        file.seek(0)
+        checksum = digest.hexdigest()
+        filename = self.__construct_path(self.CONTENT_PATH, f"{checksum[:2]}/{checksum}")
+
+        lock_paths([filename])
+        try:
+            if self.stat_file(filename) is None:
+                self.__put(filename, file, size)
+        except MaxRetryError as e:
+            print("No se pudo establecer conexion con minio. Error: ", e)
+            return None
+        except (HTTPError, S3Error, ServerError) as e:
+            print("No se pudo subir el archivo a minio. Error: ", e)
+            return None
+
+        return {
+            "path": filename,
+            "filetype": file.mimetype,
+            "filesize": size,
+            "title": title,
+            "is_link": False,
+            "checksum": checksum,
+            "filename": original_filename(file),
+        }
+
+    def __put(self, filename: str, file: FileStorage, size: int) -> str:
+        """Uploads the content of a file, in parts if it is at least multipart_threshold bytes.
+
+        Multipart uploads send one part of part_size bytes at a time, so only
+        that part is held in memory whatever the size of the file. The Minio
+        client retries each request, parts included, on connection errors and
+        server errors, and aborts the upload if a part keeps failing.
+
+        Args:
+            filename (str): The name of the object to create.
+            file (FileStorage): The file to upload.
+            size (int): The size of the file in bytes.
+
+        Returns:
+            str: The SHA-256 hex digest of the uploaded content.
+        """
+        stream = _HashingReader(file.stream)
+        self.storage.put_object(
+            bucket_name=self.bucket_name,
+            object_name=filename,
+            data=stream,
+            length=size,
+            content_type=file.content_type or "application/octet-stream",
+            part_size=self.part_size if size >= self.multipart_threshold else max(size, MIN_PART_SIZE),
+            num_parallel_uploads=1,
+        )
+        return stream.hexdigest()
+
+    def upload_batch(
+        self, files: List[FileStorage], path: str = "", max_workers: int | None = None
+    ) -> List[FileType | None]:
+        """Uploads a batch of files to the storage bucket concurrently.
+
+        The files are uploaded by a bounded thread pool, so the batch takes about
+        as long as its slowest uploads instead of the sum of all of them. A failed
+        upload does not abort the rest of the batch.
 
         Args:
             files (List[FileStorage]): List of files to upload.
             path (str, optional): The directory path for storing the files. Defaults to "".
+            max_workers (int | None, optional): Maximum number of concurrent uploads.
+                Defaults to the STORAGE_UPLOAD_WORKERS setting.
+
+        Returns:
+            list: Metadata of the uploaded files in input order, with None for
+                each file that could not be uploaded.
+        """
+        if not isinstance(files, list):
+            return []
+
+        files = [file for file in files if file and file.filename.strip()]
+        if not files:
+            return []
+
+        workers = max(1, min(max_workers or self.upload_workers, len(files)))
+        if workers == 1:
+            return [self.__upload_safely(file, path) for file in files]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda file: self.__upload_safely(file, path), files))
+
+    def __upload_safely(self, file: FileStorage, path: str) -> FileType | None:
+        """Uploads a single file of a batch, reporting its failure instead of raising it.
+
+        Args:
+            file (FileStorage): The file to upload.
+            path (str): The directory path for storing the file.
 
         Returns:
-            list: Metadata of the uploaded files.
+            dict | None: Metadata of the uploaded file or None if an error occurs.
         """
-        uploaded_files = {}
-        if isinstance(files, list):
-            uploaded_files = [
-                self.upload_file(file, path) for file in files if file and file.filename.strip()
-            ]
-        return uploaded_files
+        try:
+            return self.upload_file(file, path)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"No se pudo subir el archivo {file.filename}. Error: ", e)
+            return None
 
     def get_file(self, path: str, filename: str):
         """Retrieves a file from storage.
@@ -246,28 +531,206 @@ class StorageServices(AbstractStorageServices):
         Returns:
             The file data.
         """
-        response: HTTPResponse
+        response: HTTPResponse = self.storage.get_object(
+            self.bucket_name,
+            self.__construct_path(path=path, filename=filename),
+        )
         try:
-            response = self.storage.get_object(
-                self.bucket_name,
-                self.__construct_path(path=path, filename=filename),
-            )
+            return response.data
         finally:
             response.close()
             response.release_conn()
-        return response.data
-
 
     def get_profile_image(self, filename: str):
-        response: HTTPResponse
-        if filename == None:
-            filename='users/default_profile_image.png'
-        response = self.storage.get_object(
+        """Retrieves a profile image from storage.
+
+        Args:
+            filename (str): The name of the file, or None for the default profile image.
+
+        Returns:
+            bytes: The profile image data.
+        """
+        response: HTTPResponse = self.storage.get_object(
             self.bucket_name,
-            filename,
+            filename or self.DEFAULT_PROFILE_IMAGE,
         )
-        return response.data
-    
+        try:
+            return response.data
+        finally:
+            response.close()
+            response.release_conn()
+
+    def upload_profile_image(self, file: FileStorage, path: str = "") -> Dict | None:
+        """Uploads a profile image together with its thumbnail.
+
+        The thumbnail is generated once at upload time, so serving profile
+        photos never has to transfer or resize the original image.
+
+        Args:
+            file (FileStorage): The image to upload.
+            path (str, optional): The directory path for storing the image. Defaults to "".
+
+        Returns:
+            dict | None: Metadata of the uploaded image or None if an error occurs.
+        """
+        uploaded_file = self.upload_file(file, path)
+        if not uploaded_file:
+            return uploaded_file
+
+        file.seek(0)
+        thumbnail = make_thumbnail(file.read())
+        if thumbnail:
+            self.__save_thumbnail(uploaded_file["path"], thumbnail)
+        return uploaded_file
+
+    def delete_profile_image(self, filename: str) -> bool:
+        """Deletes a profile image together with its thumbnail.
+
+        Args:
+            filename (str): The name of the image.
+
+        Returns:
+            bool: True if deletion is successful, False otherwise.
+        """
+        self.image_cache.invalidate(thumbnail_path(filename))
+        return self.delete_batch([filename, thumbnail_path(filename)])
+
+    def get_profile_thumbnail(self, filename: str | None) -> Dict | None:
+        """Retrieves the thumbnail of a profile image.
+
+        Thumbnails are served from the in-memory cache when possible. Images
+        uploaded without a thumbnail, like the default profile image, get
+        one generated and stored on their first request. Images Pillow cannot
+        read are served as they are.
+
+        Args:
+            filename (str | None): The name of the image, or None for the default profile image.
+
+        Returns:
+            dict | None: The keys "data", "etag" and "content_type", or None if the image does not exist.
+        """
+        filename = filename or self.DEFAULT_PROFILE_IMAGE
+        path = thumbnail_path(filename)
+        image = self.image_cache.get(path)
+        if image is not None:
+            return image
+
+        try:
+            image = self.__image_entry(self.get_profile_image(path), THUMBNAIL_CONTENT_TYPE)
+        except S3Error:
+            image = None
+        except MaxRetryError as e:
+            print("No se pudo establecer conexion con minio. Error: ", e)
+            return None
+
+        if image is None:
+            metadata = self.stat_file(filename)
+            if metadata is None:
+                return None
+            try:
+                original = self.get_profile_image(filename)
+            except S3Error:
+                return None
+            except MaxRetryError as e:
+                print("No se pudo establecer conexion con minio. Error: ", e)
+                return None
+            thumbnail = make_thumbnail(original)
+            if thumbnail:
+                self.__save_thumbnail(filename, thumbnail)
+                return self.image_cache.get(path)
+            image = self.__image_entry(original, metadata["content_type"])
+
+        self.image_cache.set(path, image)
+        return image
+
+    def __save_thumbnail(self, filename: str, thumbnail: bytes) -> None:
+        """Stores the thumbnail of an image in the bucket and in the image cache.
+
+        Args:
+            filename (str): The name of the original image.
+            thumbnail (bytes): The thumbnail data.
+        """
+        path = thumbnail_path(filename)
+        try:
+            self.storage.put_object(
+                bucket_name=self.bucket_name,
+                object_name=path,
+                data=BytesIO(thumbnail),
+                length=len(thumbnail),
+                content_type=THUMBNAIL_CONTENT_TYPE,
+            )
+        except MaxRetryError as e:
+            print("No se pudo establecer conexion con minio. Error: ", e)
+        except S3Error as e:
+            print("No se pudo guardar la miniatura de la imagen. Error: ", e)
+        self.image_cache.set(path, self.__image_entry(thumbnail, THUMBNAIL_CONTENT_TYPE))
+
+    @staticmethod
+    def __image_entry(data: bytes, content_type: str) -> Dict:
+        """Builds the image cache entry of an image.
+
+        Args:
+            data (bytes): The image data.
+            content_type (str): The MIME type of the image.
+
+        Returns:
+            dict: The keys "data", "etag" and "content_type".
+        """
+        return {"data": data, "etag": md5(data, usedforsecurity=False).hexdigest(), "content_type": content_type}
+
+    def stat_file(self, filename: str) -> Dict | None:
+        """Retrieves the metadata of a file in storage.
+
+        Args:
+            filename (str): The full name of the file.
+
+        Returns:
+            dict | None: The keys "size", "etag", "content_type" and "last_modified",
+                or None if the file does not exist or the storage is unreachable.
+        """
+        try:
+            stat = self.storage.stat_object(self.bucket_name, filename)
+        except S3Error:
+            return None
+        except MaxRetryError as e:
+            print("No se pudo establecer conexion con minio. Error: ", e)
+            return None
+
+        return {
+            "size": stat.size,
+            "etag": stat.etag,
+            "content_type": stat.content_type or "application/octet-stream",
+            "last_modified": stat.last_modified,
+        }
+
+    def stream_file(self, filename: str, offset: int = 0, length: int | None = None) -> Iterator[bytes]:
+        """Retrieves a file, or a byte range of it, as an iterator of fixed-size chunks.
+
+        The object is requested eagerly, so a missing file raises here, while its
+        content is only read from MinIO as the iterator is consumed. The connection
+        is released once the iterator is exhausted or closed.
+
+        Args:
+            filename (str): The full name of the file.
+            offset (int, optional): The first byte to read. Defaults to 0.
+            length (int | None, optional): The number of bytes to read. Defaults to the rest of the file.
+
+        Returns:
+            Iterator[bytes]: The chunks of the file, of at most STREAM_CHUNK_SIZE bytes.
+        """
+        response: HTTPResponse = self.storage.get_object(
+            self.bucket_name, filename, offset=offset, length=length or 0
+        )
+
+        def chunks():
+            try:
+                yield from response.stream(self.STREAM_CHUNK_SIZE)
+            finally:
+                response.close()
+                response.release_conn()
+
+        return chunks()
+
     def presigned_download_url(self, filename: str) -> str:
         """Generates a presigned URL for downloading a file.
 
@@ -329,18 +792,564 @@ class StorageServices(AbstractStorageServices):
         Args:
             filenames (List[str]): The names of the files to delete.
 
+        Returns:
+            bool: True if every file was deleted, False otherwise.
+        """
+        errors = self.bulk_delete(filenames)
+        for filename, message in errors.items():
+            print(f"No se pudo eliminar el archivo {filename}. Error: ", message)
+        return not errors
+
+    def bulk_delete(self, filenames: List[str]) -> Dict[str, str]:
+        """Deletes a batch of files from storage, reporting the errors per file.
+
+        The files are removed with multi-object delete requests of up to
+        DELETE_BATCH_SIZE keys each, so deleting an entity with dozens of
+        documents takes a single round trip instead of one per document.
+
+        Args:
+            filenames (List[str]): The names of the files to delete.
+
+        Returns:
+            Dict[str, str]: The error message of each file that could not be deleted.
+                An empty dict means every file was deleted.
+        """
+        filenames = list(dict.fromkeys(filenames))
+        if not filenames:
+            return {}
+
+        errors: Dict[str, str] = {}
+        for start in range(0, len(filenames), self.DELETE_BATCH_SIZE):
+            chunk = filenames[start:start + self.DELETE_BATCH_SIZE]
+            try:
+                for error in self.storage.remove_objects(
+                    self.bucket_name, [DeleteObject(filename) for filename in chunk]
+                ):
+                    errors[error.name] = f"{error.code}: {error.message}"
+            except MaxRetryError as e:
+                print("No se pudo establecer conexion con minio. Error: ", e)
+                errors.update({filename: str(e) for filename in chunk})
+        return errors
+
+    def __construct_path(self, path: str = "", filename: str = "") -> str:
+        """Constructs a file path by concatenating the path and filename.
+
+        Args:
+            path (str, optional): The directory path. Defaults to "".
+            filename (str, optional): The file name. Defaults to "".
+
+        Returns:
+            str: The constructed file path.
+        """
+        return f"{path}{filename}" if path.endswith("/") else f"{path}/{filename}"
+
+
+
+class LocalStorageServices(AbstractStorageServices):
+    """
+    Implementation of storage services on the local filesystem.
+
+    The content of every file is stored once under "objects/", named after its
+    SHA-256 digest, and each stored path under "files/" is a hard link to it.
+    Identical uploads share their content and the link count of an object
+    tells how many paths still reference it. Every write goes to a temporary
+    file that is atomically moved into place, so readers never see a partial
+    file.
+
+    Attributes:
+        STREAM_CHUNK_SIZE (int): Size in bytes of the chunks read and yielded when streaming.
+        CONTENT_PATH (str): The directory path of the uploaded documents.
+        root (str): The directory holding the stored files.
+        image_cache (ImageCache): The cache of profile thumbnails.
+
+    Methods:
+        upload_file: Uploads a file to the storage directory.
+        upload_document: Uploads a document, its content is shared with identical uploads.
+        upload_batch: Uploads a batch of files to the storage directory.
+        get_file: Retrieves a file from storage.
+        stat_file: Retrieves the metadata of a file in storage.
+        stream_file: Retrieves a file, or a byte range of it, in chunks.
+        presigned_download_url: Generates a download URL for a file.
+        presigned_upload_url: Not supported, always returns an empty string.
+        delete_file: Deletes a file from storage.
+        delete_batch: Deletes a batch of files from storage.
+        bulk_delete: Deletes a batch of files from storage, reporting the errors per file.
+        upload_profile_image: Uploads a profile image together with its thumbnail.
+        delete_profile_image: Deletes a profile image together with its thumbnail.
+        get_profile_thumbnail: Retrieves the thumbnail of a profile image.
+    """
+
+    STREAM_CHUNK_SIZE = 64 * 1024
+    CONTENT_PATH = "content/"
+
+    def __init__(self, image_cache: ImageCache = profile_image_cache):
+        """Initializes the LocalStorageServices class, creating the storage directories if needed.
+
+        Args:
+            image_cache (ImageCache, optional): The cache of profile thumbnails.
+                Defaults to the shared cache.
+        """
+        self.root = os.path.abspath(
+            current_app.config.get("STORAGE_LOCAL_ROOT")
+            or os.path.join(current_app.instance_path, "storage")
+        )
+        self.image_cache = image_cache
+        self.__objects = os.path.join(self.root, "objects")
+        self.__files = os.path.join(self.root, "files")
+        self.__meta = os.path.join(self.root, "meta")
+        self.__tmp = os.path.join(self.root, "tmp")
+        for directory in (self.__objects, self.__files, self.__meta, self.__tmp):
+            os.makedirs(directory, exist_ok=True)
+
+    def upload_file(self, file: FileStorage, path: str = "", title: str = ""):
+        """Uploads a single file to the storage directory.
+
+        Args:
+            file (FileStorage): The file to upload.
+            path (str, optional): The directory path for storing the file. Defaults to "".
+            title (str, optional): The title or name of the file. Defaults to "".
+
+        Returns:
+            dict: Metadata of the uploaded file or None if an error occurs.
+        """
+        ulid: str = ULID().from_datetime(datetime.now()).hex
+        filename = self.__construct_path(path, f"{ulid}{title}")
+        file.seek(0, os.SEEK_END)
+        if not file.tell():
+            return {}
+        file.seek(0)
+        try:
+            stored = self.__store(filename, file.stream, file.content_type)
+        except (OSError, ValueError) as e:
+            print("No se pudo guardar el archivo. Error: ", e)
+            return None
+
+        return {
+            "path": filename,
+            "filetype": file.mimetype,
+            "filesize": stored["size"],
+            "title": title,
+            "is_link": False,
+            "checksum": stored["checksum"],
+        }
+
+    def upload_document(self, file: FileStorage, title: str = "") -> Dict | None:
+        """Uploads a document.
+
+        Every stored path already shares its content with identical uploads,
+        so each document keeps a path of its own and deleting it never
+        affects other documents.
+
+        Args:
+            file (FileStorage): The document to upload.
+            title (str, optional): The title of the document. Defaults to "".
+
+        Returns:
+            dict: Metadata of the uploaded document or None if an error occurs.
+        """
+        uploaded_file = self.upload_file(file, self.CONTENT_PATH, title)
+        if uploaded_file:
+            uploaded_file["filename"] = original_filename(file)
+        return uploaded_file
+
+    def upload_batch(
+        self, files: List[FileStorage], path: str = "", max_workers: int | None = None
+    ) -> List[FileType | None]:
+        """Uploads a batch of files to the storage directory.
+
+        Local writes are not worth a thread pool, so max_workers is ignored.
+
+        Args:
+            files (List[FileStorage]): List of files to upload.
+            path (str, optional): The directory path for storing the files. Defaults to "".
+            max_workers (int | None, optional): Ignored.
+
+        Returns:
+            list: Metadata of the uploaded files in input order, with None for
+                each file that could not be uploaded.
+        """
+        if not isinstance(files, list):
+            return []
+        return [self.upload_file(file, path) for file in files if file and file.filename.strip()]
+
+    def get_file(self, path: str, filename: str):
+        """Retrieves a file from storage.
+
+        Args:
+            path (str): The directory path to the file.
+            filename (str): The name of the file.
+
+        Returns:
+            The file data.
+        """
+        with open(self.__file_path(self.__construct_path(path=path, filename=filename)), "rb") as f:
+            return f.read()
+
+    def get_profile_image(self, filename: str):
+        """Retrieves a profile image from storage.
+
+        Args:
+            filename (str): The name of the file, or None for the default profile image.
+
+        Returns:
+            bytes: The profile image data.
+        """
+        with open(self.__file_path(filename or self.DEFAULT_PROFILE_IMAGE), "rb") as f:
+            return f.read()
+
+    def upload_profile_image(self, file: FileStorage, path: str = "") -> Dict | None:
+        """Uploads a profile image together with its thumbnail.
+
+        Args:
+            file (FileStorage): The image to upload.
+            path (str, optional): The directory path for storing the image. Defaults to "".
+
+        Returns:
+            dict | None: Metadata of the uploaded image or None if an error occurs.
+        """
+        uploaded_file = self.upload_file(file, path)
+        if not uploaded_file:
+            return uploaded_file
+
+        file.seek(0)
+        thumbnail = make_thumbnail(file.read())
+        if thumbnail:
+            self.__store(thumbnail_path(uploaded_file["path"]), BytesIO(thumbnail), THUMBNAIL_CONTENT_TYPE)
+        return uploaded_file
+
+    def delete_profile_image(self, filename: str) -> bool:
+        """Deletes a profile image together with its thumbnail.
+
+        Args:
+            filename (str): The name of the image.
+
         Returns:
             bool: True if deletion is successful, False otherwise.
         """
+        self.image_cache.invalidate(thumbnail_path(filename))
+        return self.delete_batch([filename, thumbnail_path(filename)])
+
+    def get_profile_thumbnail(self, filename: str | None) -> Dict | None:
+        """Retrieves the thumbnail of a profile image.
+
+        Thumbnails missing from the storage directory are generated and stored
+        on their first request. Images Pillow cannot read are served as they are.
+
+        Args:
+            filename (str | None): The name of the image, or None for the default profile image.
+
+        Returns:
+            dict | None: The keys "data", "etag" and "content_type", or None if the image does not exist.
+        """
+        filename = filename or self.DEFAULT_PROFILE_IMAGE
+        path = thumbnail_path(filename)
+        image = self.image_cache.get(path)
+        if image is not None:
+            return image
+
+        source = path
+        if self.stat_file(path) is None:
+            if self.stat_file(filename) is None:
+                return None
+            thumbnail = make_thumbnail(self.get_profile_image(filename))
+            if thumbnail:
+                self.__store(path, BytesIO(thumbnail), THUMBNAIL_CONTENT_TYPE)
+            else:
+                source = filename
+
+        metadata = self.stat_file(source)
+        image = {
+            "data": self.get_profile_image(source),
+            "etag": metadata["etag"],
+            "content_type": metadata["content_type"],
+        }
+        self.image_cache.set(path, image)
+        return image
+
+    def stat_file(self, filename: str) -> Dict | None:
+        """Retrieves the metadata of a file in storage.
+
+        Args:
+            filename (str): The full name of the file.
+
+        Returns:
+            dict | None: The keys "size", "etag", "content_type" and "last_modified",
+                or None if the file does not exist.
+        """
         try:
-            for filename in filenames:
-                self.storage.remove_object(
-                    self.bucket_name, filename
-                )
-            return True
-        except MaxRetryError as e:
-            print("No se pudo establecer conexion con minio. Error: ", e)
-            return False
+            stat = os.stat(self.__file_path(filename))
+            meta = self.__read_meta(filename)
+        except (OSError, ValueError):
+            return None
+
+        return {
+            "size": stat.st_size,
+            "etag": meta["checksum"],
+            "content_type": meta.get("content_type") or "application/octet-stream",
+            "last_modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).replace(microsecond=0),
+        }
+
+    def stream_file(self, filename: str, offset: int = 0, length: int | None = None) -> Iterator[bytes]:
+        """Retrieves a file, or a byte range of it, as an iterator of chunks.
+
+        Whole files are handed to the WSGI server as a file wrapper when
+        serving a request, which lets servers that support it send the file
+        with zero-copy sendfile.
+
+        Args:
+            filename (str): The full name of the file.
+            offset (int, optional): The first byte to read. Defaults to 0.
+            length (int | None, optional): The number of bytes to read. Defaults to the rest of the file.
+
+        Returns:
+            Iterator[bytes]: The chunks of the file.
+        """
+        file = open(self.__file_path(filename), "rb")  # pylint: disable=consider-using-with
+        size = os.fstat(file.fileno()).st_size
+        if offset == 0 and (length is None or length >= size) and has_request_context():
+            return wrap_file(request.environ, file, self.STREAM_CHUNK_SIZE)
+
+        file.seek(offset)
+        remaining = size - offset if length is None else length
+
+        def chunks():
+            nonlocal remaining
+            try:
+                while remaining > 0:
+                    chunk = file.read(min(self.STREAM_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+            finally:
+                file.close()
+
+        return chunks()
+
+    def presigned_download_url(self, filename: str) -> str:
+        """Generates a download URL for a file.
+
+        Local files cannot be presigned, so the URL points to the download
+        endpoint of the application, which checks the permissions of the user.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            str: The download URL, or an empty string outside of a request.
+        """
+        if not has_request_context():
+            return ""
+        return url_for("index_bp.download_url", path=filename)
+
+    def presigned_upload_url(self, filename: str, path: str = "") -> str:
+        """Direct uploads are not supported by the local storage.
+
+        Args:
+            filename (str): The name of the file.
+            path (str, optional): The directory path for storing the file. Defaults to "".
+
+        Returns:
+            str: Always an empty string.
+        """
+        return ""
+
+    def delete_file(self, filename: str) -> bool:
+        """Deletes a file from storage.
+
+        The content of the file is removed once no other path references it.
+
+        Args:
+            filename (str): The name of the file.
+
+        Returns:
+            bool: True if deletion is successful, False otherwise.
+        """
+        return filename not in self.bulk_delete([filename])
+
+    def delete_batch(self, filenames: List[str]) -> bool:
+        """Deletes a batch of files from storage.
+
+        Args:
+            filenames (List[str]): The names of the files to delete.
+
+        Returns:
+            bool: True if every file was deleted, False otherwise.
+        """
+        errors = self.bulk_delete(filenames)
+        for filename, message in errors.items():
+            print(f"No se pudo eliminar el archivo {filename}. Error: ", message)
+        return not errors
+
+    def bulk_delete(self, filenames: List[str]) -> Dict[str, str]:
+        """Deletes a batch of files from storage, reporting the errors per file.
+
+        Missing files are not reported as errors, like in object storage.
+
+        Args:
+            filenames (List[str]): The names of the files to delete.
+
+        Returns:
+            Dict[str, str]: The error message of each file that could not be deleted.
+        """
+        errors: Dict[str, str] = {}
+        for filename in dict.fromkeys(filenames):
+            try:
+                self.__unlink(filename)
+            except (OSError, ValueError) as e:
+                errors[filename] = str(e)
+        return errors
+
+    def __store(self, filename: str, stream, content_type: str | None) -> Dict:
+        """Stores the content of a stream under a path, hashing it while it is written.
+
+        Args:
+            filename (str): The full name of the file.
+            stream: The binary stream to store.
+            content_type (str | None): The MIME type of the file.
+
+        Returns:
+            dict: The keys "size" and "checksum" of the stored content.
+        """
+        target = self.__file_path(filename)
+        digest = sha256()
+        size = 0
+        fd, temporary = tempfile.mkstemp(dir=self.__tmp)
+        try:
+            with os.fdopen(fd, "wb") as output:
+                for chunk in iter(lambda: stream.read(self.STREAM_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    output.write(chunk)
+                    size += len(chunk)
+                output.flush()
+                os.fsync(output.fileno())
+
+            checksum = digest.hexdigest()
+            blob = self.__object_path(checksum)
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            link = f"{temporary}.link"
+            try:
+                os.link(blob, link)
+            except FileNotFoundError:
+                os.replace(temporary, blob)
+                os.link(blob, link)
+
+            previous = self.__read_meta(filename) if os.path.exists(target) else None
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(link, target)
+            self.__write_meta(filename, {"checksum": checksum, "content_type": content_type})
+            if previous and previous["checksum"] != checksum:
+                self.__release_object(previous["checksum"])
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+        return {"size": size, "checksum": checksum}
+
+    def __unlink(self, filename: str) -> None:
+        """Removes a path, and its content if no other path references it.
+
+        Args:
+            filename (str): The full name of the file.
+        """
+        target = self.__file_path(filename)
+        if not os.path.exists(target):
+            return
+        meta = self.__read_meta(filename)
+        os.remove(target)
+        os.remove(self.__meta_path(filename))
+        self.__release_object(meta["checksum"])
+
+    def __release_object(self, checksum: str) -> None:
+        """Removes a content object once no path links to it anymore.
+
+        Args:
+            checksum (str): The SHA-256 digest of the content.
+        """
+        blob = self.__object_path(checksum)
+        try:
+            if os.stat(blob).st_nlink <= 1:
+                os.remove(blob)
+        except FileNotFoundError:
+            pass
+
+    def __read_meta(self, filename: str) -> Dict:
+        """Reads the metadata stored for a path.
+
+        Args:
+            filename (str): The full name of the file.
+
+        Returns:
+            dict: The keys "checksum" and "content_type".
+        """
+        with open(self.__meta_path(filename), encoding="utf-8") as f:
+            return json.load(f)
+
+    def __write_meta(self, filename: str, meta: Dict) -> None:
+        """Atomically writes the metadata of a path.
+
+        Args:
+            filename (str): The full name of the file.
+            meta (dict): The keys "checksum" and "content_type".
+        """
+        target = self.__meta_path(filename)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=self.__tmp)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(temporary, target)
+
+    def __object_path(self, checksum: str) -> str:
+        """Builds the location of a content object, fanned out by the first bytes of its digest.
+
+        Args:
+            checksum (str): The SHA-256 digest of the content.
+
+        Returns:
+            str: The location of the object.
+        """
+        return os.path.join(self.__objects, checksum[:2], checksum[2:4], checksum)
+
+    def __file_path(self, filename: str) -> str:
+        """Builds the location of a stored path, rejecting paths outside of the storage directory.
+
+        Args:
+            filename (str): The full name of the file.
+
+        Returns:
+            str: The location of the file.
+        """
+        return self.__resolve(self.__files, filename)
+
+    def __meta_path(self, filename: str) -> str:
+        """Builds the location of the metadata of a stored path.
+
+        Args:
+            filename (str): The full name of the file.
+
+        Returns:
+            str: The location of the metadata.
+        """
+        return self.__resolve(self.__meta, filename) + ".json"
+
+    @staticmethod
+    def __resolve(base: str, filename: str) -> str:
+        """Joins a stored path to a base directory, rejecting paths that escape it.
+
+        Args:
+            base (str): The base directory.
+            filename (str): The stored path.
+
+        Returns:
+            str: The joined location.
+
+        Raises:
+            ValueError: If the path escapes the base directory.
+        """
+        location = os.path.normpath(os.path.join(base, filename.lstrip("/")))
+        if not location.startswith(base + os.sep):
+            raise ValueError(f"Ruta de archivo invalida: {filename}")
+        return location
 
     def __construct_path(self, path: str = "", filename: str = "") -> str:
         """Constructs a file path by concatenating the path and filename.
@@ -353,4 +1362,3 @@ class StorageServices(AbstractStorageServices):
             str: The constructed file path.
         """
         return f"{path}{filename}" if path.endswith("/") else f"{path}/{filename}"
-
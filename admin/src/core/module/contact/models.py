@@ -1,6 +1,8 @@
 from datetime import datetime
 from enum import Enum as pyEnum
 from src.core.database import db
+from src.core.module.common.search import trigram_indexes
+from src.core.module.common.filters import Filter, FilterSpec
 
 class MessageStateEnum(pyEnum):
     PENDING = "Pendiente"
@@ -15,6 +17,11 @@ class Message(db.Model):
     """
 
     __tablename__ = 'messages'
+    __filters__ = FilterSpec({
+        'is_deleted': Filter(),
+        'status': Filter(),
+    })
+    __table_args__ = trigram_indexes('messages', 'name', 'email')
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False)
@@ -5,6 +5,7 @@ from datetime import datetime
 from src.core.database import db as database
 from src.core.module.contact.models import Message, MessageStateEnum
 from src.core.module.common.repositories import apply_filters, apply_search_criteria
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
 from .mappers import ContactMapper as Mapper
 
 class AbstractContactRepository:
@@ -19,6 +20,9 @@ class AbstractContactRepository:
             per_page: int,
             search_query: Dict = None,
             order_by: list = None,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
     ):
         """
         Retrieve a paginated list of messages.
@@ -28,6 +32,9 @@ class AbstractContactRepository:
             per_page (int): The number of messages per page.
             search_query (Dict, optional): The search query to filter messages.
             order_by (list, optional): The order by criteria.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
 
         Returns:
             A paginated list of messages.
@@ -124,6 +131,9 @@ class ContactRepository(AbstractContactRepository):
             per_page: int,
             search_query: Dict = None,
             order_by: List = None,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
     ):
         """
         Retrieve a paginated list of messages.
@@ -133,6 +143,9 @@ class ContactRepository(AbstractContactRepository):
             per_page (int): The number of messages per page.
             search_query (Dict, optional): The search query to filter messages.
             order_by (List, optional): The order by criteria.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
 
         Returns:
             A paginated list of messages.
@@ -141,21 +154,12 @@ class ContactRepository(AbstractContactRepository):
 
         query = Message.query
 
-        # Handle date range and state filters
-        if search_query and "filters" in search_query:
-            filters = search_query["filters"]
-
-        if "status" in filters and not filters["status"]:
-                del filters["status"]
-
-        search_query["filters"] = filters
-
-        query = apply_filters(Message, query, search_query, order_by)
         if not order_by:
-            query = query.order_by(Message.inserted_at.desc()) 
-        return query.paginate(
-            page=page, per_page=per_page, error_out=False, max_per_page=max_per_page
-        )
+            order_by = [("inserted_at", "desc")]
+        query = apply_filters(Message, query, search_query, order_by)
+        if keyset:
+            return keyset_paginate(Message, query, order_by, min(per_page, max_per_page), cursor)
+        return paginate(Message, query, page, per_page, max_per_page, count)
 
     def __get_by_id(self, message_id: int) -> Message:
         """
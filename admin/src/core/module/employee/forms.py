@@ -24,7 +24,7 @@ from wtforms.fields import (
 )
 
 from src.core.module.common.validators import IsValidDniNumber
-from src.core.module.common import IsValidName
+from src.core.module.common import IsValidName, FULL_TEXT_FIELD
 from src.core.module.common.forms import (
     filetypes_message,
     allowed_filetypes,
@@ -246,6 +246,7 @@ class EmployeeSearchForm(BaseSearchForm):
             ("lastname", "Apellido"),
             ("dni", "DNI"),
             ("email", "Email"),
+            (FULL_TEXT_FIELD, "Todos los campos"),
         ]
 
         self.order_by.choices = [
@@ -17,6 +17,8 @@ from datetime import datetime
 from sqlalchemy.orm import column_property
 from src.core.database import db
 from src.core.module.common import AddressMixin, EmergencyContactMixin, PhoneMixin, File
+from src.core.module.common import search_vector_column, search_vector_index, trigram_indexes
+from src.core.module.common.filters import Filter, FilterSpec
 from src.core.module.employee.data import (
     ProfessionsEnum,
     JobPositionEnum as PositionEnum,
@@ -49,6 +51,15 @@ class Employee(db.Model, AddressMixin, PhoneMixin, EmergencyContactMixin):
     details.
     """
     __tablename__ = "employees"
+    __filters__ = FilterSpec({
+        "is_deleted": Filter(),
+        "position": Filter(),
+        "is_active": Filter(),
+    })
+    __table_args__ = (
+        search_vector_index("employees"),
+        *trigram_indexes("employees", "name", "lastname", "dni", "email"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(255), unique=True)
@@ -67,6 +78,7 @@ class Employee(db.Model, AddressMixin, PhoneMixin, EmergencyContactMixin):
     inserted_at = db.Column(db.DateTime, default=datetime.now)
     updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
     is_deleted = db.Column(db.Boolean, nullable=False, default=False)
+    search_vector = search_vector_column({"name": "A", "lastname": "A", "dni": "B", "email": "B"})
 
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
     user = db.relationship("User", backref=db.backref("employee", uselist=False))
@@ -17,8 +17,14 @@ from src.core.database import db as database
 from src.core.module.common.repositories import (
     apply_filters,
     apply_multiple_search_criteria,
-    apply_filter_criteria
+    apply_filter_criteria,
+    apply_loading_profile,
+    unreferenced_paths,
+    PROFILE_DETAIL,
+    PROFILE_EDIT,
 )
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
+from src.core.module.common.projections import Projection
 from src.core.module.common import AbstractStorageServices
 from src.core.module.charges.models import Charge
 from src.core.module.payment.models import Payment
@@ -68,6 +74,11 @@ class AbstractEmployeeRepository:
         max_per_page: int,
         search_query: Dict = None,
         order_by: list = None,
+        full_text: bool = False,
+        keyset: bool = False,
+        cursor: str | None = None,
+        count: str = COUNT_EXACT,
+        projected: bool = False,
     ) -> Pagination:
         """Retrieve a paginated list of employees.
 
@@ -77,6 +88,11 @@ class AbstractEmployeeRepository:
             max_per_page: Maximum allowed items per page.
             search_query: Optional search criteria.
             order_by: Optional sorting criteria.
+            full_text: Whether to run the search text as a ranked full-text search.
+            keyset: Whether to paginate by cursor instead of by page number.
+            cursor: The cursor of the page to retrieve in keyset mode.
+            count: The strategy to compute the total of the page, see paginate.
+            projected: Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             Pagination: Paginated employee results.
@@ -355,18 +371,40 @@ class EmployeeRepository(AbstractEmployeeRepository):
     providing actual database operations using SQLAlchemy.
     """
 
+    # Columns shown by the lists of employees
+    LIST_PROJECTION = Projection(
+        {
+            "id": Employee.id,
+            "name": Employee.name,
+            "lastname": Employee.lastname,
+            "dni": Employee.dni,
+            "email": Employee.email,
+            "position": Employee.position,
+            "job_condition": Employee.job_condition,
+            "is_active": Employee.is_active,
+            "start_date": Employee.start_date,
+            "inserted_at": Employee.inserted_at,
+            "updated_at": Employee.updated_at,
+        }
+    )
+
+    # Related entities read by EmployeeMapper.from_entity, with and without documents
+    LOADING_PROFILES = {
+        PROFILE_DETAIL: ("files",),
+        PROFILE_EDIT: (),
+    }
+
     def __init__(self, storage_services: AbstractStorageServices):
         """Initialize the repository with database connection."""
         super().__init__()
         self.db: SQLAlchemy = database
         self.storage_services = storage_services
 
-    def __get_by_id(self, employee_id: int) -> Employee:
-        """Internal method to retrieve an employee by ID."""
+    def __get_by_id(self, employee_id: int, profile: str | None = None) -> Employee:
+        """Internal method to retrieve an employee by ID, loading the related entities of a profile."""
 
-        return (
-            self.db.session.query(Employee).filter(Employee.id == employee_id).first()
-        )
+        query = self.db.session.query(Employee).filter(Employee.id == employee_id)
+        return apply_loading_profile(Employee, query, self.LOADING_PROFILES, profile).first()
 
     def __get_by_email(self, email: str) -> Employee | None:
         """Internal method to retrieve an employee by email."""
@@ -416,6 +454,11 @@ class EmployeeRepository(AbstractEmployeeRepository):
         max_per_page: int = 30,
         search_query: Dict = None,
         order_by: List = None,
+        full_text: bool = False,
+        keyset: bool = False,
+        cursor: str | None = None,
+        count: str = COUNT_EXACT,
+        projected: bool = False,
     ):
         """Retrieve a paginated list of employees with filtered search and ordering."""
 
@@ -423,16 +466,21 @@ class EmployeeRepository(AbstractEmployeeRepository):
         max_per_page = 30
         query = Employee.query
 
-        query = apply_filters(Employee, query, search_query, order_by)
+        query = apply_filters(Employee, query, search_query, order_by, full_text)
 
-        return query.paginate(
-            page=page, per_page=per_page, error_out=False, max_per_page=max_per_page
-        )
+        if projected:
+            query = self.LIST_PROJECTION.apply(query)
+
+        if keyset:
+            return keyset_paginate(Employee, query, order_by, min(per_page, max_per_page), cursor)
+
+        return paginate(Employee, query, page, per_page, max_per_page, count)
 
     def get_employee(self, employee_id, documents=True):
         """Retrieve a single employee by ID with optional documents inclusion."""
 
-        return Mapper.from_entity(self.__get_by_id(employee_id), documents=documents)
+        employee = self.__get_by_id(employee_id, PROFILE_DETAIL if documents else PROFILE_EDIT)
+        return Mapper.from_entity(employee, documents=documents)
 
     def update(self, employee_id: int, data: Dict) -> bool:
         """Update an employee's information."""
@@ -477,7 +525,9 @@ class EmployeeRepository(AbstractEmployeeRepository):
             return False
 
         files = EmployeeFile.query.filter_by(employee_id=employee_id)
-        minio_path_files = [f.path for f in files if not f.is_link]
+        minio_path_files = unreferenced_paths(
+            [f.path for f in files if not f.is_link], [f.id for f in files]
+        )
         if minio_path_files:
             success = self.storage_services.delete_batch(minio_path_files)
 
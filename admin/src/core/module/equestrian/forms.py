@@ -9,7 +9,7 @@ from wtforms.fields import (
 )
 from wtforms.validators import DataRequired, Length
 from src.core.module.common.validators import IsNumber
-from src.core.module.common import IsValidName
+from src.core.module.common import IsValidName, FULL_TEXT_FIELD
 from src.core.module.common.forms import BaseSearchForm, BaseManageDocumentsForm, DocumentsSearchForm
 from src.core.module.equestrian.models import JAEnum, FileTagEnum
 
@@ -142,6 +142,7 @@ class HorseSearchForm(BaseSearchForm):
         super().__init__(*args, **kwargs)
         self.search_by.choices = [
             ("name", "Nombre"),
+            (FULL_TEXT_FIELD, "Todos los campos"),
         ]
         self.order_by.choices = [
             ("id", "ID"),
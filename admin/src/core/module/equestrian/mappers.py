@@ -26,6 +26,8 @@ class HorseMapper:
             is_link=file_information.get("is_link"),
             filetype=file_information.get("filetype"),
             filesize=file_information.get("filesize"),
+            checksum=file_information.get("checksum"),
+            filename=file_information.get("filename"),
             tag=document_type,
         )
         return horse_file
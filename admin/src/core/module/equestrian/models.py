@@ -12,6 +12,8 @@ Models:
 """
 
 from src.core.module.common.models import File
+from src.core.module.common.search import search_vector_column, search_vector_index, trigram_indexes
+from src.core.module.common.filters import Filter, FilterSpec
 from src.core.database import db
 from datetime import datetime
 from enum import Enum as pyEnum
@@ -54,9 +56,15 @@ class Horse(db.Model):
             is_archived (bool): Indicates if the horse is deleted.
             inserted_at (datetime.datetime): The timestamp when the horse was inserted.
             updated_at (datetime.datetime): The timestamp when the horse was last updated.
+            search_vector (str): The generated full-text search document of the horse.
         """
 
     __tablename__ = 'horses'
+    __filters__ = FilterSpec({
+        'is_archived': Filter(),
+        'ja_type': Filter(),
+    })
+    __table_args__ = (search_vector_index('horses'), *trigram_indexes('horses', 'name'))
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -76,6 +84,8 @@ class Horse(db.Model):
     inserted_at = db.Column(db.DateTime, default=datetime.now)
     updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
 
+    search_vector = search_vector_column({"name": "A", "breed": "B", "coat": "C"})
+
 
 class HorseTrainers(db.Model):
     """
@@ -2,7 +2,15 @@ from abc import abstractmethod
 from typing import List, Dict
 
 from src.core.module.common import AbstractStorageServices
-from src.core.module.common.repositories import apply_filters
+from src.core.module.common.repositories import (
+    apply_filters,
+    apply_loading_profile,
+    unreferenced_paths,
+    PROFILE_DETAIL,
+    PROFILE_EDIT,
+)
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
+from src.core.module.common.projections import Projection
 from src.core.module.equestrian.models import Horse, HorseTrainers, HorseFile
 from src.core.database import db as database
 from src.core.module.employee.models import Employee
@@ -40,6 +48,11 @@ class AbstractEquestrianRepository:
             max_per_page: int = 10,
             search_query: Dict = None,
             order_by: list = None,
+            full_text: bool = False,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
+            projected: bool = False,
     ):
         """
         Get a paginated list of horses.
@@ -50,6 +63,11 @@ class AbstractEquestrianRepository:
             max_per_page (int): The maximum number of items per page.
             search_query (Dict): The search query parameters.
             order_by (list): The order by parameters.
+            full_text (bool): Whether to run the search text as a ranked full-text search.
+            keyset (bool): Whether to paginate by cursor instead of by page number.
+            cursor (str | None): The cursor of the page to retrieve in keyset mode.
+            count (str): The strategy to compute the total of the page, see paginate.
+            projected (bool): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             Pagination: The paginated list of horses.
@@ -261,6 +279,29 @@ class EquestrianRepository(AbstractEquestrianRepository):
     """
     Repository for equestrian operations.
     """
+
+    # Columns shown by the lists of horses
+    LIST_PROJECTION = Projection(
+        {
+            "id": Horse.id,
+            "name": Horse.name,
+            "breed": Horse.breed,
+            "birth_date": Horse.birth_date,
+            "coat": Horse.coat,
+            "sex": Horse.sex,
+            "admission_date": Horse.admission_date,
+            "assigned_facility": Horse.assigned_facility,
+            "ja_type": Horse.ja_type,
+            "is_donation": Horse.is_donation,
+        }
+    )
+
+    # Related entities read by HorseMapper.from_entity, with and without the documents of the horse
+    LOADING_PROFILES = {
+        PROFILE_DETAIL: ("files", "trainers.employee.files"),
+        PROFILE_EDIT: ("trainers.employee.files",),
+    }
+
     def __init__(self):
         super().__init__()
         self.db = database
@@ -287,6 +328,11 @@ class EquestrianRepository(AbstractEquestrianRepository):
             max_per_page: int = 10,
             search_query: Dict = None,
             order_by: List = None,
+            full_text: bool = False,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
+            projected: bool = False,
     ):
         """
         Get a paginated list of horses.
@@ -297,17 +343,26 @@ class EquestrianRepository(AbstractEquestrianRepository):
             max_per_page (int): The maximum number of items per page.
             search_query (Dict): The search query parameters.
             order_by (List): The order by parameters.
+            full_text (bool): Whether to run the search text as a ranked full-text search.
+            keyset (bool): Whether to paginate by cursor instead of by page number.
+            cursor (str | None): The cursor of the page to retrieve in keyset mode.
+            count (str): The strategy to compute the total of the page, see paginate.
+            projected (bool): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             Pagination: The paginated list of horses.
         """
         query = Horse.query
 
-        query = apply_filters(Horse, query, search_query, order_by)
+        query = apply_filters(Horse, query, search_query, order_by, full_text)
 
-        return query.paginate(
-            page=page, per_page=per_page, error_out=False, max_per_page=max_per_page
-        )
+        if projected:
+            query = self.LIST_PROJECTION.apply(query)
+
+        if keyset:
+            return keyset_paginate(Horse, query, order_by, min(per_page, max_per_page), cursor)
+
+        return paginate(Horse, query, page, per_page, max_per_page, count)
 
     def get_by_id(self, horse_id: int, documents: bool = True) -> Dict | None:
         """
@@ -320,22 +375,24 @@ class EquestrianRepository(AbstractEquestrianRepository):
         Returns:
             Dict | None: The horse data or None if not found.
         """
-        horse = self.__get_by_id(horse_id)
+        horse = self.__get_by_id(horse_id, PROFILE_DETAIL if documents else PROFILE_EDIT)
         if not horse:
             return None
         return HorseMapper.from_entity(horse, documents=documents)
 
-    def __get_by_id(self, horse_id: int) -> Horse:
+    def __get_by_id(self, horse_id: int, profile: str | None = None) -> Horse:
         """
         Get a horse by its ID.
 
         Args:
             horse_id (int): The ID of the horse.
+            profile (str | None): The loading profile of the related entities to read.
 
         Returns:
             Horse: The horse.
         """
-        return self.db.session.query(Horse).filter(Horse.id == horse_id).first()
+        query = self.db.session.query(Horse).filter(Horse.id == horse_id)
+        return apply_loading_profile(Horse, query, self.LOADING_PROFILES, profile).first()
 
     def update(self, horse_id: int, data: Dict):
         """
@@ -373,7 +430,9 @@ class EquestrianRepository(AbstractEquestrianRepository):
             return False
 
         files = HorseFile.query.filter_by(horse_id=horse_id)
-        minio_path_files = [f.path for f in files if not f.is_link]
+        minio_path_files = unreferenced_paths(
+            [f.path for f in files if not f.is_link], [f.id for f in files]
+        )
         if minio_path_files:
             from src.core.container import Container  # can't import outside due to circular import
             success = Container().storage_services().delete_batch(minio_path_files)
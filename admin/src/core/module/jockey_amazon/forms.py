@@ -29,6 +29,7 @@ from src.core.module.common.forms import (
     BaseManageDocumentsForm, CustomFloatField,
 )
 from src.core.module.common.validators import IsNumber, IsValidDniNumber
+from src.core.module.common.search import FULL_TEXT_FIELD
 from src.core.module.jockey_amazon.data import (
     DisabilityDiagnosisEnum,
     DisabilityTypeEnum,
@@ -442,6 +443,7 @@ class JockeyAmazonSearchForm(FlaskForm):
             ("last_name", "Apellido"),
             ("dni", "DNI"),
             ("professionals", "Profesionales que lo atienden"),
+            (FULL_TEXT_FIELD, "Todos los campos"),
         ],
         validate_choice=True,
     )
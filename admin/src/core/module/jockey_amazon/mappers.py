@@ -57,7 +57,7 @@ class JockeyAmazonMapper:
         Args:
             document_type: The type of document being created
             file_information (dict): Dictionary containing file metadata
-                Expected keys: path, title, is_link, filetype, filesize
+                Expected keys: path, title, is_link, filetype, filesize, checksum, filename
 
         Returns:
             JockeyAmazonFile: Created file instance with provided information
@@ -69,6 +69,8 @@ class JockeyAmazonMapper:
             is_link=file_information.get("is_link"),
             filetype=file_information.get("filetype"),
             filesize=file_information.get("filesize"),
+            checksum=file_information.get("checksum"),
+            filename=file_information.get("filename"),
             tag=document_type,
         )
         return horse_file
@@ -18,7 +18,8 @@ Models:
 from datetime import datetime
 from sqlalchemy import Enum as SQLAEnum
 
-from src.core.module.common import File
+from src.core.module.common import File, search_vector_column, search_vector_index, trigram_indexes
+from src.core.module.common.filters import Filter, FilterSpec
 from src.core.module.common import AddressMixin, EmergencyContactMixin, PhoneMixin
 from src.core.database import db
 from .data import (
@@ -238,6 +239,7 @@ class JockeyAmazon(db.Model, AddressMixin, PhoneMixin, EmergencyContactMixin):
         inserted_at (datetime): Creation timestamp
         updated_at (datetime): Last update timestamp
         is_deleted (bool): Deletion status flag, defaults to False
+        search_vector (str): Generated full-text search document over names, DNI and professionals
 
     Note:
         This model inherits from AddressMixin, PhoneMixin, and EmergencyContactMixin
@@ -245,6 +247,14 @@ class JockeyAmazon(db.Model, AddressMixin, PhoneMixin, EmergencyContactMixin):
     """
 
     __tablename__ = 'jockeys_amazons'
+    __filters__ = FilterSpec({
+        'is_deleted': Filter(),
+        'has_debts': Filter(),
+    })
+    __table_args__ = (
+        search_vector_index('jockeys_amazons'),
+        *trigram_indexes('jockeys_amazons', 'first_name', 'last_name', 'dni'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     first_name = db.Column(db.String(100), nullable=False)
@@ -313,6 +323,13 @@ class JockeyAmazon(db.Model, AddressMixin, PhoneMixin, EmergencyContactMixin):
 
     is_deleted = db.Column(db.Boolean, nullable=False, default=False)
 
+    search_vector = search_vector_column({
+        "first_name": "A",
+        "last_name": "A",
+        "dni": "B",
+        "professionals": "C",
+    })
+
 
 class JockeyAmazonFile(File):
     """
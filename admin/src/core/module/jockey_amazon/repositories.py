@@ -22,8 +22,19 @@ from flask_sqlalchemy.pagination import Pagination
 from src.core.database import db
 from src.core.module.jockey_amazon.data import EducationLevelEnum
 from src.core.module.jockey_amazon.models import JockeyAmazon, JockeyAmazonFile, FamilyMember, WorkAssignment
-from src.core.module.common.repositories import apply_filters, apply_multiple_search_criteria
+from src.core.module.common.repositories import (
+    apply_filters,
+    apply_loading_profile,
+    apply_multiple_search_criteria,
+    unreferenced_paths,
+    PROFILE_DETAIL,
+    PROFILE_EDIT,
+)
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
+from src.core.module.common.projections import Projection
 from src.core.module.employee.data import JobPositionEnum as Jobs
+from src.core.module.report.cache import report_cache
+from src.core.module.report.rollups import add_jockeys, tracking_jockeys
 
 
 class AbstractJockeyAmazonRepository(ABC):
@@ -61,6 +72,11 @@ class AbstractJockeyAmazonRepository(ABC):
             max_per_page: int,
             search_query: Dict = None,
             order_by: List = None,
+            full_text: bool = False,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
+            projected: bool = False,
     ):
         """
         Retrieve a paginated list of jockeys based on search criteria and sorting order.
@@ -71,6 +87,11 @@ class AbstractJockeyAmazonRepository(ABC):
             max_per_page (int, optional): The maximum number of records per page. Defaults to 20.
             search_query (Dict, optional): Filters to apply to the query.
             order_by (List, optional): List of fields to order the results by.
+            full_text (bool, optional): Whether to run the search text as a ranked full-text search.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
+            projected (bool, optional): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             Pagination: A paginated result set of jockeys.
@@ -78,12 +99,13 @@ class AbstractJockeyAmazonRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_id(self, jockey_id: int) -> Optional[JockeyAmazon]:
+    def get_by_id(self, jockey_id: int, profile: str | None = None) -> Optional[JockeyAmazon]:
         """
         Retrieve a `JockeyAmazon` entity by its ID.
 
         Args:
             jockey_id (int): The ID of the jockey.
+            profile (str | None, optional): The loading profile of the related entities the page reads.
 
         Returns:
             Optional[JockeyAmazon]: The `JockeyAmazon` entity if found, otherwise None.
@@ -402,6 +424,36 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
     Concrete implementation of AbstractJockeyAmazonRepository for managing `JockeyAmazon` entities.
     """
 
+    # Columns shown by the lists of jockeys and amazons
+    LIST_PROJECTION = Projection(
+        {
+            "id": JockeyAmazon.id,
+            "first_name": JockeyAmazon.first_name,
+            "last_name": JockeyAmazon.last_name,
+            "dni": JockeyAmazon.dni,
+            "birth_date": JockeyAmazon.birth_date,
+            "phone": JockeyAmazon.phone,
+            "has_debts": JockeyAmazon.has_debts,
+            "inserted_at": JockeyAmazon.inserted_at,
+            "proposal": WorkAssignment.proposal,
+        },
+        joins=(JockeyAmazon.work_assignment,),
+    )
+
+    # Related entities read by the detail page and by the edit forms
+    LOADING_PROFILES = {
+        PROFILE_DETAIL: (
+            "school_institution",
+            "family_members",
+            "work_assignment.horse",
+            "work_assignment.professor_or_therapist",
+            "work_assignment.conductor",
+            "work_assignment.track_assistant",
+            "files",
+        ),
+        PROFILE_EDIT: ("school_institution", "family_members", "work_assignment"),
+    }
+
     def __init__(self):
         """
         Initializes the repository and sets the database connection.
@@ -435,7 +487,9 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
         """
         self.db.session.add(jockey)
         self.db.session.flush()
+        add_jockeys(self.db.session, [jockey.id])
         self.save()
+        report_cache.invalidate()
         return jockey
 
     def get_page(
@@ -445,6 +499,11 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
             max_per_page: int = 20,
             search_query: Dict = None,
             order_by: List = None,
+            full_text: bool = False,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
+            projected: bool = False,
     ):
         """
         Retrieve a paginated list of `JockeyAmazon` entities based on search criteria and sorting order.
@@ -455,33 +514,40 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
             max_per_page (int, optional): The maximum number of records per page. Defaults to 20.
             search_query (Dict, optional): Filters to apply to the query.
             order_by (List, optional): List of fields to order the results by.
+            full_text (bool, optional): Whether to run the search text as a ranked full-text search.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
+            projected (bool, optional): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             Pagination: A paginated result set of `JockeyAmazon` entities.
         """
         query = JockeyAmazon.query
 
-        query = apply_filters(JockeyAmazon, query, search_query, order_by)
+        query = apply_filters(JockeyAmazon, query, search_query, order_by, full_text)
 
-        return query.paginate(
-            page=page, per_page=per_page, error_out=False, max_per_page=max_per_page
-        )
+        if projected:
+            query = self.LIST_PROJECTION.apply(query)
+
+        if keyset:
+            return keyset_paginate(JockeyAmazon, query, order_by, min(per_page, max_per_page), cursor)
 
-    def get_by_id(self, jockey_id: int) -> Optional[JockeyAmazon]:
+        return paginate(JockeyAmazon, query, page, per_page, max_per_page, count)
+
+    def get_by_id(self, jockey_id: int, profile: str | None = None) -> Optional[JockeyAmazon]:
         """
         Retrieve a `JockeyAmazon` entity by its ID.
 
         Args:
             jockey_id (int): The ID of the jockey.
+            profile (str | None, optional): The loading profile of the related entities the page reads.
 
         Returns:
             Optional[JockeyAmazon]: The `JockeyAmazon` entity if found, otherwise None.
         """
-        return (
-            self.db.session.query(JockeyAmazon)
-            .filter(JockeyAmazon.id == jockey_id)
-            .first()
-        )
+        query = self.db.session.query(JockeyAmazon).filter(JockeyAmazon.id == jockey_id)
+        return apply_loading_profile(JockeyAmazon, query, self.LOADING_PROFILES, profile).first()
 
     def update(self, jockey_id: int, data: Dict) -> bool:
         """
@@ -496,8 +562,10 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
         jockey = JockeyAmazon.query.filter_by(id=jockey_id)
         if not jockey:
             return False
-        jockey.update(data)
+        with tracking_jockeys(jockey_id):
+            jockey.update(data)
         self.save()
+        report_cache.invalidate()
         return True
 
     def archive(self, jockey_id: int) -> bool:
@@ -514,6 +582,7 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
             return False
         jockey.is_deleted = True
         self.save()
+        report_cache.invalidate()
         return True
 
     def recover(self, jockey_id: int) -> bool:
@@ -531,6 +600,7 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
             return False
         jockey.is_deleted = False
         self.save()
+        report_cache.invalidate()
         return True
 
     def delete(self, jockey_id: int) -> bool:
@@ -548,15 +618,19 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
             return False
 
         files = JockeyAmazonFile.query.filter_by(jockey_amazon_id=jockey_id)
-        minio_path_files = [f.path for f in files if not f.is_link]
+        minio_path_files = unreferenced_paths(
+            [f.path for f in files if not f.is_link], [f.id for f in files]
+        )
         if minio_path_files:
             from src.core.container import Container  # can't import outside due to circular import
             success = Container().storage_services().delete_batch(minio_path_files)
 
             if not success:
                 return False
-        jockey.delete()
+        with tracking_jockeys(jockey_id):
+            jockey.delete()
         self.save()
+        report_cache.invalidate()
         return True
 
     def save(self):
@@ -783,18 +857,20 @@ class JockeyAmazonRepository(AbstractJockeyAmazonRepository):
         assignment = jockey.work_assignment
 
         assignment_data = {}
-        if assignment and data:
-            assignment_data = data.get("work_assignments", {})
-            for key, value in assignment_data.items():
-                setattr(assignment, key, value)
-
-        jockey.has_scholarship = data.get("has_scholarship")
-        jockey.scholarship_observations = data.get("scholarship_observations")
-        jockey.scholarship_percentage = data.get("scholarship_percentage")
-        self.db.session.add(assignment)
-        self.db.session.add(jockey)
-        assignment.days = assignment_data.get("days", [])
+        with tracking_jockeys(jockey_id):
+            if assignment and data:
+                assignment_data = data.get("work_assignments", {})
+                for key, value in assignment_data.items():
+                    setattr(assignment, key, value)
+
+            jockey.has_scholarship = data.get("has_scholarship")
+            jockey.scholarship_observations = data.get("scholarship_observations")
+            jockey.scholarship_percentage = data.get("scholarship_percentage")
+            self.db.session.add(assignment)
+            self.db.session.add(jockey)
+            assignment.days = assignment_data.get("days", [])
         self.save()
+        report_cache.invalidate()
         return True
 
     def is_dni_used(self, dni: str) -> bool:
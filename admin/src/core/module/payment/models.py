@@ -2,6 +2,7 @@ from datetime import datetime
 from src.core.database import db
 from src.core.module.payment.data import PaymentTypeEnum
 from src.core.module.employee.models import Employee
+from src.core.module.common.filters import Filter, FilterSpec, GTE, LTE
 
 
 class Payment(db.Model):
@@ -21,6 +22,13 @@ class Payment(db.Model):
         updated_at (datetime.datetime): The timestamp when the payment was last updated.
     """
     __tablename__ = "payments"
+    __filters__ = FilterSpec({
+        "is_archived": Filter(),
+        "payment_type": Filter(),
+        "payment_date__gte": Filter("payment_date", GTE, index=True),
+        "payment_date__lte": Filter("payment_date", LTE, index=True),
+    })
+    __table_args__ = __filters__.indexes("payments")
 
     id = db.Column(db.Integer, primary_key=True)
     amount = db.Column(db.Numeric(10, 2), nullable=False)
@@ -5,7 +5,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
 from src.core.database import db as database
 from src.core.module.payment.models import Payment
+from src.core.module.employee.models import Employee
 from src.core.module.common.repositories import apply_filters
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
+from src.core.module.common.projections import Projection
 
 
 class AbstractPaymentRepository:
@@ -49,6 +52,10 @@ class AbstractPaymentRepository:
         max_per_page: int,
         search_query: Dict = None,
         order_by: list = None,
+        keyset: bool = False,
+        cursor: str | None = None,
+        count: str = COUNT_EXACT,
+        projected: bool = False,
     ) -> Pagination:
         """
         Retrieves a page of payments based on search and order parameters.
@@ -59,6 +66,10 @@ class AbstractPaymentRepository:
             max_per_page (int): The maximum number of items per page.
             search_query (Dict, optional): The search parameters.
             order_by (list, optional): The order parameters.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
+            projected (bool, optional): Whether to return rows with the columns of the list views instead of entities.
 
         Returns:
             Pagination: A pagination instance with the results.
@@ -164,6 +175,20 @@ class PaymentRepository(AbstractPaymentRepository):
         delete(payment_id: int) -> bool:
             Deletes a payment by its ID.
     """
+
+    # Columns shown by the lists of payments, with the name of the beneficiary
+    LIST_PROJECTION = Projection(
+        {
+            "id": Payment.id,
+            "amount": Payment.amount,
+            "payment_date": Payment.payment_date,
+            "payment_type": Payment.payment_type,
+            "is_archived": Payment.is_archived,
+            "beneficiary_name": Employee.name,
+        },
+        joins=(Payment.beneficiary,),
+    )
+
     def __init__(self):
         self.db: SQLAlchemy = database
 
@@ -184,21 +209,18 @@ class PaymentRepository(AbstractPaymentRepository):
         self,
         page: int,
         per_page: int,
+        max_per_page: int = 20,
         search_query: Dict = None,
         order_by: List = None,
+        keyset: bool = False,
+        cursor: str | None = None,
+        count: str = COUNT_EXACT,
+        projected: bool = False,
     ):
         query = Payment.query
 
         # Aplicar filtros
-        if search_query:
-            if "payment_date__gte" in search_query:
-                query = query.filter(Payment.payment_date >= search_query["payment_date__gte"])
-            if "payment_date__lte" in search_query:
-                query = query.filter(Payment.payment_date <= search_query["payment_date__lte"])
-            if "payment_type" in search_query:
-                query = query.filter(Payment.payment_type == search_query["payment_type"])
-            if "is_archived" in search_query:
-                query = query.filter(Payment.is_archived == search_query["is_archived"])
+        query = Payment.__filters__.apply(Payment, query, search_query or {})
 
         # Aplicar orden
         if order_by:
@@ -206,7 +228,13 @@ class PaymentRepository(AbstractPaymentRepository):
                 column, direction = order
                 query = query.order_by(getattr(getattr(Payment, column), direction)())
 
-        return query.paginate(page=page, per_page=per_page, error_out=False)
+        if projected:
+            query = self.LIST_PROJECTION.apply(query)
+
+        if keyset:
+            return keyset_paginate(Payment, query, order_by, min(per_page, max_per_page), cursor)
+
+        return paginate(Payment, query, page, per_page, max_per_page, count)
 
     def get_by_id(self, payment_id: int) -> Payment:
         return (
@@ -2,6 +2,7 @@ from flask_wtf import FlaskForm
 from wtforms import SelectField, StringField, SubmitField, DateField, TextAreaField
 from wtforms.validators import Length, DataRequired, Optional
 from src.core.module.publication.models import EstadoPublicacionEnum, TipoPublicacionEnum
+from src.core.module.common.search import FULL_TEXT_FIELD
 from flask_ckeditor import CKEditorField
 
 
@@ -29,6 +30,7 @@ class PublicationSearchForm(FlaskForm):
         choices=[
             ("title", "Título"),
             ("alias", "Autor"),
+            (FULL_TEXT_FIELD, "Todos los campos"),
         ],
         validate_choice=True,
     )
@@ -1,5 +1,7 @@
 from datetime import datetime
 from src.core.database import db
+from src.core.module.common.search import search_vector_column, search_vector_index
+from src.core.module.common.filters import Filter, FilterSpec, GT, LT
 from enum import Enum as pyEnum
 
 
@@ -48,8 +50,17 @@ class Publication(db.Model):
         author_id (int): The identifier of the author of the publication.
         status (EstadoPublicacionEnum): The status of the publication.
         author (User): The author of the publication.
+        search_vector (str): The generated full-text search document of the publication.
     """
     __tablename__ = "publications"
+    __filters__ = FilterSpec({
+        "is_deleted": Filter(),
+        "status": Filter(),
+        "type": Filter(),
+        "start_date": Filter("publish_date", GT, index=True),
+        "end_date": Filter("publish_date", LT, index=True),
+    })
+    __table_args__ = (search_vector_index("publications"), *__filters__.indexes("publications"))
 
     id = db.Column(db.Integer, primary_key=True)
     publish_date = db.Column(db.DateTime, nullable=False, default=datetime.now)
@@ -62,6 +73,7 @@ class Publication(db.Model):
     status = db.Column(db.Enum(EstadoPublicacionEnum), nullable=False)
     type = db.Column(db.Enum(TipoPublicacionEnum), nullable=False)
     is_deleted = db.Column(db.Boolean, nullable=False, default=False)
+    search_vector = search_vector_column({"title": "A", "summary": "B", "content": "C"})
 
     # Relaciones
     author = db.relationship("User", back_populates="publications")
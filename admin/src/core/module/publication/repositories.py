@@ -4,9 +4,9 @@ from datetime import datetime
 
 from src.core.database import db as database
 from src.core.module.publication.models import Publication, EstadoPublicacionEnum
-from src.core.module.common.repositories import apply_filters, apply_search_criteria
+from src.core.module.common.repositories import apply_filters, apply_loading_profile, PROFILE_DETAIL, PROFILE_LIST
+from src.core.module.common.pagination import keyset_paginate, paginate, COUNT_EXACT
 from .mappers import PublicationMapper as Mapper
-from ..user.models import User
 
 
 class AbstractPublicationRepository:
@@ -37,6 +37,10 @@ class AbstractPublicationRepository:
             per_page: int,
             search_query: Dict = None,
             order_by: list = None,
+            full_text: bool = False,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
     ):
         """
         Retrieve a paginated list of publications.
@@ -46,6 +50,10 @@ class AbstractPublicationRepository:
             per_page (int): The number of publications per page.
             search_query (Dict, optional): The search query to filter publications.
             order_by (list, optional): The order by criteria.
+            full_text (bool, optional): Whether to run the search text as a ranked full-text search.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
 
         Returns:
             A paginated list of publications.
@@ -143,6 +151,17 @@ class PublicationRepository(AbstractPublicationRepository):
     publications in the database.
     """
 
+    # Searchable fields of the author of the publication
+    RELATED_SEARCH_FIELDS = {
+        "alias": ("author", "alias"),
+    }
+
+    # The author is shown by the lists and the detail of a publication
+    LOADING_PROFILES = {
+        PROFILE_LIST: ("author",),
+        PROFILE_DETAIL: ("author",),
+    }
+
     def __init__(self):
         """
         Initialize the PublicationRepository.
@@ -170,6 +189,10 @@ class PublicationRepository(AbstractPublicationRepository):
             per_page: int,
             search_query: Dict = None,
             order_by: List = None,
+            full_text: bool = False,
+            keyset: bool = False,
+            cursor: str | None = None,
+            count: str = COUNT_EXACT,
     ):
         """
         Retrieve a paginated list of publications.
@@ -179,6 +202,10 @@ class PublicationRepository(AbstractPublicationRepository):
             per_page (int): The number of publications per page.
             search_query (Dict, optional): The search query to filter publications.
             order_by (List, optional): The order by criteria.
+            full_text (bool, optional): Whether to run the search text as a ranked full-text search.
+            keyset (bool, optional): Whether to paginate by cursor instead of by page number.
+            cursor (str | None, optional): The cursor of the page to retrieve in keyset mode.
+            count (str, optional): The strategy to compute the total of the page, see paginate.
 
         Returns:
             A paginated list of publications.
@@ -187,31 +214,15 @@ class PublicationRepository(AbstractPublicationRepository):
 
         query = Publication.query
 
-        # Handle date range filters
-        if search_query and "filters" in search_query and search_query["filters"]:
-            if "start_date" in search_query["filters"]:
-                query = (query
-                         .filter(Publication.publish_date > search_query["filters"]["start_date"]))
-                search_query["filters"].pop("start_date")
-
-            if "end_date" in search_query["filters"]:
-                query = (query
-                         .filter(Publication.publish_date < search_query["filters"]["end_date"]))
-                search_query["filters"].pop("end_date")
-
-        # since name and lastname aren't in the Charge model, we need to apply the filters separately
-        if search_query and "text" in search_query and "field" in search_query and search_query["field"] == "alias":
-            user_query = apply_search_criteria(User, User.query, search_query).all()
-            user_ids = [user.id for user in user_query]
-            query = query.filter(Publication.author_id.in_(user_ids))
-            search_query.pop("text")
-            search_query.pop("field")
-
-        query = apply_filters(Publication, query, search_query, order_by)
-
-        return query.paginate(
-            page=page, per_page=per_page, error_out=False, max_per_page=max_per_page
+        query = apply_filters(
+            Publication, query, search_query, order_by, full_text, related_fields=self.RELATED_SEARCH_FIELDS
         )
+        query = apply_loading_profile(Publication, query, self.LOADING_PROFILES, PROFILE_LIST)
+
+        if keyset:
+            return keyset_paginate(Publication, query, order_by, min(per_page, max_per_page), cursor)
+
+        return paginate(Publication, query, page, per_page, max_per_page, count)
 
     def __get_by_id(self, publication_id: int) -> Publication:
         """
@@ -235,7 +246,8 @@ class PublicationRepository(AbstractPublicationRepository):
         Returns:
             Dict | None: The publication data as a dictionary, or None if not found.
         """
-        publication = self.db.session.query(Publication).filter(Publication.id == publication_id).first()
+        query = self.db.session.query(Publication).filter(Publication.id == publication_id)
+        publication = apply_loading_profile(Publication, query, self.LOADING_PROFILES, PROFILE_DETAIL).first()
         return Mapper.from_entity(publication) if publication else None
 
     def update_publication(self, publication_id: int, data: Dict) -> bool:
@@ -0,0 +1,28 @@
+from .forms import ChargeSearchForm, IncomeSeriesForm
+from .repositories import (
+    ReportRepository,
+    AbstractReportRepository,
+    DashboardReport,
+    IncomeSeriesReport,
+    GROUP_TOTAL,
+    GROUP_PAYMENT_METHOD,
+    GROUP_SEDE,
+    MAX_SERIES_PERIODS,
+)
+from .cache import report_cache, cached_report
+
+
+__all__ = [
+    "ChargeSearchForm",
+    "IncomeSeriesForm",
+    "ReportRepository",
+    "AbstractReportRepository",
+    "DashboardReport",
+    "IncomeSeriesReport",
+    "GROUP_TOTAL",
+    "GROUP_PAYMENT_METHOD",
+    "GROUP_SEDE",
+    "MAX_SERIES_PERIODS",
+    "report_cache",
+    "cached_report",
+]
@@ -0,0 +1,51 @@
+from datetime import date
+from functools import wraps
+from inspect import signature
+from flask import current_app
+from src.core.module.common.cache import TTLCache
+
+# Results of the report repository. Staff reload the reports far more often
+# than jockeys, amazons and charges change, so each result is kept for
+# REPORT_CACHE_TTL seconds. The repositories that write those rows drop the
+# whole cache after their writes are committed; as the cache lives in each
+# worker process, the other workers see the change once their entries expire.
+report_cache = TTLCache(max_entries=256)
+
+
+def cached_report(method):
+    """
+    Serves a method of the report repository from the report cache.
+
+    The result is cached by the name of the method, its arguments and the
+    current day, as the reports depend on the current month. The arguments
+    are bound to the signature of the method with their defaults applied, so
+    a call passing a default, by position or by keyword, shares the entry of
+    the call that omits it. A result
+    computed while a write invalidated the cache is not stored. A
+    REPORT_CACHE_TTL of 0 disables the cache.
+
+    Args:
+        method: The method of the report repository.
+
+    Returns:
+        The cached method.
+    """
+    method_signature = signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        ttl = current_app.config["REPORT_CACHE_TTL"]
+        if not ttl:
+            return method(self, *args, **kwargs)
+
+        bound = method_signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, date.today(), tuple(bound.arguments.items())[1:])
+        result = report_cache.get(key)
+        if result is None:
+            generation = report_cache.generation
+            result = method(self, *args, **kwargs)
+            report_cache.set(key, result, ttl, generation)
+        return result
+
+    return wrapper
@@ -1,8 +1,12 @@
+from datetime import date
+from typing import Tuple
 from flask_wtf import FlaskForm
 from wtforms import SelectField, StringField, SubmitField, DateField, DecimalField
 from wtforms.validators import Length, DataRequired, Optional
 
 from src.core.module.charges.models import PaymentMethodEnum
+from .models import PERIOD_MONTH, PERIOD_WEEK
+from .repositories import GROUP_PAYMENT_METHOD, GROUP_SEDE, GROUP_TOTAL, MAX_SERIES_PERIODS, count_periods
 
 class ChargeSearchForm(FlaskForm):
     """
@@ -87,4 +91,84 @@ class ChargeSearchForm(FlaskForm):
             self.start_date.errors.append('La fecha de inicio no puede ser mayor a la fecha de fin.')
             return False
 
-        return True
\ No newline at end of file
+        return True
+
+
+class IncomeSeriesForm(FlaskForm):
+    """
+    Form for selecting the range and the breakdown of the income series report.
+
+    Fields:
+        period (SelectField): Whether the income is summed by month or by week.
+        group_by (SelectField): Whether the income is split by payment method, by sede or not at all.
+        start_date (DateField): A day of the first period shown.
+        end_date (DateField): A day of the last period shown.
+        submit_search (SubmitField): The button to submit the selection.
+    """
+
+    class Meta:
+        csrf = False
+
+    period = SelectField(
+        "Período",
+        choices=[(PERIOD_MONTH, "Mensual"), (PERIOD_WEEK, "Semanal")],
+        default=PERIOD_MONTH,
+        validate_choice=True,
+    )
+
+    group_by = SelectField(
+        "Agrupar por",
+        choices=[(GROUP_TOTAL, "Total"), (GROUP_PAYMENT_METHOD, "Método de Pago"), (GROUP_SEDE, "Sede")],
+        default=GROUP_TOTAL,
+        validate_choice=True,
+    )
+
+    start_date = DateField("Desde", format='%Y-%m-%d', validators=[Optional()])
+    end_date = DateField("Hasta", format='%Y-%m-%d', validators=[Optional()])
+
+    submit_search = SubmitField("Ver")
+
+    def validate(self, **kwargs):
+        """
+        Custom validation function to ensure a valid range that is not too long to chart.
+
+        Args:
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            bool: True if validation passes, False otherwise.
+        """
+        if not super(IncomeSeriesForm, self).validate(**kwargs):
+            return False
+
+        self.start_date.errors = list(self.start_date.errors)
+        if self.start_date.data and self.end_date.data and self.start_date.data > self.end_date.data:
+            self.start_date.errors.append('La fecha de inicio no puede ser mayor a la fecha de fin.')
+            return False
+
+        period, start, end, _ = self.selection(date.today())
+        if count_periods(period, start, end) > MAX_SERIES_PERIODS:
+            self.start_date.errors.append(f'El rango no puede superar los {MAX_SERIES_PERIODS} períodos.')
+            return False
+
+        return True
+
+    def selection(self, today: date) -> Tuple[str, date, date, str]:
+        """
+        Get the selected period, range and breakdown, defaulting to the last twelve months.
+
+        Args:
+            today (date): The day used as the end of the range when none is selected.
+
+        Returns:
+            Tuple[str, date, date, str]: The period, the first and last day of the range and the grouping.
+        """
+        period = self.period.data or PERIOD_MONTH
+        group_by = self.group_by.data or GROUP_TOTAL
+        end = self.end_date.data or today
+        if self.start_date.data:
+            start = self.start_date.data
+        else:
+            months = end.year * 12 + end.month - 12
+            start = date(months // 12, months % 12 + 1, 1)
+        return period, start, end, group_by
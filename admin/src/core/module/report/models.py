@@ -0,0 +1,73 @@
+from src.core.database import db
+
+# Dimensions of the report counters
+DIMENSION_JYA = "jya"
+DIMENSION_CERTIFIED = "certified"
+DIMENSION_DISABILITY_TYPE = "disability_type"
+DIMENSION_DISABILITY_DIAGNOSIS = "disability_diagnosis"
+DIMENSION_PROPOSAL = "proposal"
+
+
+class ReportCounter(db.Model):
+    """
+    Represents the number of jockeys and amazons of a category of the reports.
+
+    Attributes:
+        dimension (str): What the category classifies, one of the DIMENSION_* values.
+        key (str): The name of the enumeration member of the category, empty for the totals.
+        count (int): The number of jockeys and amazons of the category.
+    """
+
+    __tablename__ = "report_counters"
+
+    dimension = db.Column(db.String(30), primary_key=True)
+    key = db.Column(db.String(100), primary_key=True, default="")
+    count = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+class MonthlyIncome(db.Model):
+    """
+    Represents the income of the charges of a month paid with a payment method.
+
+    Attributes:
+        month (datetime.date): The first day of the month.
+        payment_method (str): The name of the PaymentMethodEnum member.
+        amount (float): The sum of the amounts of the charges.
+        charges (int): The number of charges.
+    """
+
+    __tablename__ = "report_monthly_income"
+
+    month = db.Column(db.Date, primary_key=True)
+    payment_method = db.Column(db.String(50), primary_key=True)
+    amount = db.Column(db.Float, nullable=False, default=0)
+    charges = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+# Periods of the income series
+PERIOD_MONTH = "month"
+PERIOD_WEEK = "week"
+
+
+class IncomeSeries(db.Model):
+    """
+    Represents the income of the charges of a period paid with a payment method at a sede.
+
+    Attributes:
+        period (str): The length of the period, PERIOD_MONTH or PERIOD_WEEK.
+        start (datetime.date): The first day of the period, a Monday for weeks.
+        payment_method (str): The name of the PaymentMethodEnum member.
+        sede (str): The name of the SedeEnum member of the work assignment of the jockey or amazon charged,
+            empty if it has none.
+        amount (float): The sum of the amounts of the charges.
+        charges (int): The number of charges.
+    """
+
+    __tablename__ = "report_income_series"
+
+    period = db.Column(db.String(10), primary_key=True)
+    start = db.Column(db.Date, primary_key=True)
+    payment_method = db.Column(db.String(50), primary_key=True)
+    sede = db.Column(db.String(50), primary_key=True, default="")
+    amount = db.Column(db.Float, nullable=False, default=0)
+    charges = db.Column(db.BigInteger, nullable=False, default=0)
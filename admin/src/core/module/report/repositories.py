@@ -0,0 +1,296 @@
+from abc import abstractmethod
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+from sqlalchemy import BigInteger, Float, cast, func, literal, null, select, union_all
+from src.core.database import db
+from src.core.module.charges.models import PaymentMethodEnum
+from src.core.module.jockey_amazon.data import DisabilityDiagnosisEnum, DisabilityTypeEnum, SedeEnum, WorkProposalEnum
+from .cache import cached_report
+from .models import (
+    IncomeSeries,
+    MonthlyIncome,
+    ReportCounter,
+    DIMENSION_CERTIFIED,
+    DIMENSION_DISABILITY_DIAGNOSIS,
+    DIMENSION_DISABILITY_TYPE,
+    DIMENSION_JYA,
+    DIMENSION_PROPOSAL,
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+)
+
+# Dimension of the row of the income of the current month in the dashboard statement
+INCOME = "income"
+
+# How the income series can be split
+GROUP_TOTAL = "total"
+GROUP_PAYMENT_METHOD = "payment_method"
+GROUP_SEDE = "sede"
+
+# Longest range of the income series, in periods: five years of weeks
+MAX_SERIES_PERIODS = 261
+
+
+class DashboardReport:
+    """
+    The KPIs and the chart data shared by the report views.
+
+    Attributes:
+        total_jya (int): The number of jockeys and amazons.
+        certified_jya (int): The number of jockeys and amazons with a disability certificate.
+        current_month_income (float): The income of the charges of the current month.
+        proposals_data (List[Tuple[WorkProposalEnum, int]]): The number of jockeys and amazons of each work proposal.
+        disability_types_data (List[Tuple[DisabilityTypeEnum, int]]): The number of certified ones by disability type.
+        disability_data (List[Tuple[DisabilityDiagnosisEnum, int]]): The number of certified ones by diagnosis.
+    """
+
+    def __init__(
+        self,
+        total_jya: int = 0,
+        certified_jya: int = 0,
+        current_month_income: float = 0.0,
+        proposals_data: List[Tuple[WorkProposalEnum, int]] = None,
+        disability_types_data: List[Tuple[DisabilityTypeEnum, int]] = None,
+        disability_data: List[Tuple[DisabilityDiagnosisEnum, int]] = None,
+    ):
+        self.total_jya = total_jya
+        self.certified_jya = certified_jya
+        self.current_month_income = current_month_income
+        self.proposals_data = proposals_data or []
+        self.disability_types_data = disability_types_data or []
+        self.disability_data = disability_data or []
+
+    @property
+    def uncertified_jya(self) -> int:
+        """The number of jockeys and amazons without a disability certificate."""
+        return self.total_jya - self.certified_jya
+
+
+class IncomeSeriesReport:
+    """
+    The income of every period of a range, split in series.
+
+    Attributes:
+        period (str): The length of the periods, PERIOD_MONTH or PERIOD_WEEK.
+        periods (List[date]): The first day of each period of the range, oldest first.
+        series (Dict[str, List[float]]): The income of each period, by the name of the series.
+    """
+
+    def __init__(self, period: str, periods: List[date], series: Dict[str, List[float]]):
+        self.period = period
+        self.periods = periods
+        self.series = series
+
+    def to_chart(self) -> Dict:
+        """
+        Build the data of a Chart.js chart of the series.
+
+        Returns:
+            Dict: The "labels" of the periods and one dataset per series.
+        """
+        label_format = "%m/%Y" if self.period == PERIOD_MONTH else "%d/%m/%Y"
+        return {
+            "labels": [start.strftime(label_format) for start in self.periods],
+            "datasets": [{"label": name, "data": data} for name, data in self.series.items()],
+        }
+
+
+class AbstractReportRepository:
+    """
+    Abstract class for the aggregates shown by the reports.
+    """
+
+    @abstractmethod
+    def dashboard(self) -> DashboardReport:
+        """
+        Get the KPIs and the chart data of the reports.
+
+        Returns:
+            DashboardReport: The aggregates of the reports.
+        """
+        pass
+
+    @abstractmethod
+    def income_series(
+        self, period: str, start: date, end: date, group_by: str = GROUP_TOTAL
+    ) -> IncomeSeriesReport:
+        """
+        Get the income of every period of a range.
+
+        Args:
+            period (str): PERIOD_MONTH or PERIOD_WEEK.
+            start (date): A day of the first period.
+            end (date): A day of the last period.
+            group_by (str): GROUP_TOTAL, GROUP_PAYMENT_METHOD or GROUP_SEDE.
+
+        Returns:
+            IncomeSeriesReport: The income of each period and series.
+        """
+        pass
+
+
+class ReportRepository(AbstractReportRepository):
+    """
+    Concrete implementation of AbstractReportRepository.
+
+    Every aggregate of the dashboard is read by a single statement from the
+    rollup tables, so a report view costs one round trip that reads a row
+    per category, whatever the number of jockeys, amazons and charges.
+    Results are served from the report cache.
+    """
+
+    @cached_report
+    def dashboard(self) -> DashboardReport:
+        """
+        Get the KPIs and the chart data of the reports.
+
+        Returns:
+            DashboardReport: The aggregates of the reports.
+        """
+        report = DashboardReport()
+        for dimension, key, count, income in db.session.execute(_dashboard_statement(date.today())):
+            if dimension == DIMENSION_JYA:
+                report.total_jya = count
+            elif dimension == DIMENSION_CERTIFIED:
+                report.certified_jya = count
+            elif dimension == DIMENSION_DISABILITY_TYPE:
+                report.disability_types_data.append((_member(DisabilityTypeEnum, key), count))
+            elif dimension == DIMENSION_DISABILITY_DIAGNOSIS:
+                report.disability_data.append((_member(DisabilityDiagnosisEnum, key), count))
+            elif dimension == DIMENSION_PROPOSAL:
+                report.proposals_data.append((_member(WorkProposalEnum, key), count))
+            elif dimension == INCOME:
+                report.current_month_income = income
+        return report
+
+    @cached_report
+    def income_series(
+        self, period: str, start: date, end: date, group_by: str = GROUP_TOTAL
+    ) -> IncomeSeriesReport:
+        """
+        Get the income of every period of a range.
+
+        The income is read from the precomputed series, a row per period,
+        payment method and sede, so the cost depends on the number of
+        periods and not on the number of charges. Periods without charges
+        are reported with an income of 0.
+
+        Args:
+            period (str): PERIOD_MONTH or PERIOD_WEEK.
+            start (date): A day of the first period.
+            end (date): A day of the last period.
+            group_by (str): GROUP_TOTAL, GROUP_PAYMENT_METHOD or GROUP_SEDE.
+
+        Returns:
+            IncomeSeriesReport: The income of each period and series.
+
+        Raises:
+            ValueError: If the period or the grouping is unknown, or the range
+                spans more than MAX_SERIES_PERIODS periods.
+        """
+        if period not in (PERIOD_MONTH, PERIOD_WEEK):
+            raise ValueError(f"Unknown period {period}")
+        if group_by not in _SERIES_NAMES:
+            raise ValueError(f"Unknown income series grouping {group_by}")
+        if count_periods(period, start, end) > MAX_SERIES_PERIODS:
+            raise ValueError(f"The income series cannot span more than {MAX_SERIES_PERIODS} periods")
+
+        periods = []
+        current = _period_start(period, start)
+        while current <= end:
+            periods.append(current)
+            current = _next_period(period, current)
+
+        keys = [] if group_by == GROUP_TOTAL else [getattr(IncomeSeries, group_by)]
+        rows = db.session.execute(
+            select(IncomeSeries.start, func.sum(IncomeSeries.amount), *keys)
+            .where(IncomeSeries.period == period, IncomeSeries.start.between(_period_start(period, start), end))
+            .group_by(IncomeSeries.start, *keys)
+            .order_by(*keys)
+        )
+
+        series: Dict[str, List[float]] = {}
+        positions = {start_of_period: index for index, start_of_period in enumerate(periods)}
+        for start_of_period, amount, *name in rows:
+            data = series.setdefault(_SERIES_NAMES[group_by](*name or [""]), [0.0] * len(periods))
+            data[positions[start_of_period]] += round(amount, 2)
+        if not series:
+            series[_SERIES_NAMES[GROUP_TOTAL]("")] = [0.0] * len(periods)
+        return IncomeSeriesReport(period, periods, series)
+
+
+def _dashboard_statement(today: date):
+    """
+    Build the statement of the aggregates of the dashboard.
+
+    Each row is (dimension, key, count, income): the non empty report
+    counters followed by the income of the current month.
+
+    Args:
+        today (date): The day whose month is the current one.
+
+    Returns:
+        The UNION ALL statement.
+    """
+    counters = select(
+        ReportCounter.dimension,
+        ReportCounter.key,
+        ReportCounter.count,
+        cast(null(), Float),
+    ).where(ReportCounter.count != 0)
+    income = select(
+        literal(INCOME),
+        literal(""),
+        literal(0, BigInteger),
+        func.coalesce(func.sum(MonthlyIncome.amount), 0.0),
+    ).where(MonthlyIncome.month == today.replace(day=1))
+    return union_all(counters, income)
+
+
+def count_periods(period: str, start: date, end: date) -> int:
+    """
+    Count the periods of a range, including the ones of its first and last days.
+
+    Args:
+        period (str): PERIOD_MONTH or PERIOD_WEEK.
+        start (date): The first day of the range.
+        end (date): The last day of the range.
+
+    Returns:
+        int: The number of periods, 0 if the range is empty.
+    """
+    first, last = _period_start(period, start), _period_start(period, end)
+    if first > last:
+        return 0
+    if period == PERIOD_WEEK:
+        return (last - first).days // 7 + 1
+    return (last.year - first.year) * 12 + last.month - first.month + 1
+
+
+def _period_start(period: str, day: date) -> date:
+    """Get the first day of the period of a day, the Monday of its week for weeks."""
+    if period == PERIOD_MONTH:
+        return day.replace(day=1)
+    return day - timedelta(days=day.weekday())
+
+
+def _next_period(period: str, start: date) -> date:
+    """Get the first day of the period following the one starting on a day."""
+    if period == PERIOD_WEEK:
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+# Name of the series of each grouping, from the key stored in the income series
+_SERIES_NAMES = {
+    GROUP_TOTAL: lambda _: "Total",
+    GROUP_PAYMENT_METHOD: lambda name: PaymentMethodEnum[name].value if name in PaymentMethodEnum.__members__ else name,
+    GROUP_SEDE: lambda name: SedeEnum[name].value if name in SedeEnum.__members__ else "Sin sede",
+}
+
+
+def _member(enum, name):
+    """Converts the name of an enumeration member read from the database back to the member."""
+    return enum[name] if name in enum.__members__ else None
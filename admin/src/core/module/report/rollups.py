@@ -0,0 +1,314 @@
+"""
+Rollup tables of the reports.
+
+Every row of the source tables contributes to some rollup rows: a jockey or
+amazon counts once in the totals and in the categories of its disability
+and work proposal, a charge adds its amount to its month and payment
+method, and to its month and week by payment method and by the sede of
+the jockey or amazon charged. The repositories subtract the contributions of the rows a write
+touches before the write and add them back after it, in the same
+transaction, so the rollups change by the difference whether the write is
+done through the ORM or with a bulk query, and the reports read a few rows
+per category instead of scanning the source tables.
+
+`rebuild` recomputes the rollups from the source tables; run it after
+writing the source tables by other means, such as the seeds.
+"""
+
+from contextlib import contextmanager
+from typing import Iterable
+from sqlalchemy import Date, Text, cast, delete, func, literal, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from src.core.database import db
+from src.core.module.charges.models import Charge
+from src.core.module.jockey_amazon.models import JockeyAmazon, WorkAssignment
+from .models import (
+    IncomeSeries,
+    MonthlyIncome,
+    ReportCounter,
+    DIMENSION_CERTIFIED,
+    DIMENSION_DISABILITY_DIAGNOSIS,
+    DIMENSION_DISABILITY_TYPE,
+    DIMENSION_JYA,
+    DIMENSION_PROPOSAL,
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+)
+
+
+def jockey_contributions(jockey_ids: Iterable[int] | None = None):
+    """
+    Build the statement of the report counters of jockeys and amazons.
+
+    Args:
+        jockey_ids (Iterable[int] | None): The jockeys and amazons counted, None for all of them.
+
+    Returns:
+        The statement selecting (dimension, key, count) rows.
+    """
+    jockeys = [JockeyAmazon.id.in_(list(jockey_ids))] if jockey_ids is not None else []
+    assignments = [WorkAssignment.jockey_amazon_id.in_(list(jockey_ids))] if jockey_ids is not None else []
+
+    def counted(dimension, key, *criteria):
+        return (
+            select(literal(dimension).label("dimension"), key.label("key"))
+            .select_from(JockeyAmazon)
+            .where(*criteria, *jockeys)
+        )
+
+    rows = union_all(
+        counted(DIMENSION_JYA, literal("")),
+        counted(DIMENSION_CERTIFIED, literal(""), JockeyAmazon.has_disability),
+        counted(
+            DIMENSION_DISABILITY_TYPE,
+            func.coalesce(cast(JockeyAmazon.disability_type, Text), ""),
+            JockeyAmazon.has_disability,
+        ),
+        counted(
+            DIMENSION_DISABILITY_DIAGNOSIS,
+            func.coalesce(cast(JockeyAmazon.disability_diagnosis, Text), ""),
+            JockeyAmazon.has_disability,
+        ),
+        select(literal(DIMENSION_PROPOSAL), cast(WorkAssignment.proposal, Text)).where(*assignments),
+    ).subquery()
+    return select(rows.c.dimension, rows.c.key, func.count().label("count")).group_by(rows.c.dimension, rows.c.key)
+
+
+def charge_contributions(charge_ids: Iterable[int] | None = None):
+    """
+    Build the statement of the monthly income of charges.
+
+    Args:
+        charge_ids (Iterable[int] | None): The charges summed, None for all of them.
+
+    Returns:
+        The statement selecting (month, payment_method, amount, charges) rows.
+    """
+    month = cast(func.date_trunc(literal_column("'month'"), Charge.date_of_charge), Date)
+    payment_method = cast(Charge.payment_method, Text)
+    query = select(
+        month.label("month"),
+        payment_method.label("payment_method"),
+        func.sum(Charge.amount).label("amount"),
+        func.count().label("charges"),
+    ).group_by(month, payment_method)
+    if charge_ids is not None:
+        query = query.where(Charge.id.in_(list(charge_ids)))
+    return query
+
+
+def series_contributions(charge_ids: Iterable[int] | None = None, jockey_ids: Iterable[int] | None = None):
+    """
+    Build the statement of the income series of charges.
+
+    The sede of a charge is the one of the work assignment of the jockey or
+    amazon charged, so the charges of a jockey or amazon move to another
+    sede when its assignment does.
+
+    Args:
+        charge_ids (Iterable[int] | None): The charges summed, None for all of them.
+        jockey_ids (Iterable[int] | None): Sum only the charges of these jockeys and amazons.
+
+    Returns:
+        The statement selecting (period, start, payment_method, sede, amount, charges) rows.
+    """
+    criteria = []
+    if charge_ids is not None:
+        criteria.append(Charge.id.in_(list(charge_ids)))
+    if jockey_ids is not None:
+        criteria.append(Charge.jya_id.in_(list(jockey_ids)))
+
+    payment_method = cast(Charge.payment_method, Text)
+    sede = func.coalesce(cast(WorkAssignment.sede, Text), "")
+
+    def summed(period):
+        start = cast(func.date_trunc(literal_column(f"'{period}'"), Charge.date_of_charge), Date)
+        return (
+            select(
+                literal(period).label("period"),
+                start.label("start"),
+                payment_method.label("payment_method"),
+                sede.label("sede"),
+                func.sum(Charge.amount).label("amount"),
+                func.count().label("charges"),
+            )
+            .outerjoin(WorkAssignment, WorkAssignment.jockey_amazon_id == Charge.jya_id)
+            .where(*criteria)
+            .group_by(start, payment_method, sede)
+        )
+
+    return union_all(summed(PERIOD_MONTH), summed(PERIOD_WEEK))
+
+
+def add_jockeys(executor, jockey_ids: Iterable[int], sign: int = 1):
+    """
+    Add the contributions of jockeys and amazons to the report counters.
+
+    Args:
+        executor: The session or connection of the write.
+        jockey_ids (Iterable[int]): The jockeys and amazons.
+        sign (int): 1 to add their contributions, -1 to subtract them.
+    """
+    contributions = jockey_contributions(jockey_ids).subquery()
+    statement = insert(ReportCounter.__table__).from_select(
+        ["dimension", "key", "count"],
+        select(contributions.c.dimension, contributions.c.key, contributions.c.count * sign),
+    )
+    executor.execute(
+        statement.on_conflict_do_update(
+            index_elements=["dimension", "key"],
+            set_={"count": ReportCounter.__table__.c.count + statement.excluded.count},
+        )
+    )
+    _add_series(executor, series_contributions(jockey_ids=jockey_ids), sign)
+
+
+def add_charges(executor, charge_ids: Iterable[int], sign: int = 1):
+    """
+    Add the amounts of charges to the monthly income and to the income series.
+
+    Args:
+        executor: The session or connection of the write.
+        charge_ids (Iterable[int]): The charges.
+        sign (int): 1 to add their amounts, -1 to subtract them.
+    """
+    contributions = charge_contributions(charge_ids).subquery()
+    statement = insert(MonthlyIncome.__table__).from_select(
+        ["month", "payment_method", "amount", "charges"],
+        select(
+            contributions.c.month,
+            contributions.c.payment_method,
+            contributions.c.amount * sign,
+            contributions.c.charges * sign,
+        ),
+    )
+    table = MonthlyIncome.__table__
+    executor.execute(
+        statement.on_conflict_do_update(
+            index_elements=["month", "payment_method"],
+            set_={
+                "amount": table.c.amount + statement.excluded.amount,
+                "charges": table.c.charges + statement.excluded.charges,
+            },
+        )
+    )
+    _add_series(executor, series_contributions(charge_ids=charge_ids), sign)
+
+
+def _add_series(executor, contributions, sign: int):
+    """
+    Add contributions to the income series.
+
+    Args:
+        executor: The session or connection of the write.
+        contributions: The statement built by series_contributions.
+        sign (int): 1 to add the contributions, -1 to subtract them.
+    """
+    contributions = contributions.subquery()
+    table = IncomeSeries.__table__
+    statement = insert(table).from_select(
+        ["period", "start", "payment_method", "sede", "amount", "charges"],
+        select(
+            contributions.c.period,
+            contributions.c.start,
+            contributions.c.payment_method,
+            contributions.c.sede,
+            contributions.c.amount * sign,
+            contributions.c.charges * sign,
+        ),
+    )
+    executor.execute(
+        statement.on_conflict_do_update(
+            index_elements=["period", "start", "payment_method", "sede"],
+            set_={
+                "amount": table.c.amount + statement.excluded.amount,
+                "charges": table.c.charges + statement.excluded.charges,
+            },
+        )
+    )
+
+
+@contextmanager
+def tracking_jockeys(*jockey_ids: int):
+    """
+    Moves the contributions of jockeys and amazons across the writes done inside the block.
+
+    Args:
+        *jockey_ids (int): The jockeys and amazons written.
+    """
+    add_jockeys(db.session, jockey_ids, -1)
+    yield
+    db.session.flush()
+    add_jockeys(db.session, jockey_ids)
+
+
+@contextmanager
+def tracking_charges(*charge_ids: int):
+    """
+    Moves the amounts of charges across the writes done inside the block.
+
+    Args:
+        *charge_ids (int): The charges written.
+    """
+    add_charges(db.session, charge_ids, -1)
+    yield
+    db.session.flush()
+    add_charges(db.session, charge_ids)
+
+
+def rebuild(connection, *models) -> int:
+    """
+    Recomputes the rollups from the source tables.
+
+    Args:
+        connection: The connection, or session, to the database.
+        *models: The rollup models to recompute, all of them if none is given.
+            Migrations pass the ones they create, as the later ones may not
+            exist yet.
+
+    Returns:
+        int: The number of rollup rows that were out of date.
+    """
+    rollups = {
+        ReportCounter: (jockey_contributions, 2),
+        MonthlyIncome: (charge_contributions, 2),
+        IncomeSeries: (series_contributions, 4),
+    }
+    return sum(
+        _replace(connection, model.__table__, rollups[model][0](), rollups[model][1])
+        for model in models or rollups
+    )
+
+
+def _replace(connection, table, statement, keys: int) -> int:
+    """
+    Replaces the rows of a rollup table with the ones computed by a statement.
+
+    Rows are compared by their first `keys` columns, the primary key, and
+    amounts are compared rounded to cents. Stored rows whose last column
+    (a count) is 0 are considered absent.
+
+    Args:
+        connection: The connection, or session, to the database.
+        table: The rollup table.
+        statement: The statement selecting the rows of the table, in the order of its columns.
+        keys (int): The number of primary key columns.
+
+    Returns:
+        int: The number of rows that were out of date.
+    """
+    def compared(row):
+        return tuple(round(value, 2) if isinstance(value, float) else value for value in row[keys:])
+
+    fresh = {tuple(row[:keys]): tuple(row) for row in connection.execute(statement)}
+    stored = {tuple(row[:keys]): compared(row) for row in connection.execute(select(table)) if row[-1]}
+    stale = sum(
+        stored.get(key) != (compared(fresh[key]) if key in fresh else None)
+        for key in stored.keys() | fresh.keys()
+    )
+
+    connection.execute(delete(table))
+    if fresh:
+        names = [column.name for column in table.columns]
+        connection.execute(table.insert(), [dict(zip(names, row)) for row in fresh.values()])
+    return stale
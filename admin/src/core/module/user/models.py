@@ -1,4 +1,6 @@
 from src.core.database import db
+from src.core.module.common.search import trigram_indexes
+from src.core.module.common.filters import Filter, FilterSpec
 from datetime import datetime
 
 
@@ -21,9 +23,16 @@ class User(db.Model):
         is_deleted (bool): Indicates whether the user is deleted.
         profile_image_id (int): The ID of the user's profile image.
         profile_image (ProfilePhoto): The user's profile image.
+        permissions_version (int): Stamp increased every time the access of the user changes.
     """
 
     __tablename__ = 'users'
+    __filters__ = FilterSpec({
+        'is_deleted': Filter(),
+        'enabled': Filter(),
+        'role_id': Filter(),
+    })
+    __table_args__ = trigram_indexes('users', 'email', 'alias')
 
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(100), nullable=False)
@@ -40,6 +49,8 @@ class User(db.Model):
     publications = db.relationship("Publication", back_populates="author")
     is_deleted = db.Column(db.Boolean, nullable=False, default=False)
     google_id = db.Column(db.String(30), nullable=True)
+    permissions_version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+
     def __repr__(self):
         """
         Return a string representation of the User object.
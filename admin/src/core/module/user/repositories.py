@@ -7,7 +7,7 @@ from src.core.module.common.repositories import (
 )
 from .models import ProfilePhoto, User
 from .mappers import UserMapper
-from sqlalchemy import and_
+from sqlalchemy import and_, update
 
 
 class AbstractUserRepository:
@@ -256,6 +256,8 @@ class UserRepository(AbstractUserRepository):
     administrator status.
     """
 
+    ACCESS_FIELDS = {"enabled", "system_admin", "role_id", "is_deleted"}
+
     def __init__(self):
         """
         Initialize the UserRepository.
@@ -395,6 +397,8 @@ class UserRepository(AbstractUserRepository):
             self.change_profile_photo(user_id, data["profile_image_url"]) 
         data.pop("profile_image_url")
         user.update(data)
+        if self.ACCESS_FIELDS.intersection(data):
+            self.bump_permissions_version(user_id)
         self.save()
         return True
 
@@ -430,6 +434,7 @@ class UserRepository(AbstractUserRepository):
             return False
         user.is_deleted = True
         user.enabled = False
+        self.bump_permissions_version(user_id)
         self.save()
         return True
     
@@ -448,6 +453,7 @@ class UserRepository(AbstractUserRepository):
             return False
         user.is_deleted = False
         user.enabled = True
+        self.bump_permissions_version(user_id)
         self.save()
         return True
 
@@ -471,6 +477,7 @@ class UserRepository(AbstractUserRepository):
             return False
 
         user.enabled = not user.enabled
+        self.bump_permissions_version(user_id)
         self.save()
         return True
 
@@ -513,6 +520,26 @@ class UserRepository(AbstractUserRepository):
         """
         self.db.session.commit()
 
+    def bump_permissions_version(self, user_id: int) -> int | None:
+        """
+        Increase the permission version stamp of a user.
+
+        Must be called whenever a change affects the access of the user, so the
+        permission snapshots stored in the sessions of that user become stale.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            int | None: The new version stamp, or None if the user does not exist.
+        """
+        return self.db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(permissions_version=User.permissions_version + 1)
+            .returning(User.permissions_version)
+        ).scalar()
+
     def can_be_linked(self, email: str) -> int | None:
         """
         Check if a user can be linked by their email address.
@@ -1,6 +1,7 @@
 import random
 from enum import Enum
 from faker import Faker
+from sqlalchemy import insert, select, update
 
 from src.core.module.publication.models import Publication, EstadoPublicacionEnum, TipoPublicacionEnum
 from src.core.module.charges.models import Charge, PaymentMethodEnum
@@ -12,6 +13,7 @@ from src.core.module.auth.data import PermissionEnum, RoleEnum
 from src.core.module.employee.models import Employee
 from src.core.module.payment.models import Payment
 from src.core.module.payment.data import PaymentTypeEnum
+from src.core.module.report.rollups import rebuild as rebuild_rollups
 from src.core.module.employee.data import (
     JobPositionEnum,
     JobConditionEnum,
@@ -99,6 +101,9 @@ def seed_all(app):
         seed_charges(seeding_config["counts"][SeedEntity.CHARGES])
         seed_publications(seeding_config["counts"][SeedEntity.PUBLICATIONS])
         seed_messages(seeding_config["counts"][SeedEntity.MESSAGES])
+        print("Rebuilding report rollups")
+        rebuild_rollups(db.session)
+        db.session.commit()
 
 
 def seed_accounts():
@@ -117,79 +122,140 @@ def seed_accounts():
     seed_users()
 
 
+def seed_reference_data():
+    """
+    Seeds the roles, permissions and role-permission mappings that are missing.
+
+    Used when the application starts on an initialized database, so roles or
+    permissions added to the enumerations reach it without a reset. The
+    seeders only insert the rows that are not in the database yet.
+    """
+    seed_roles()
+    seed_permissions()
+    seed_role_permissions()
+    db.session.commit()
+
+
+def seed_system_admin(email: str, password: str):
+    """
+    Creates a system administrator, unless a user with the email already exists.
+
+    Used when the application starts on a database without users, so a new
+    deployment can be logged into without seeding demo data.
+
+    Args:
+        email (str): The email of the administrator.
+        password (str): The plaintext password of the administrator.
+    """
+    if db.session.scalar(select(User.id).where(User.email == email)) is not None:
+        return
+    db.session.add(
+        User(
+            email=email,
+            alias="Administrador del Sistema",
+            password=bcrypt.generate_password_hash(password).decode("utf-8"),
+            role_id=None,
+            system_admin=True,
+        )
+    )
+    db.session.commit()
+
+
 def seed_roles():
     """
     Seeds the roles in the database.
 
-    Roles are added based on the `RoleEnum` enumeration.
+    Roles are added based on the `RoleEnum` enumeration, in a single insert
+    of the ones that do not exist yet.
     """
-    roles = [Role(name=role.value) for role in RoleEnum]
+    existing = set(db.session.scalars(select(Role.name)))
+    roles = [{"name": role.value} for role in RoleEnum if role.value not in existing]
 
-    db.session.add_all(roles)
+    if roles:
+        db.session.execute(insert(Role), roles)
 
 
 def seed_permissions():
     """
     Seeds the permissions in the database.
 
-    Permissions are added based on the `PermissionEnum` enumeration.
+    Permissions are added based on the `PermissionEnum` enumeration, in a
+    single insert of the ones that do not exist yet.
     """
-    permissions = [Permission(name=permission.value) for permission in PermissionEnum]
+    existing = set(db.session.scalars(select(Permission.name)))
+    permissions = [
+        {"name": permission.value} for permission in PermissionEnum if permission.value not in existing
+    ]
 
-    db.session.add_all(permissions)
+    if permissions:
+        db.session.execute(insert(Permission), permissions)
 
 
 def seed_role_permissions():
     """
     Seeds the role-permission relationships in the database.
 
-    This defines which permissions are granted to specific roles.
+    This defines which permissions are granted to specific roles. Only the
+    missing pairs are inserted, and the permissions version of their roles
+    is increased so the sessions of their users pick them up.
     """
     role_permissions = [
         # Administración - Equipo
-        *[RolePermission(role_id=4, permission_id=i) for i in range(1, 6)],
+        *[(4, i) for i in range(1, 6)],
         # Administración - Pagos
-        *[RolePermission(role_id=4, permission_id=i) for i in range(6, 11)],
+        *[(4, i) for i in range(6, 11)],
         # Técnica - JYA
-        *[RolePermission(role_id=1, permission_id=i) for i in range(11, 16)],
+        *[(1, i) for i in range(11, 16)],
         # Administración - JYA
-        *[RolePermission(role_id=4, permission_id=i) for i in range(11, 16)],
+        *[(4, i) for i in range(11, 16)],
         # Ecuestre - JYA
-        RolePermission(role_id=2, permission_id=11),  # JYA_INDEX
-        RolePermission(role_id=2, permission_id=15),  # JYA_SHOW
+        (2, 11),  # JYA_INDEX
+        (2, 15),  # JYA_SHOW
         # Administración - Cobros
-        *[RolePermission(role_id=4, permission_id=i) for i in range(16, 21)],
+        *[(4, i) for i in range(16, 21)],
         # Técnica - Cobros
-        RolePermission(role_id=1, permission_id=16),  # COBROS_INDEX
-        RolePermission(role_id=1, permission_id=20),  # COBROS_SHOW
+        (1, 16),  # COBROS_INDEX
+        (1, 20),  # COBROS_SHOW
         # Ecuestre - Ecuestre
-        *[RolePermission(role_id=2, permission_id=i) for i in range(21, 26)],
+        *[(2, i) for i in range(21, 26)],
         # Administración - Ecuestre
-        RolePermission(role_id=4, permission_id=21),  # ECUSTRE_INDEX
-        RolePermission(role_id=4, permission_id=25),  # ECUSTRE_SHOW
+        (4, 21),  # ECUSTRE_INDEX
+        (4, 25),  # ECUSTRE_SHOW
         # Técnica - Ecuestre
-        RolePermission(role_id=1, permission_id=21),  # ECUSTRE_INDEX
-        RolePermission(role_id=1, permission_id=25),  # ECUSTRE_SHOW
+        (1, 21),  # ECUSTRE_INDEX
+        (1, 25),  # ECUSTRE_SHOW
 
         # Administración - Publicaciones
-        *[RolePermission(role_id=4, permission_id=i) for i in range(26, 31)],
+        *[(4, i) for i in range(26, 31)],
 
         # Editor - Publicaciones - Sin destroy
-        *[RolePermission(role_id=5, permission_id=i) for i in range(26, 30)],
+        *[(5, i) for i in range(26, 30)],
 
         # Administración - Reportes
-        RolePermission(role_id=4, permission_id=31),
-        RolePermission(role_id=4, permission_id=32),
+        (4, 31),
+        (4, 32),
         # # Técnica - Reportes
-        RolePermission(role_id=1, permission_id=31),
-        RolePermission(role_id=1, permission_id=32),
+        (1, 31),
+        (1, 32),
 
         # Administración - Mensajes
-        *[RolePermission(role_id=4, permission_id=i) for i in range(33, 38)],
+        *[(4, i) for i in range(33, 38)],
 
     ]
 
-    db.session.add_all(role_permissions)
+    existing = set(db.session.execute(select(RolePermission.role_id, RolePermission.permission_id)).tuples())
+    missing = [pair for pair in dict.fromkeys(role_permissions) if pair not in existing]
+
+    if missing:
+        db.session.execute(
+            insert(RolePermission),
+            [{"role_id": role_id, "permission_id": permission_id} for role_id, permission_id in missing],
+        )
+        db.session.execute(
+            update(Role)
+            .where(Role.id.in_(sorted({role_id for role_id, _ in missing})))
+            .values(permissions_version=Role.permissions_version + 1)
+        )
 
 
 def seed_users():
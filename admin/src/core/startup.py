@@ -0,0 +1,99 @@
+"""
+Preparation of the database when the application starts.
+
+Every worker of the application server runs `create_app`, so the work done
+here must be cheap on a database that is already up to date and must happen
+only once when several workers start together.
+"""
+
+from contextlib import contextmanager
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from src.core.database import db, reset
+
+# Values of the STARTUP_MODE setting
+STARTUP_RESET = "reset"
+STARTUP_UPGRADE = "upgrade"
+
+# Key of the PostgreSQL advisory lock taken while the database is prepared
+STARTUP_LOCK_KEY = 19_2024
+
+
+def prepare_database(app):
+    """
+    Prepares the database of the application according to STARTUP_MODE.
+
+    STARTUP_RESET drops and recreates the schema and seeds it with demo
+    data, which is only meant for development. STARTUP_UPGRADE never writes
+    demo data: it applies the migrations the database is missing, seeds the
+    reference data (roles, permissions) that is missing and, on a database
+    without users, creates the system administrator of ADMIN_EMAIL and
+    ADMIN_PASSWORD. Demo data can still be added with `flask seed-db`. Any
+    other value leaves the database as it is.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    # pylint: disable=C0415
+    from src.core.seeds import seed_all
+
+    mode = app.config["STARTUP_MODE"]
+    if mode == STARTUP_RESET:
+        reset(app)
+        seed_all(app)
+    elif mode == STARTUP_UPGRADE:
+        upgrade(app)
+
+
+def upgrade(app):
+    """
+    Brings the database up to date, creating its schema if it is empty.
+
+    The work is done holding an advisory lock, so when several workers start
+    together the first one does it and the others wait for it and then find
+    nothing left to do.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    # pylint: disable=C0415
+    from src.core import migrations
+    from src.core.module.user.models import User
+    from src.core.seeds import seed_reference_data, seed_system_admin
+
+    with app.app_context():
+        with db.engine.connect() as connection, advisory_lock(connection, STARTUP_LOCK_KEY):
+            migrations.upgrade(app)
+            seed_reference_data()
+
+            if db.session.scalar(select(User.id).limit(1)) is None:
+                email, password = app.config["ADMIN_EMAIL"], app.config["ADMIN_PASSWORD"]
+                if email and password:
+                    print(f"Creating the system administrator {email}")
+                    seed_system_admin(email, password)
+                else:
+                    print("The database has no users, set ADMIN_EMAIL and ADMIN_PASSWORD to create an administrator")
+
+
+@contextmanager
+def advisory_lock(connection: Connection, key: int):
+    """
+    Holds a PostgreSQL session advisory lock inside the block.
+
+    Other databases have no advisory locks, the block runs unlocked there.
+
+    Args:
+        connection (Connection): The connection that holds the lock, kept open for the whole block.
+        key (int): The key of the lock.
+    """
+    if connection.dialect.name != "postgresql":
+        yield
+        return
+
+    connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        connection.commit()
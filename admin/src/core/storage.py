@@ -32,12 +32,18 @@ class Storage:
         """
         Initialize the storage with the given Flask app configuration.
 
+        The Minio client is only created when STORAGE_BACKEND is "minio".
+
         Args:
             app (Flask): The Flask application instance.
 
         Returns:
             Flask: The Flask application instance with storage initialized.
         """
+        app.storage = self
+        if app.config.get("STORAGE_BACKEND", "minio") != "minio":
+            return app
+
         minio_server = app.config.get("MINIO_SERVER")
         access_key = app.config.get("MINIO_ACCESS_KEY")
         secret_key = app.config.get("MINIO_SECRET_KEY")
@@ -47,8 +53,6 @@ class Storage:
             endpoint=minio_server, access_key=access_key, secret_key=secret_key, secure=secure
         )
 
-        app.storage = self
-
         return app
 
     @property
@@ -48,11 +48,9 @@ def create_app(env="development", static_folder="../../static"):
     init_wiring()
     app.context_processor(inject_session_data)
 
-    if app.config["SEED_ON_STARTUP"]:
-        from src.core.seeds import seed_all
-        from src.core.database import reset
-        reset(app)
-        seed_all(app)
+    if app.config["STARTUP_MODE"]:
+        from src.core.startup import prepare_database
+        prepare_database(app)
 
     csrf.exempt(contact_api_bp)
 
@@ -19,6 +19,10 @@ def get_publications_api(
     """
     API route to get a paginated JSON list of articles.
 
+    Sending a `cursor` parameter (empty for the first page) switches to keyset
+    pagination: the response carries the `next_cursor` to request the following
+    page instead of the page number and the total.
+
     Args:
         publication_repository (PublicationRepository): The publication repository.
 
@@ -31,6 +35,7 @@ def get_publications_api(
     published_to = request.args.get("published_to")
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
+    cursor = request.args.get("cursor")
 
     search_query = {"filters": {}}
 
@@ -51,17 +56,27 @@ def get_publications_api(
             return jsonify({"error": "Invalid format for published_to"}), 400
 
     search_query["filters"]["status"] = EstadoPublicacionEnum.PUBLISHED.name
-    publications = publication_repository.get_page(page, per_page, search_query, order_by=[("publish_date", "desc")])
+    publications = publication_repository.get_page(
+        page,
+        per_page,
+        search_query,
+        order_by=[("publish_date", "desc")],
+        keyset=cursor is not None,
+        cursor=cursor,
+    )
 
     response_data = {
         "data": [
             PublicationMapper.to_api(publication)
             for publication in publications
         ],
-        "page": page,
         "per_page": per_page,
-        "total": publications.total,
     }
+    if cursor is not None:
+        response_data["next_cursor"] = publications.next_cursor
+    else:
+        response_data["page"] = page
+        response_data["total"] = publications.total
 
     return jsonify(response_data), 200
 
@@ -1,6 +1,8 @@
 from flask import (
     abort,
+    current_app,
     Blueprint,
+    Response,
     render_template,
     request,
     url_for,
@@ -21,7 +23,7 @@ from src.core.module.auth import (
     UserLoginForm,
     UserRegisterForm,
 )
-from src.web.helpers.auth import is_authenticated, login_required
+from src.web.helpers.auth import is_authenticated, login_required, refresh_permissions_snapshot
 
 auth_bp = Blueprint(
     "auth_bp", __name__, template_folder="../templates/accounts", url_prefix="/auth"
@@ -38,14 +40,12 @@ google_bp = make_google_blueprint(
 auth_bp.register_blueprint(google_bp, url_prefix="/login/google")
 
 
-@inject
-def create_session(user: dict, auth_services: AAS = Provide[Container.auth_services]):
+def create_session(user: dict):
     session["user"] = user["id"]
     session["user_name"] = user["alias"]
     session["is_authenticated"] = True
     session["is_admin"] = user["system_admin"]
-    permissions = auth_services.get_permissions_of(user["id"])
-    session["permissions"] = permissions
+    refresh_permissions_snapshot(user["id"])
 
 
 @auth_bp.route("/login/google")
@@ -163,11 +163,19 @@ def get_profile_photo(
         storage_service (AbstractStorageServices): The storage service.
 
     Returns:
-        Bytes: The profile photo.
+        Response: The profile photo thumbnail, with ETag and Cache-Control headers.
     """
-    return storage_service.get_profile_image(
+    image = storage_service.get_profile_thumbnail(
         user_repository.get_profile_image_url(user_id)
     )
+    if image is None:
+        abort(404)
+
+    response = Response(image["data"], mimetype=image["content_type"])
+    response.set_etag(image["etag"])
+    response.cache_control.private = True
+    response.cache_control.max_age = current_app.config.get("PROFILE_IMAGE_MAX_AGE", 3600)
+    return response.make_conditional(request)
 
 
 @auth_bp.route("/login", methods=["GET", "POST"])
@@ -331,9 +339,9 @@ def edit_profile(
                 file = form.profile_image.data
                 old = user_repository.get_profile_image_url(user_id)
                 if old:
-                    storage_service.delete_file(old)
+                    storage_service.delete_profile_image(old)
 
-                response = storage_service.upload_file(
+                response = storage_service.upload_profile_image(
                     file, path=user_repository.storage_path
                 )
                 if response is None:
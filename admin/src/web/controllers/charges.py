@@ -12,6 +12,7 @@ from src.core.module.charges import (
     ChargeMapper as Mapper
 )
 from src.core.module.employee import AbstractEmployeeRepository
+from src.core.module.common import COUNT_CACHED, COUNT_ESTIMATED
 
 charges_bp = Blueprint(
     "charges_bp", __name__, template_folder="../templates/charges", url_prefix="/cobros"
@@ -41,8 +42,11 @@ def search_charges(search: ChargeSearchForm,
             "is_archived": need_archived
         }
     }
+    # Unfiltered lists show the planner estimate, searches reuse their count for a few seconds
+    count = COUNT_ESTIMATED
 
     if search.submit_search.data and search.validate():
+        count = COUNT_CACHED
         order_by = [(search.order_by.data, search.order.data)]
         search_query = {
             "text": search.search_text.data,
@@ -58,7 +62,7 @@ def search_charges(search: ChargeSearchForm,
             search_query["filters"]["finish_date"] = search.finish_date.data
 
     return charges_repository.get_page(
-        page=page, per_page=per_page, order_by=order_by, search_query=search_query
+        page=page, per_page=per_page, order_by=order_by, search_query=search_query, count=count, projected=True
     )
 
 
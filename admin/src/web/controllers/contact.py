@@ -4,6 +4,7 @@ from src.web.helpers.auth import check_user_permissions
 from src.core.container import Container
 from src.core.module.contact import AbstractContactRepository, ContactSearchForm
 from src.core.module.contact.models import MessageStateEnum
+from src.core.module.common import COUNT_CACHED, COUNT_ESTIMATED
 
 contact_bp = Blueprint("contact_bp", __name__, url_prefix="/contact")
 
@@ -93,7 +94,10 @@ def search_messages(
             "is_deleted": need_archive,
         }
     }
+    # Unfiltered lists show the planner estimate, searches reuse their count for a few seconds
+    count = COUNT_ESTIMATED
     if search.submit_search.data:
+        count = COUNT_CACHED
         order_by = [(search.order_by.data, search.order.data)]
         search_query["text"] = search.search_text.data
         search_query["field"] = search.search_by.data
@@ -105,6 +109,7 @@ def search_messages(
         per_page=per_page,
         order_by=order_by,
         search_query=search_query,
+        count=count,
     )
     return paginated_messages
 
@@ -12,7 +12,7 @@ from src.core.module.employee import (
     EmployeeDocumentSearchForm,
     employment_enums as employment_information,
 )
-from src.core.module.common import AbstractStorageServices, FileMapper
+from src.core.module.common import AbstractStorageServices, FileMapper, unreferenced_paths, FULL_TEXT_FIELD
 from src.core.module.user import (
     AbstractUserRepository,
     AccountSearchForm,
@@ -64,7 +64,12 @@ def search_employees(
             search_query["filters"]["is_active"] = search.filter_is_active.data
 
     paginated_employees = employees.get_page(
-        page=page, per_page=per_page, order_by=order_by, search_query=search_query
+        page=page,
+        per_page=per_page,
+        order_by=order_by,
+        search_query=search_query,
+        full_text=search_query.get("field") == FULL_TEXT_FIELD,
+        projected=True,
     )
     return paginated_employees
 
@@ -218,9 +223,8 @@ def add_document(
         )
 
     if create_form.upload_type.data == "file":
-        uploaded_document = storage.upload_file(
+        uploaded_document = storage.upload_document(
             file=create_form.file.data,
-            path=employees.storage_path,
             title=create_form.title.data,
         )
 
@@ -677,9 +681,8 @@ def update_documents(
 
     employee_id = employee["id"]
     if add_form.upload_type.data == "file":
-        uploaded_document = storage.upload_file(
+        uploaded_document = storage.upload_document(
             file=add_form.file.data,
-            path=employee_repository.storage_path,
             title=add_form.title.data,
         )
     else:
@@ -730,7 +733,7 @@ def delete_document(
     document_id = int(request.form["item_id"])
     document = employees.get_document(employee_id, document_id)
 
-    if not document.get("is_link"):
+    if not document.get("is_link") and unreferenced_paths([document["path"]], [document["id"]]):
         deleted_in_bucket = storage.delete_file(document.get("path"))
         if not deleted_in_bucket:
             flash(
@@ -875,9 +878,8 @@ def update_document(
 
     if edit_form.upload_type.data == "file":
         if edit_form.file.data:
-            uploaded_document = storage.upload_file(
+            uploaded_document = storage.upload_document(
                 edit_form.file.data,
-                employee_repository.storage_path,
                 title=edit_form.title.data,
             )
         else:
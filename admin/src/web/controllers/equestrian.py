@@ -2,7 +2,7 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash
 from dependency_injector.wiring import inject, Provide
 from src.core.module.employee import AbstractEmployeeRepository
 from src.core.module.employee.forms import TrainerSearchForm, TrainerSelectForm, EmployeeSearchForm
-from src.core.module.common import AbstractStorageServices, FileMapper
+from src.core.module.common import AbstractStorageServices, FileMapper, unreferenced_paths, FULL_TEXT_FIELD
 from src.web.helpers.auth import check_user_permissions
 from src.core.container import Container
 from src.core.module.equestrian.forms import (
@@ -55,7 +55,12 @@ def search_horses(search: HorseSearchForm,
             search_query["filters"]["ja_type"] = search.filter_ja_type.data
 
     return equestrian_repository.get_page(
-        page=page, per_page=per_page, order_by=order_by, search_query=search_query
+        page=page,
+        per_page=per_page,
+        order_by=order_by,
+        search_query=search_query,
+        full_text=search_query.get("field") == FULL_TEXT_FIELD,
+        projected=True,
     )
 
 
@@ -256,8 +261,8 @@ def add_document(horse,
         return render_template("./equestrian/create_document.html", form=create_form, horse=horse)
 
     if create_form.upload_type.data == "file":
-        uploaded_document = storage.upload_file(
-            file=create_form.file.data, path=equestrian_repository.storage_path, title=create_form.title.data)
+        uploaded_document = storage.upload_document(
+            file=create_form.file.data, title=create_form.title.data)
 
         if not uploaded_document:
             flash(f"No se pudo subir el archivo, inténtelo nuevamente", "danger")
@@ -443,7 +448,7 @@ def delete_document(
         flash(f"El documento solicitado no existe", "danger")
         return redirect(url_for("equestrian_bp.edit_documents", horse_id=horse_id))
 
-    if not document.get("is_link"):
+    if not document.get("is_link") and unreferenced_paths([document["path"]], [document["id"]]):
         deleted_in_bucket = storage.delete_file(document.get("path"))
         if not deleted_in_bucket:
             flash("No se ha podido eliminar el documento, inténtelo nuevamente", "danger")
@@ -537,9 +542,8 @@ def update_document(horse: dict,
 
     if edit_form.upload_type.data == 'file':
         if edit_form.file.data:
-            uploaded_document = storage.upload_file(
+            uploaded_document = storage.upload_document(
                 edit_form.file.data,
-                equestrian_repository.storage_path,
                 title=edit_form.title.data
             )
         else:
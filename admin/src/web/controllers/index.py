@@ -1,11 +1,15 @@
-from flask import Blueprint, render_template, redirect, request, flash, url_for, session, Response
-import requests
+import re
+from flask import Blueprint, render_template, redirect, request, flash, url_for, session
 from src.core.module.auth import AbstractAuthServices
 from src.core.container import Container
+from src.web.helpers.storage import send_storage_file
 from dependency_injector.wiring import inject, Provide
 
 index_bp = Blueprint("index_bp", __name__, template_folder="../templates", url_prefix="/")
 
+# Name of the objects stored by content hash
+CONTENT_NAME = re.compile(r"[0-9a-f]{64}")
+
 
 @index_bp.route("/")
 def index():
@@ -34,11 +38,13 @@ def home():
 def download_url(storage_services=Provide[Container.storage_services],
                  auth_services: AbstractAuthServices = Provide[Container.auth_services]):
     """
-    Generates a presigned download URL for a file and downloads the file in it.
+    Streams a file from the storage to the client as a download.
 
-    Retrieves the file path from the query parameters, generates a presigned download URL
-    using the storage service, and downloads the file in it. If the file path is not
-    provided or the URL cannot be generated, the user is redirected back with an error message.
+    Retrieves the file path and the optional download name from the query parameters
+    and pipes the file in chunks, supporting Range and If-None-Match requests for
+    resumable and cached downloads.
+    If the file path is not provided or the file cannot be found, the user is
+    redirected back with an error message.
 
     Args:
         storage_services (AbstractStorageServices): The storage service for managing files.
@@ -60,23 +66,29 @@ def download_url(storage_services=Provide[Container.storage_services],
         flash("No se proporcionó una ruta de archivo", "danger")
         return redirect(return_url)
 
-    url = storage_services.presigned_download_url(path)
-
-    if not url:
+    filename = request.args.get("filename") or legacy_download_name(path)
+    response = send_storage_file(storage_services, path, download_name=filename)
+    if response is None:
         flash("No se pudo descargar el archivo", "danger")
         return redirect(return_url)
 
-    response = requests.get(url, stream=True)
-    if response.status_code != 200:
-        flash("No se pudo descargar el archivo", "danger")
-        return redirect(return_url)
+    return response
+
+
+def legacy_download_name(path: str) -> str:
+    """
+    Gets the download name of a file from its storage path, for links that do not give one.
+
+    Files uploaded before content addressing embed their title after a
+    32 character ULID, the others are named after their content hash.
+
+    Args:
+        path (str): The storage path of the file.
 
-    filename = path.split("/")[-1]
-    filename = filename[32:]
-    return Response(
-        response.iter_content(chunk_size=8192),
-        headers={
-            'Content-Disposition': 'attachment; filename=' + filename,
-            'Content-Type': response.headers.get('Content-Type', 'application/octet-stream')
-        }
-    )
+    Returns:
+        str: The download name.
+    """
+    name = path.split("/")[-1]
+    if CONTENT_NAME.fullmatch(name):
+        return name
+    return name[32:] or name
@@ -8,7 +8,14 @@ Flask, Flask-WTF, and dependency injection for form handling and validation.
 
 from flask import Blueprint, render_template, request, url_for, redirect, flash
 from dependency_injector.wiring import inject, Provide 
-from src.core.module.common import AbstractStorageServices, FileMapper
+from src.core.module.common import (
+    AbstractStorageServices,
+    FileMapper,
+    unreferenced_paths,
+    FULL_TEXT_FIELD,
+    PROFILE_DETAIL,
+    PROFILE_EDIT,
+)
 from src.web.helpers.auth import check_user_permissions
 from src.core.container import Container
 from src.core.module.jockey_amazon import (
@@ -67,7 +74,12 @@ def search_jockeys(
             search_query["filters"]["has_debts"] = search.filter_debtors.data
 
     paginated_jockeys = jockeys.get_page(
-        page=page, per_page=per_page, order_by=order_by, search_query=search_query
+        page=page,
+        per_page=per_page,
+        order_by=order_by,
+        search_query=search_query,
+        full_text=search_query.get("field") == FULL_TEXT_FIELD,
+        projected=True,
     )
     return paginated_jockeys
 
@@ -136,7 +148,7 @@ def show_jockey(
     Returns:
         A rendered template displaying the details of the jockey or amazon.
     """
-    jockey = jockeys.get_by_id(jockey_id=jockey_id)
+    jockey = jockeys.get_by_id(jockey_id=jockey_id, profile=PROFILE_DETAIL)
     if not jockey:
         return redirect(url_for("jockey_amazon_bp.get_jockeys"))
 
@@ -299,9 +311,8 @@ def add_document(
         )
 
     if create_form.upload_type.data == "file":
-        uploaded_document = storage.upload_file(
+        uploaded_document = storage.upload_document(
             file=create_form.file.data,
-            path=jockey_repository.storage_path,
             title=create_form.title.data,
         )
 
@@ -410,7 +421,7 @@ def delete_document(
     """
     document_id = int(request.form["item_id"])
     document = jockey_repository.get_document(jockey_id, document_id)
-    if not document.get("is_link"):
+    if not document.get("is_link") and unreferenced_paths([document["path"]], [document["id"]]):
         deleted_in_bucket = storage.delete_file(document.get("path"))
         if not deleted_in_bucket:
             flash(
@@ -453,7 +464,7 @@ def edit_document(
     Returns:
         A rendered template with the document edit form if validation fails, or a redirect to the document list if successful.
     """
-    jockey = Mapper.from_entity(jockey_repository.get_by_id(jockey_id=jockey_id))
+    jockey = Mapper.from_entity(jockey_repository.get_by_id(jockey_id=jockey_id, profile=PROFILE_EDIT))
     if not jockey:
         flash(f"El jockey con ID = {jockey_id} no existe", "danger")
         return redirect(url_for("jockey_amazon_bp.get_jockeys"))
@@ -515,9 +526,8 @@ def update_document(
 
     if edit_form.upload_type.data == "file":
         if edit_form.file.data:
-            uploaded_document = storage.upload_file(
+            uploaded_document = storage.upload_document(
                 edit_form.file.data,
-                jockey_repository.storage_path,
                 title=edit_form.title.data,
             )
         else:
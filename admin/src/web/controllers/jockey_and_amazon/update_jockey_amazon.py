@@ -10,6 +10,7 @@ from flask import Blueprint, render_template, request, url_for, redirect, flash
 from dependency_injector.wiring import inject, Provide
 from src.web.helpers.auth import check_user_permissions
 from src.core.container import Container
+from src.core.module.common import PROFILE_EDIT
 from src.core.module.equestrian import (
     AbstractEquestrianRepository,
     HorseAssignSearchForm,
@@ -167,7 +168,7 @@ def edit_jockey(
         A rendered template with the edit forms if validation fails, or a redirect to the jockey's detail page if successful.
     """
     current_tab = None
-    jockey = Mapper.from_entity(jockeys.get_by_id(jockey_id))
+    jockey = Mapper.from_entity(jockeys.get_by_id(jockey_id, profile=PROFILE_EDIT))
     if not jockey:
         flash("No se ha encontrado al Jockey/Amazona solicitado", "warning")
         return redirect(url_for("jockey_amazon_bp.get_jockeys"))
@@ -46,7 +46,9 @@ def get_payments(
     per_page = request.args.get("per_page", 10, type=int)
     search_query["is_archived"] = False
 
-    payments = payment_repository.get_page(page, per_page, search_query, order_by)
+    payments = payment_repository.get_page(
+        page, per_page, search_query=search_query, order_by=order_by, projected=True
+    )
 
     return render_template("./payment/payments.html", form=form, payments=payments)
 
@@ -216,7 +218,9 @@ def get_archived_payments(
     
     search_query["is_archived"] = True
 
-    payments = payment_repository.get_page(page, per_page, search_query, order_by)
+    payments = payment_repository.get_page(
+        page, per_page, search_query=search_query, order_by=order_by, projected=True
+    )
     return render_template("./payment/payments_archived.html", form=form, payments=payments)
 
 
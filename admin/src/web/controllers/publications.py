@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject, Provide
 from src.core.module.publication.mappers import PublicationMapper
 from src.core.module.publication.forms import PublicationSearchForm, PublicationCreateForm, PublicationEditForm
 from src.core.module.publication import PublicationRepository, AbstractPublicationRepository
+from src.core.module.common import FULL_TEXT_FIELD
 from src.web.helpers.auth import check_user_permissions
 from src.core.container import Container
 import nh3
@@ -58,7 +59,8 @@ def get_publications(
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
 
-    publications = publication_repository.get_page(page, per_page, search_query, order_by)
+    full_text = search_query.get("field") == FULL_TEXT_FIELD
+    publications = publication_repository.get_page(page, per_page, search_query, order_by, full_text)
 
     return render_template("./publication/publications.html",
                            search_form=form, publications=publications, are_deleted=deleted)
@@ -1,47 +1,43 @@
-from flask import Blueprint, render_template, request
+from datetime import date
+from flask import Blueprint, Response, abort, jsonify, render_template, request, stream_with_context
 from dependency_injector.wiring import inject, Provide
-from src.core.module.report.forms import ChargeSearchForm
+from src.core.module.report.forms import ChargeSearchForm, IncomeSeriesForm
+from src.core.module.report.repositories import AbstractReportRepository
 from src.core.container import Container
 from src.core.module.charges.repositories import AbstractChargeRepository
 from src.core.module.jockey_amazon.repositories import AbstractJockeyAmazonRepository
 from src.web.helpers.auth import check_user_permissions
+from src.web.helpers.export import csv_stream, xlsx_stream, CSV_MIMETYPE, XLSX_MIMETYPE
 report_bp = Blueprint(
     "report_bp", __name__, template_folder="../templates/report", url_prefix="/reportes"
 )
 
+# Writer and content type of each export format of the charges history
+EXPORT_FORMATS = {
+    "csv": (csv_stream, CSV_MIMETYPE),
+    "xlsx": (xlsx_stream, XLSX_MIMETYPE),
+}
+CHARGES_EXPORT_HEADER = ["Apellido", "Nombre", "Fecha de cobro", "Monto", "Método de pago"]
+
 
 @report_bp.route("/", methods=["GET"])
 @check_user_permissions(['report_index'])
 @inject
 def index(
-    charge_repository: AbstractChargeRepository = Provide[Container.charges_repository],
-    jockey_amazon_repository: AbstractJockeyAmazonRepository = Provide[Container.jockey_amazon_repository],
+    report_repository: AbstractReportRepository = Provide[Container.report_repository],
 ):
-    # 1. KPIs
-    total_jya = jockey_amazon_repository.total_jya()
-    current_month_income = charge_repository.current_month_income()
-    # 2. Gráfico de Propuestas Elegidas (para gráfico de torta)
-    proposals_data = jockey_amazon_repository.proposals_data()
-
-    # 3. Gráficos de Clientes
-    certified_jya = jockey_amazon_repository.certified_jya()
-    uncertified_jya = total_jya - certified_jya
-
-    # Gráfico por Tipo de Cliente
-    disability_types_data = jockey_amazon_repository.disability_types_data()
-
-    # Gráfico por Categoría de Cliente
-    disability_data = jockey_amazon_repository.disability_data()
+    # KPIs y datos de los gráficos, en una sola consulta
+    report = report_repository.dashboard()
 
     # Pasar los datos al template
     return render_template('report/index.html', 
-                           total_jya=total_jya,
-                           current_month_income=current_month_income,
-                           proposals_data=proposals_data,
-                           certified_jya=certified_jya,
-                           disability_types_data=disability_types_data,
-                           disability_data=disability_data,
-                           uncertified_jya=uncertified_jya)
+                           total_jya=report.total_jya,
+                           current_month_income=report.current_month_income,
+                           proposals_data=report.proposals_data,
+                           certified_jya=report.certified_jya,
+                           disability_types_data=report.disability_types_data,
+                           disability_data=report.disability_data,
+                           uncertified_jya=report.uncertified_jya)
 
 
 @report_bp.route("/ranking_propousals", methods=["GET"])
@@ -49,19 +45,16 @@ def index(
 @check_user_permissions(['report_show'])
 @inject
 def reports_proposals(
-    charge_repository: AbstractChargeRepository = Provide[Container.charges_repository],
-    jockey_amazon_repository: AbstractJockeyAmazonRepository = Provide[Container.jockey_amazon_repository],
+    report_repository: AbstractReportRepository = Provide[Container.report_repository],
 ):
     # 1. KPIs
-    total_jya = jockey_amazon_repository.total_jya()
-    current_month_income = charge_repository.current_month_income()
-    proposals_data = jockey_amazon_repository.proposals_data()
-    proposals_data = sorted(proposals_data, key=lambda x: x[1], reverse=True)
+    report = report_repository.dashboard()
+    proposals_data = sorted(report.proposals_data, key=lambda x: x[1], reverse=True)
     # Lógica para generar el reporte de ranking de propuestas de trabajo más solicitadas
     return render_template("report/reports_proposals.html", 
                             proposals_data=proposals_data,
-                            total_jya = total_jya,
-                            current_month_income=current_month_income
+                            total_jya = report.total_jya,
+                            current_month_income=report.current_month_income
                             )
 
 
@@ -69,19 +62,18 @@ def reports_proposals(
 @check_user_permissions(['report_show'])
 @inject
 def reports_debtors(
-    charge_repository: AbstractChargeRepository = Provide[Container.charges_repository],
     jockey_amazon_repository: AbstractJockeyAmazonRepository = Provide[Container.jockey_amazon_repository],
+    report_repository: AbstractReportRepository = Provide[Container.report_repository],
 ):
      # 1. KPIs
-    total_jya = jockey_amazon_repository.total_jya()
-    current_month_income = charge_repository.current_month_income()
+    report = report_repository.dashboard()
     #obtener los deudores
     debtors = jockey_amazon_repository.debtors()
     # Lógica para generar el reporte de personas que adeudan pagos
     return render_template("report/reports_debtors.html", 
                            debtors=debtors,
-                           total_jya = total_jya,
-                             current_month_income=current_month_income)
+                           total_jya = report.total_jya,
+                             current_month_income=report.current_month_income)
 
 
 @report_bp.route("/historico_cobros", methods=["GET"])
@@ -89,11 +81,10 @@ def reports_debtors(
 @inject
 def reports_charges(
     charge_repository: AbstractChargeRepository = Provide[Container.charges_repository],
-    jockey_amazon_repository: AbstractJockeyAmazonRepository = Provide[Container.jockey_amazon_repository],
+    report_repository: AbstractReportRepository = Provide[Container.report_repository],
 ):
     # 1. KPIs
-    total_jya = jockey_amazon_repository.total_jya()
-    current_month_income = charge_repository.current_month_income()
+    report = report_repository.dashboard()
     payments_data, cant = charge_repository.last_payments_data()
 
     # Instantiate the form with request arguments
@@ -124,6 +115,101 @@ def reports_charges(
     return render_template("report/reports_charges.html", 
                            payments_data=payments_data,
                            filter_form=filter_form,  
-                           total_jya=total_jya,
-                           current_month_income=current_month_income,
-                           cant_charges=cant)
\ No newline at end of file
+                           total_jya=report.total_jya,
+                           current_month_income=report.current_month_income,
+                           cant_charges=cant)
+
+
+@report_bp.route("/historico_cobros/exportar/<string:file_format>", methods=["GET"])
+@check_user_permissions(['report_show'])
+@inject
+def export_charges(
+    file_format: str,
+    charge_repository: AbstractChargeRepository = Provide[Container.charges_repository],
+):
+    """
+    Export every charge matching the filters of the charges history as a CSV or XLSX file.
+
+    The rows are read from a server-side cursor and written to the response
+    as they arrive, so the memory of the request does not grow with the
+    number of charges. The limit of the form is ignored.
+
+    Args:
+        file_format (str): "csv" or "xlsx".
+        charge_repository (AbstractChargeRepository): The charge repository.
+
+    Returns:
+        Response: The streamed file.
+    """
+    if file_format not in EXPORT_FORMATS:
+        abort(404)
+
+    filters = {}
+    filter_form = ChargeSearchForm(request.args)
+    if filter_form.validate():
+        filters = {
+            "search_text": filter_form.search_text.data,
+            "start_date": filter_form.start_date.data,
+            "end_date": filter_form.end_date.data,
+            "amount": filter_form.amount.data,
+            "payment_method": filter_form.payment_method.data,
+        }
+
+    rows = (
+        (charge.last_name, charge.first_name, charge.date_of_charge, charge.amount, charge.payment_method.value)
+        for charge in charge_repository.stream_history(**filters)
+    )
+    writer, mimetype = EXPORT_FORMATS[file_format]
+    response = Response(stream_with_context(writer(CHARGES_EXPORT_HEADER, rows)), mimetype=mimetype)
+    response.headers.set("Content-Disposition", "attachment", filename=f"historico_cobros.{file_format}")
+    return response
+
+
+@report_bp.route("/ingresos", methods=["GET"])
+@check_user_permissions(['report_show'])
+@inject
+def reports_income(
+    report_repository: AbstractReportRepository = Provide[Container.report_repository],
+):
+    """
+    Show the income of each month or week of a range as a chart.
+
+    Args:
+        report_repository (AbstractReportRepository): The report repository.
+
+    Returns:
+        str: The rendered report.
+    """
+    report = report_repository.dashboard()
+    filter_form = IncomeSeriesForm(request.args)
+    # Con una selección inválida se muestran los errores y el último año
+    selected_form = filter_form if filter_form.validate() else IncomeSeriesForm(formdata=None)
+    series = report_repository.income_series(*selected_form.selection(date.today()))
+
+    return render_template("report/reports_income.html",
+                           chart=series.to_chart(),
+                           filter_form=filter_form,
+                           total_jya=report.total_jya,
+                           current_month_income=report.current_month_income)
+
+
+@report_bp.route("/ingresos/datos", methods=["GET"])
+@check_user_permissions(['report_show'])
+@inject
+def income_data(
+    report_repository: AbstractReportRepository = Provide[Container.report_repository],
+):
+    """
+    Get the chart data of the income series, with the arguments of the income report.
+
+    Args:
+        report_repository (AbstractReportRepository): The report repository.
+
+    Returns:
+        Response: The labels of the periods and a dataset per series, or the errors of the arguments.
+    """
+    filter_form = IncomeSeriesForm(request.args)
+    if not filter_form.validate():
+        return jsonify({"errors": filter_form.errors}), 400
+    series = report_repository.income_series(*filter_form.selection(date.today()))
+    return jsonify(series.to_chart())
@@ -247,8 +247,9 @@ def update_user(
         file = edit_form.profile_image.data
         old = user_repository.get_profile_image_url(user_id)
         if old:
-            storage_service.delete_file(old)
-        profile_image_url = storage_service.upload_file(file, path=user_repository.storage_path)["path"]
+            storage_service.delete_profile_image(old)
+        uploaded_image = storage_service.upload_profile_image(file, path=user_repository.storage_path)
+        profile_image_url = uploaded_image.get("path") if uploaded_image else None
         if not profile_image_url:
             flash("No se pudo actualizar la foto de perfil", "danger")
         
@@ -1,6 +1,6 @@
 from typing import List
 from functools import wraps
-from flask import session, redirect, url_for
+from flask import current_app, session, redirect, url_for
 from dependency_injector.wiring import inject, Provide
 from src.core.container import Container
 from src.core.module.auth import AbstractAuthServices
@@ -30,6 +30,33 @@ def login_required(f):
     return decorated_function
 
 
+@inject
+def refresh_permissions_snapshot(
+        user_id: int,
+        auth: AbstractAuthServices = Provide[Container.auth_services]
+):
+    """
+    Load the access data of the user from the database and store it in the session.
+
+    Args:
+        user_id (int): The ID of the logged user.
+        auth (AbstractAuthServices): The authentication services.
+
+    Returns:
+        Dict | None: The stored permission snapshot, or None if the user does not exist.
+    """
+    access = auth.get_user_access(user_id)
+    if access is None:
+        session.pop("permissions_snapshot", None)
+        return None
+
+    snapshot = auth.build_permissions_snapshot(user_id, access)
+    session["permissions_snapshot"] = snapshot
+    session["permissions"] = snapshot["permissions"]
+    session["is_admin"] = snapshot["system_admin"]
+    return snapshot
+
+
 def check_user_permissions(permissions_required: List[str]):
     def decorator(f):  # need extra decorator because im passing an argument
         @wraps(f)
@@ -39,10 +66,19 @@ def check_user_permissions(permissions_required: List[str]):
                 auth: AbstractAuthServices = Provide[Container.auth_services],
                 **kwargs
         ):
+            if not is_authenticated(session):
+                return redirect(url_for("auth_bp.login"))
+
             user_id = session.get("user")
-            if not is_authenticated(session) or not auth.has_permissions(
-                    user_id, permissions_required
-            ):
+            stored = session.get("permissions_snapshot")
+            max_age = current_app.config.get("PERMISSIONS_SNAPSHOT_TTL", 60)
+            snapshot = auth.current_snapshot(user_id, stored, max_age)
+            if snapshot is None:
+                snapshot = refresh_permissions_snapshot(user_id, auth=auth)
+            elif snapshot is not stored:
+                session["permissions_snapshot"] = snapshot
+
+            if not snapshot or not auth.snapshot_allows(snapshot, permissions_required):
                 return redirect(url_for("auth_bp.login"))
             return f(*args, **kwargs)
 
@@ -0,0 +1,96 @@
+import csv
+import io
+import os
+import tempfile
+from datetime import date, datetime
+from typing import Iterable, Iterator, Sequence
+
+import xlsxwriter
+
+# Number of rows written between two chunks sent to the client
+ROWS_PER_CHUNK = 500
+# Size in bytes of the chunks of the XLSX files sent to the client
+XLSX_CHUNK_SIZE = 64 * 1024
+
+# First characters that make spreadsheets read a CSV cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+CSV_MIMETYPE = "text/csv"
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def csv_stream(header: Sequence[str], rows: Iterable[Sequence]) -> Iterator[bytes]:
+    """
+    Write rows as a UTF-8 CSV file, chunk by chunk.
+
+    The file starts with a byte order mark so spreadsheets read the accents
+    right. Text cells starting like a formula are prefixed with an apostrophe,
+    so spreadsheets show them as text instead of evaluating them.
+
+    Args:
+        header (Sequence[str]): The names of the columns.
+        rows (Iterable[Sequence]): The rows, consumed lazily.
+
+    Yields:
+        bytes: The next chunk of the file.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    for index, row in enumerate(rows, start=1):
+        writer.writerow(_csv_value(value) for value in row)
+        if index % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def xlsx_stream(header: Sequence[str], rows: Iterable[Sequence], sheet_name: str = "Hoja1") -> Iterator[bytes]:
+    """
+    Write rows as the single sheet of an XLSX workbook, chunk by chunk.
+
+    The workbook is written with xlsxwriter in constant memory mode, which
+    flushes every row to a temporary file as soon as the next one starts,
+    so memory stays flat whatever the number of rows. The archive is built
+    in a temporary directory and sent once the last row is written. Dates
+    are stored as dates and text is never read as a formula.
+
+    Args:
+        header (Sequence[str]): The names of the columns.
+        rows (Iterable[Sequence]): The rows, consumed lazily.
+        sheet_name (str): The name of the sheet.
+
+    Yields:
+        bytes: The next chunk of the file.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "export.xlsx")
+        workbook = xlsxwriter.Workbook(path, {
+            "constant_memory": True,
+            "tmpdir": directory,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+            "default_date_format": "dd/mm/yyyy",
+            "remove_timezone": True,
+        })
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, header)
+        for index, row in enumerate(rows, start=1):
+            worksheet.write_row(index, 0, row)
+        workbook.close()
+
+        with open(path, "rb") as file:
+            yield from iter(lambda: file.read(XLSX_CHUNK_SIZE), b"")
+
+
+def _csv_value(value):
+    """Converts a value to the text of a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
@@ -0,0 +1,99 @@
+from flask import Response, request
+from src.core.module.common import AbstractStorageServices
+
+
+def send_storage_file(
+        storage: AbstractStorageServices,
+        filename: str,
+        download_name: str | None = None,
+        max_age: int = 0,
+) -> Response | None:
+    """
+    Build a streaming response for a file kept in the storage.
+
+    The file is piped to the client in fixed-size chunks, so it is never held
+    whole in memory. Conditional requests (If-None-Match) are answered with a
+    304 and single byte ranges (Range, If-Range) with a 206, which allows
+    cached and resumable downloads.
+
+    Args:
+        storage (AbstractStorageServices): The storage service holding the file.
+        filename (str): The full name of the file in the storage.
+        download_name (str | None): If given, the file is sent as an attachment with this name.
+        max_age (int): Seconds the client may cache the file without revalidating it.
+
+    Returns:
+        Response | None: The response to return, or None if the file does not exist.
+    """
+    metadata = storage.stat_file(filename)
+    if metadata is None:
+        return None
+
+    etag = metadata["etag"]
+    size = metadata["size"]
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        _set_cache_headers(response, metadata, max_age)
+        return response
+
+    start, stop, status = 0, size, 200
+    if request.range and len(request.range.ranges) == 1 and _range_is_current(metadata):
+        byte_range = request.range.range_for_length(size)
+        if byte_range is None:
+            response = Response(status=416)
+            response.headers["Content-Range"] = f"bytes */{size}"
+            return response
+        start, stop = byte_range
+        status = 206
+
+    response = Response(
+        storage.stream_file(filename, offset=start, length=stop - start),
+        status=status,
+        mimetype=metadata["content_type"],
+        direct_passthrough=True,
+    )
+    response.content_length = stop - start
+    response.headers["Accept-Ranges"] = "bytes"
+    if status == 206:
+        response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+    if download_name:
+        response.headers.set("Content-Disposition", "attachment", filename=download_name)
+    _set_cache_headers(response, metadata, max_age)
+    return response
+
+
+def _range_is_current(metadata: dict) -> bool:
+    """
+    Check the If-Range precondition of the request against the stored file.
+
+    Args:
+        metadata (dict): The metadata of the stored file.
+
+    Returns:
+        bool: True if the requested range can be served, False if the whole file must be sent.
+    """
+    if_range = request.if_range
+    if if_range.etag:
+        return if_range.etag == metadata["etag"]
+    if if_range.date and metadata["last_modified"]:
+        return metadata["last_modified"] <= if_range.date
+    return True
+
+
+def _set_cache_headers(response: Response, metadata: dict, max_age: int):
+    """
+    Set the validators and caching policy of a storage file response.
+
+    Args:
+        response (Response): The response to update.
+        metadata (dict): The metadata of the stored file.
+        max_age (int): Seconds the client may cache the file without revalidating it.
+    """
+    response.set_etag(metadata["etag"])
+    response.last_modified = metadata["last_modified"]
+    response.cache_control.private = True
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
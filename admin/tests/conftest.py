@@ -0,0 +1,29 @@
+from uuid import uuid4
+
+import pytest
+
+import src.web  # noqa: F401, the modules import each other in the order the app loads them
+from src.core.module.employee.data import JobConditionEnum, JobPositionEnum, ProfessionsEnum
+from src.core.module.employee.models import Employee
+
+
+def make_employee(**fields) -> Employee:
+    """Build an employee with a unique DNI and email, overriding the given fields"""
+    unique = uuid4().hex
+    values = {
+        "name": "Test",
+        "lastname": "Employee",
+        "dni": str(int(unique, 16))[:10],
+        "email": f"{unique}@test.com",
+        "profession": ProfessionsEnum.OTRO,
+        "position": JobPositionEnum.ENTRENADOR_CABALLOS,
+        "job_condition": JobConditionEnum.VOLUNTARIO,
+    }
+    values.update(fields)
+    return Employee(**values)
+
+
+@pytest.fixture
+def build_employee():
+    """Builder of employees with a unique DNI and email"""
+    return make_employee
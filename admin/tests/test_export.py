@@ -0,0 +1,63 @@
+import csv
+import io
+import zipfile
+from datetime import date
+from decimal import Decimal
+from xml.etree import ElementTree
+
+import pytest
+
+pytest.importorskip("xlsxwriter")
+
+from src.web.helpers.export import ROWS_PER_CHUNK, csv_stream, xlsx_stream  # noqa: E402
+
+HEADER = ["Apellido", "Nombre", "Fecha de cobro", "Monto", "Método de pago"]
+ROWS = [
+    ("Pérez", "=HYPERLINK(\"http://x\")", date(2024, 3, 1), Decimal("-12.50"), None),
+    ("Gómez", "@SUM(A1)", date(2024, 3, 2), 3, "+54 221"),
+]
+SHEET = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def test_csv_stream_writes_a_readable_file():
+    """Test the CSV starts with a byte order mark and formats dates and empty values"""
+    content = b"".join(csv_stream(HEADER, iter(ROWS))).decode("utf-8")
+
+    assert content.startswith("﻿")
+    rows = list(csv.reader(io.StringIO(content[1:])))
+    assert rows[0] == HEADER
+    assert rows[1][0] == "Pérez"
+    assert rows[1][2:] == ["2024-03-01", "-12.50", ""]
+
+
+def test_csv_stream_escapes_formulas():
+    """Test text cells starting like a formula are prefixed with an apostrophe, numbers are not"""
+    rows = list(csv.reader(io.StringIO(b"".join(csv_stream(HEADER, iter(ROWS))).decode("utf-8")[1:])))
+
+    assert rows[1][1] == "'=HYPERLINK(\"http://x\")"
+    assert rows[2][1] == "'@SUM(A1)"
+    assert rows[2][4] == "'+54 221"
+    assert rows[1][3] == "-12.50"
+
+
+def test_csv_stream_yields_in_chunks():
+    """Test the CSV is sent in chunks of ROWS_PER_CHUNK rows"""
+    rows = (("a", index) for index in range(ROWS_PER_CHUNK * 2 + 1))
+
+    assert len(list(csv_stream(["A", "B"], rows))) == 3
+
+
+def test_xlsx_stream_writes_typed_cells():
+    """Test the XLSX stores dates and numbers as values and never text as formulas"""
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(xlsx_stream(HEADER, iter(ROWS), "Cobros"))))
+    sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    cells = {cell.get("r"): cell for cell in sheet.iter(f"{SHEET}c")}
+
+    assert b"Cobros" in archive.read("xl/workbook.xml")
+    assert not list(sheet.iter(f"{SHEET}f"))
+    assert cells["B2"].get("t") == "inlineStr"
+    assert cells["B2"].find(f"{SHEET}is/{SHEET}t").text == "=HYPERLINK(\"http://x\")"
+    assert cells["C2"].get("t") is None and cells["C2"].get("s") is not None
+    assert cells["C2"].find(f"{SHEET}v").text == "45352"
+    assert float(cells["D2"].find(f"{SHEET}v").text) == -12.5
+    assert "E2" not in cells
@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+import src.web  # noqa: F401, the modules import each other in the order the app loads them
+from src.core.module.charges.models import Charge, PaymentMethodEnum
+from src.core.module.common.filters import Filter, FilterSpec, IN, RANGE
+
+
+def where_clause(spec: FilterSpec, values: dict) -> str:
+    """Render the WHERE clause a FilterSpec adds to a query of the charges"""
+    statement = spec.apply(Charge, select(Charge.id), values)
+    return str(statement.whereclause) if statement.whereclause is not None else ""
+
+
+def test_undeclared_and_empty_filters_are_ignored():
+    """Test only declared filters with a value become predicates"""
+    spec = FilterSpec({"payment_method": Filter(), "is_archived": Filter()})
+
+    assert where_clause(spec, {"amount": 10, "payment_method": None, "is_archived": ""}) == ""
+    assert where_clause(spec, {"payment_method": PaymentMethodEnum.CASH}) == "charges.payment_method = :payment_method_1"
+
+
+def test_values_are_coerced_to_the_column_type():
+    """Test the text sent by the forms is converted to dates and booleans"""
+    compiled = Charge.__filters__.compile(Charge)
+
+    start = compiled["start_date"]("2024-03-01")
+    archived = compiled["is_archived"]("true")
+
+    assert str(start) == "charges.date_of_charge >= :date_of_charge_1"
+    assert start.compile().params == {"date_of_charge_1": date(2024, 3, 1)}
+    assert str(archived) == "charges.is_archived = true"
+
+
+def test_list_operators():
+    """Test EQ with a list and IN filter by membership, and RANGE includes both ends"""
+    spec = FilterSpec({
+        "payment_method": Filter(),
+        "methods": Filter("payment_method", IN),
+        "between": Filter("date_of_charge", RANGE),
+    })
+    compiled = spec.compile(Charge)
+
+    assert "IN" in str(compiled["payment_method"]([PaymentMethodEnum.CASH, PaymentMethodEnum.CHECK]))
+    assert "IN" in str(compiled["methods"]([PaymentMethodEnum.CASH]))
+    between = compiled["between"](("2024-01-01", "2024-01-31"))
+    assert "BETWEEN" in str(between)
+    assert sorted(between.compile().params.values()) == [date(2024, 1, 1), date(2024, 1, 31)]
+
+
+def test_compiled_filters_are_cached_per_model():
+    """Test the filters of a model are compiled once"""
+    spec = FilterSpec({"is_archived": Filter()})
+
+    assert spec.compile(Charge) is spec.compile(Charge)
+
+
+def test_unknown_column_or_operator_raises():
+    """Test filters naming a missing column or operator are rejected when compiled"""
+    with pytest.raises(ValueError):
+        FilterSpec({"missing": Filter()}).compile(Charge)
+    with pytest.raises(ValueError):
+        FilterSpec({"amount": Filter(operator="like")}).compile(Charge)
+
+
+def test_indexes_are_built_once_per_column():
+    """Test the index hints of filters on the same column build a single index"""
+    spec = FilterSpec({
+        "start_date": Filter("date_of_charge", index=True),
+        "finish_date": Filter("date_of_charge", index=True),
+        "is_archived": Filter(),
+    })
+
+    assert [index.name for index in spec.indexes("charges")] == ["ix_charges_date_of_charge"]
@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+
+import src.web  # noqa: F401, the modules import each other in the order the app loads them
+from src.core.module.report.models import PERIOD_MONTH, PERIOD_WEEK
+from src.core.module.report.repositories import _next_period, _period_start, count_periods
+
+
+@pytest.mark.parametrize("period, day, start", [
+    (PERIOD_MONTH, date(2024, 3, 15), date(2024, 3, 1)),
+    (PERIOD_MONTH, date(2024, 3, 1), date(2024, 3, 1)),
+    (PERIOD_WEEK, date(2024, 3, 15), date(2024, 3, 11)),
+    (PERIOD_WEEK, date(2024, 3, 11), date(2024, 3, 11)),
+    (PERIOD_WEEK, date(2024, 1, 3), date(2024, 1, 1)),
+    (PERIOD_WEEK, date(2023, 1, 1), date(2022, 12, 26)),
+])
+def test_period_start(period, day, start):
+    """Test a day belongs to the month of its first day and to the week of its Monday"""
+    assert _period_start(period, day) == start
+
+
+@pytest.mark.parametrize("period, start, following", [
+    (PERIOD_MONTH, date(2024, 1, 1), date(2024, 2, 1)),
+    (PERIOD_MONTH, date(2024, 12, 1), date(2025, 1, 1)),
+    (PERIOD_WEEK, date(2024, 2, 26), date(2024, 3, 4)),
+    (PERIOD_WEEK, date(2024, 12, 30), date(2025, 1, 6)),
+])
+def test_next_period(period, start, following):
+    """Test the next period starts right after the current one, across months and years"""
+    assert _next_period(period, start) == following
+
+
+@pytest.mark.parametrize("period, start, end, periods", [
+    (PERIOD_MONTH, date(2024, 3, 15), date(2024, 3, 20), 1),
+    (PERIOD_MONTH, date(2024, 1, 31), date(2024, 2, 1), 2),
+    (PERIOD_MONTH, date(2023, 11, 1), date(2025, 2, 28), 16),
+    (PERIOD_WEEK, date(2024, 3, 15), date(2024, 3, 17), 1),
+    (PERIOD_WEEK, date(2024, 3, 17), date(2024, 3, 18), 2),
+    (PERIOD_WEEK, date(2024, 1, 1), date(2024, 12, 31), 53),
+    (PERIOD_MONTH, date(2024, 3, 1), date(2024, 2, 1), 0),
+])
+def test_count_periods(period, start, end, periods):
+    """Test the periods of a range include the ones of its first and last days"""
+    assert count_periods(period, start, end) == periods
+
+
+@pytest.mark.parametrize("period", [PERIOD_MONTH, PERIOD_WEEK])
+def test_count_periods_matches_the_series(period):
+    """Test count_periods counts the periods the series walks with _next_period"""
+    start, end = date(2023, 5, 17), date(2024, 8, 2)
+    current, walked = _period_start(period, start), 0
+    while current <= end:
+        walked += 1
+        current = _next_period(period, current)
+
+    assert count_periods(period, start, end) == walked
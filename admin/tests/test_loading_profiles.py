@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.web import create_app
+from src.core.database import db
+from src.core.module.common import PROFILE_DETAIL
+from src.core.module.employee.models import Employee, EmployeeFile
+from src.core.module.employee.repositories import EmployeeRepository
+from src.core.module.equestrian.models import Horse, HorseFile, HorseTrainers, JAEnum
+from src.core.module.equestrian.repositories import EquestrianRepository
+from src.core.module.jockey_amazon.data import (
+    DayEnum,
+    EducationLevelEnum,
+    SedeEnum,
+    WorkConditionEnum,
+    WorkProposalEnum,
+)
+from src.core.module.jockey_amazon.models import (
+    FamilyMember,
+    JockeyAmazon,
+    JockeyAmazonFile,
+    SchoolInstitution,
+    WorkAssignment,
+)
+from src.core.module.jockey_amazon.repositories import JockeyAmazonRepository
+
+app = create_app()
+app.testing = True
+
+
+@contextmanager
+def count_statements():
+    """Collect the SQL statements sent to the database inside the block"""
+    statements = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def employee_with_documents(build_employee, documents: int) -> Employee:
+    """Build an employee with the given number of documents"""
+    employee = build_employee(lastname="Profile")
+    employee.files = [EmployeeFile(title=f"doc {index}", path=employee.dni) for index in range(documents)]
+    return employee
+
+
+def build_horse() -> Horse:
+    """Build a horse"""
+    return Horse(
+        name="Test",
+        birth_date=date(2015, 1, 1),
+        sex="M",
+        breed="Criollo",
+        coat="Zaino",
+        admission_date=date(2020, 1, 1),
+        assigned_facility="CEDICA",
+        ja_type=JAEnum.HIPOTHERAPY,
+    )
+
+
+def horse_detail_statements(build_employee, related_rows: int) -> int:
+    """Count the statements that read the detail of a horse with related_rows trainers and documents"""
+    horse = build_horse()
+    horse.files = [HorseFile(title=f"doc {index}", path="test") for index in range(related_rows)]
+    horse.trainers = [
+        HorseTrainers(employee=employee_with_documents(build_employee, related_rows)) for _ in range(related_rows)
+    ]
+    db.session.add(horse)
+    db.session.flush()
+    horse_id = horse.id
+    db.session.expunge_all()
+
+    with count_statements() as statements:
+        EquestrianRepository().get_by_id(horse_id, documents=True)
+    return len(statements)
+
+
+def employee_detail_statements(build_employee, related_rows: int) -> int:
+    """Count the statements that read the detail of an employee with related_rows documents"""
+    employee = employee_with_documents(build_employee, related_rows)
+    db.session.add(employee)
+    db.session.flush()
+    employee_id = employee.id
+    db.session.expunge_all()
+
+    with count_statements() as statements:
+        EmployeeRepository(storage_services=None).get_employee(employee_id, documents=True)
+    return len(statements)
+
+
+def jockey_detail_statements(build_employee, related_rows: int) -> int:
+    """Count the statements that read the detail page of a jockey or amazon
+
+    The jockey has related_rows family members and documents, and an assignment
+    whose staff are employees with related_rows documents each.
+    """
+    jockey = JockeyAmazon(
+        first_name="Test",
+        last_name="Profile",
+        dni=str(int(uuid4().hex, 16))[:10],
+        birth_date=date(2012, 1, 1),
+        birthplace="La Plata",
+    )
+    jockey.school_institution = SchoolInstitution(
+        name="Escuela",
+        street="Calle 1",
+        number=100,
+        locality="La Plata",
+        province="Buenos Aires",
+        phone_country_code="54",
+        phone_area_code="221",
+        phone_number="4000000",
+    )
+    jockey.family_members = [
+        FamilyMember(
+            relationship="Madre",
+            first_name="Test",
+            last_name=f"Member {index}",
+            dni=str(int(uuid4().hex, 16))[:10],
+        street="Calle 1",
+        number=100,
+        locality="La Plata",
+        province="Buenos Aires",
+        phone_country_code="54",
+        phone_area_code="221",
+        phone_number="4000000",
+            email=f"member{index}@test.com",
+            education_level=EducationLevelEnum.SECONDARY,
+            occupation="Docente",
+        )
+        for index in range(related_rows)
+    ]
+    jockey.work_assignment = WorkAssignment(
+        proposal=WorkProposalEnum.HIPOTHERAPY,
+        condition=WorkConditionEnum.REGULAR,
+        sede=SedeEnum.CASJ,
+        days=[DayEnum.MONDAY],
+        horse=build_horse(),
+        professor_or_therapist=employee_with_documents(build_employee, related_rows),
+        conductor=employee_with_documents(build_employee, related_rows),
+        track_assistant=employee_with_documents(build_employee, related_rows),
+    )
+    jockey.files = [JockeyAmazonFile(title=f"doc {index}", path="test") for index in range(related_rows)]
+    db.session.add(jockey)
+    db.session.flush()
+    jockey_id = jockey.id
+    db.session.expunge_all()
+
+    with count_statements() as statements:
+        jockey = JockeyAmazonRepository().get_by_id(jockey_id, profile=PROFILE_DETAIL)
+        assignment = jockey.work_assignment
+        # The relationships the detail page reads, none of them should be loaded lazily
+        related = [
+            jockey.school_institution,
+            assignment.horse,
+            assignment.professor_or_therapist,
+            assignment.conductor,
+            assignment.track_assistant,
+            *jockey.family_members,
+            *jockey.files,
+        ]
+    assert all(related) and len(related) == 5 + 2 * related_rows
+    return len(statements)
+
+
+@pytest.mark.parametrize(
+    "statements_of", [jockey_detail_statements, horse_detail_statements, employee_detail_statements]
+)
+def test_detail_statements_do_not_grow_with_related_rows(statements_of, build_employee):
+    """Test detail loaders run the same number of statements whatever the number of related rows"""
+    with app.app_context():
+        if db.engine.dialect.name != "postgresql":
+            pytest.skip("The models use PostgreSQL only column types")
+        try:
+            assert statements_of(build_employee, 1) == statements_of(build_employee, 5)
+        finally:
+            db.session.rollback()
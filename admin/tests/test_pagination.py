@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, delete, update
+from sqlalchemy.orm import Session, declarative_base
+
+import src.web  # noqa: F401, the modules import each other in the order the app loads them
+from src.core.module.common.cache import count_cache
+
+Base = declarative_base()
+
+
+class Item(Base):
+    """A table whose list counts are cached"""
+
+    __tablename__ = "cached_count_items"
+
+    id = Column(Integer, primary_key=True)
+    status = Column(String(20))
+
+
+@pytest.fixture
+def session():
+    """Open a session on an in-memory database with two items and a cached count of their table"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Item(status="new"), Item(status="new")])
+        session.commit()
+        count_cache.set(("cached_count_items", "all"), 2, 60)
+        count_cache.set(("other_table", "all"), 5, 60)
+        yield session
+    count_cache.invalidate()
+
+
+@pytest.mark.parametrize("write", [
+    lambda session: session.query(Item).filter_by(status="new").update({"status": "read"}),
+    lambda session: session.query(Item).filter_by(id=1).delete(),
+    lambda session: session.execute(update(Item).values(status="read")),
+    lambda session: session.execute(delete(Item).where(Item.id == 1)),
+])
+def test_bulk_writes_drop_the_cached_counts_of_their_table(session, write):
+    """Test bulk updates and deletes, which never reach a flush, drop the cached counts of the table they write"""
+    write(session)
+
+    assert count_cache.get(("cached_count_items", "all")) is None
+    assert count_cache.get(("other_table", "all")) == 5
+
+
+def test_flushed_writes_drop_the_cached_counts_of_their_table(session):
+    """Test a flush that writes a row drops the cached counts of its table"""
+    session.add(Item(status="new"))
+    session.flush()
+
+    assert count_cache.get(("cached_count_items", "all")) is None
+    assert count_cache.get(("other_table", "all")) == 5
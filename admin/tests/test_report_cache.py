@@ -0,0 +1,34 @@
+from src.web import create_app
+from src.core.module.report.cache import cached_report, report_cache
+
+app = create_app()
+app.testing = True
+
+
+class Reports:
+    """A report repository that records the calls that reach it"""
+
+    def __init__(self):
+        self.calls = []
+
+    @cached_report
+    def series(self, period: str, start: int, end: int, group_by: str = "total"):
+        self.calls.append((period, start, end, group_by))
+        return [period, group_by]
+
+
+def test_calls_with_the_same_arguments_share_the_cached_result():
+    """Test positional, keyword and defaulted arguments are bound before building the cache key"""
+    app.config["REPORT_CACHE_TTL"] = 60
+    reports = Reports()
+    with app.app_context():
+        try:
+            assert reports.series("month", 1, 2) == ["month", "total"]
+            assert reports.series("month", 1, 2, "total") == ["month", "total"]
+            assert reports.series("month", 1, 2, group_by="total") == ["month", "total"]
+            assert reports.series(period="month", start=1, end=2) == ["month", "total"]
+            assert reports.series("month", 1, 2, group_by="sede") == ["month", "sede"]
+        finally:
+            report_cache.invalidate()
+
+    assert reports.calls == [("month", 1, 2, "total"), ("month", 1, 2, "sede")]
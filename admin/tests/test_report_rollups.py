@@ -0,0 +1,86 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.web import create_app
+from src.core.database import db
+from src.core.module.charges.models import Charge, PaymentMethodEnum
+from src.core.module.charges.repositories import ChargeRepository
+from src.core.module.jockey_amazon.data import DisabilityTypeEnum
+from src.core.module.jockey_amazon.models import JockeyAmazon
+from src.core.module.jockey_amazon.repositories import JockeyAmazonRepository
+from src.core.module.report.rollups import rebuild
+
+app = create_app()
+app.testing = True
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Run the test in a transaction that is rolled back, with repositories flushing instead of committing"""
+    with app.app_context():
+        if db.engine.dialect.name != "postgresql":
+            pytest.skip("The rollups are written with PostgreSQL upserts")
+        monkeypatch.setattr(ChargeRepository, "save", lambda self: db.session.flush())
+        monkeypatch.setattr(JockeyAmazonRepository, "save", lambda self: db.session.flush())
+        try:
+            rebuild(db.session)
+            yield db.session
+        finally:
+            db.session.rollback()
+
+
+def build_jockey() -> JockeyAmazon:
+    """Build a jockey or amazon with a motor disability"""
+    return JockeyAmazon(
+        first_name="Test",
+        last_name="Rollup",
+        dni=str(int(uuid4().hex, 16))[:10],
+        birth_date=date(2010, 1, 1),
+        birthplace="La Plata",
+        has_disability=True,
+        disability_type=DisabilityTypeEnum.MOTOR,
+    )
+
+
+def test_rebuild_finds_no_stale_rows_after_a_rebuild(session):
+    """Test a second rebuild reports the rollups it just wrote as up to date"""
+    assert rebuild(session) == 0
+
+
+def test_charge_writes_keep_the_rollups_up_to_date(session, build_employee):
+    """Test adding, updating and deleting a charge moves its amount in the rollups"""
+    jockey, employee = build_jockey(), build_employee(lastname="Rollup")
+    session.add_all([jockey, employee])
+    session.flush()
+    repository = ChargeRepository()
+
+    charge = Charge(
+        date_of_charge=date(2024, 3, 15),
+        amount=1500.5,
+        payment_method=PaymentMethodEnum.CASH,
+        employee_id=employee.id,
+        jya_id=jockey.id,
+    )
+    repository.add_charge(charge)
+    assert rebuild(session) == 0
+
+    repository.update_charge(
+        charge.id,
+        {"amount": 320.25, "date_of_charge": date(2024, 4, 2), "payment_method": PaymentMethodEnum.CHECK},
+    )
+    assert rebuild(session) == 0
+
+    repository.delete_charge(charge.id)
+    assert rebuild(session) == 0
+
+
+def test_jockey_writes_keep_the_rollups_up_to_date(session):
+    """Test adding and updating a jockey or amazon moves its contributions to the report counters"""
+    repository = JockeyAmazonRepository()
+    jockey = repository.add(build_jockey())
+    assert rebuild(session) == 0
+
+    repository.update(jockey.id, {"disability_type": DisabilityTypeEnum.SENSORY})
+    assert rebuild(session) == 0